@@ -0,0 +1,6 @@
+# Asgard King Ood (เกม platformer ด้วย pygame)
+# import แล้วยังไม่เปิดจอ/เสียง/ฟอนต์ ดู settings.py, รันเกม: python -m asgard
+import time
+
+# เวลาที่เริ่ม import package (ใช้วัด cold start ดู --startup-check)
+IMPORT_STARTED = time.perf_counter()
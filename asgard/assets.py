@@ -0,0 +1,393 @@
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+import pygame
+
+from .settings import DISPLAY
+
+# --- CLASS: AssetCache (แคชภาพ/เสียงที่ใช้ร่วมกันทั้งเกม) ---
+ASSET_CACHE_BUDGET = 64 * 1024 * 1024  # byte
+
+class AssetCache:
+    def __init__(self, budget=ASSET_CACHE_BUDGET):
+        self.budget = budget
+        self.entries = OrderedDict()  # key -> (asset, size) เรียงจากใช้ล่าสุดน้อยสุดไปมากสุด
+        self.bytes_held = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.on_evict = []  # เรียก fn(asset) ทุกครั้งที่ของหลุดออกจากแคช (ของที่สร้างต่อจาก asset จะได้ทิ้งตาม)
+        self.lock = threading.RLock()  # LevelPrefetcher โหลดด่านจาก thread อื่น
+
+    def get(self, key, loader):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                self.entries.move_to_end(key)
+                return entry[0]
+
+            self.misses += 1
+            asset = loader()
+            size = self.size_of(asset)
+            self.entries[key] = (asset, size)
+            self.bytes_held += size
+            self.evict()
+            return asset
+
+    def size_of(self, asset):
+        if asset is None:
+            return 0
+        if isinstance(asset, pygame.Surface):
+            return asset.get_width() * asset.get_height() * asset.get_bytesize()
+        mixer_info = pygame.mixer.get_init()
+        if mixer_info:
+            freq, fmt, channels = mixer_info
+            return int(asset.get_length() * freq * channels * (abs(fmt) // 8))
+        return 0
+
+    def evict(self):
+        # ตัดของที่ไม่ได้ใช้นานที่สุดออกจนกว่าจะอยู่ในงบหน่วยความจำ (ตัวล่าสุดเก็บไว้เสมอ)
+        while self.bytes_held > self.budget and len(self.entries) > 1:
+            _, (asset, size) = self.entries.popitem(last=False)
+            self.bytes_held -= size
+            self.evictions += 1
+            self.forget(asset)
+
+    def forget(self, asset):
+        for fn in self.on_evict:
+            fn(asset)
+
+    def set_budget(self, budget):
+        with self.lock:
+            self.budget = budget
+            self.evict()
+
+    def clear(self):
+        with self.lock:
+            for asset, _ in self.entries.values():
+                self.forget(asset)
+            self.entries.clear()
+            self.bytes_held = 0
+
+    def stats(self):
+        return {
+            'entries': len(self.entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'bytes': self.bytes_held,
+            'budget': self.budget,
+        }
+
+ASSETS = AssetCache()
+
+# --- CLASS: BakedAssets (ภาพที่ตัด/ย่อไว้ล่วงหน้าด้วย python -m asgard.bake) ---
+# ทุก variant รวมอยู่ใน sheet.png ภาพเดียว (decode ครั้งเดียว แต่ละตัวเป็น subsurface ของ sheet)
+# manifest.json: ชื่อ variant -> rect ใน sheet + sha256 ของไฟล์ต้นฉบับ
+# ต้นฉบับเปลี่ยน (เนื้อไฟล์ต่าง) หรือไม่มี variant นั้น = ทำตอนรันเหมือนเดิมแล้ว print เตือนให้ bake ใหม่
+# แก้วิธีตัด/ย่อ/เก็บเมื่อไหร่ให้เพิ่ม BAKE_VERSION
+BAKE_VERSION = 2
+BAKE_DIR = os.path.join('.cache', 'baked')
+BAKE_SHEET = 'sheet.png'
+BAKE_SHEET_WIDTH = 512  # ความกว้างแถวของ sheet (ภาพที่กว้างกว่านี้ sheet จะกว้างตาม)
+
+class BakedAssets:
+    def __init__(self, bake_dir=BAKE_DIR, version=BAKE_VERSION):
+        self.bake_dir = bake_dir
+        self.version = version
+        self.entries = None      # อ่าน manifest ตอนขอครั้งแรก
+        self.sheet = None        # sheet.png (โหลดตอนใช้ variant แรก)
+        self.hashes = {}         # path ต้นฉบับ -> sha256 (อ่านไฟล์ครั้งเดียวต่อ process)
+        self.pending = {}        # ตอน bake: ชื่อ variant -> (Surface, path ต้นฉบับ, sha256) รอ pack
+        self.warned = set()
+        self.enabled = True
+        self.recording = False   # True = ตัวที่ใช้ไม่ได้ให้ทำใหม่แล้วเก็บไว้ pack ลงดิสก์ (ตอน bake)
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.written = 0
+        self.lock = threading.RLock()
+
+    def manifest_path(self):
+        return os.path.join(self.bake_dir, 'manifest.json')
+
+    def source_hash(self, path):
+        digest = self.hashes.get(path)
+        if digest is None:
+            try:
+                with open(path, 'rb') as f:
+                    digest = hashlib.sha256(f.read()).hexdigest()
+            except OSError:
+                return None
+            self.hashes[path] = digest
+        return digest
+
+    def warn(self, key, message):
+        # เตือนครั้งเดียวต่อเรื่อง ไม่ให้ log ท่วมตอนสร้างด่าน
+        if key not in self.warned:
+            self.warned.add(key)
+            print(message)
+
+    def get(self, name, source, build):
+        # name = ชื่อ variant (ต้นฉบับ + วิธีตัด/ย่อ), build = ฟังก์ชันที่ทำภาพเองตอนรัน
+        if not self.enabled:
+            return build()
+        with self.lock:
+            if self.entries is None:
+                self.entries = self.load_manifest()
+            digest = self.source_hash(source)
+            entry = None if self.recording else self.entries.get(name)
+            if entry is not None and digest is not None:
+                if entry['source'] == digest:
+                    surf = self.load(entry)
+                    if surf is not None:
+                        self.hits += 1
+                        return surf
+                else:
+                    self.stale += 1
+                    self.warn(name, f"Baked image {name} is stale ({source} changed since the bake), "
+                                    f"building it at load time. Run: python -m asgard.bake")
+            elif entry is None and digest is not None and not self.recording:
+                if self.entries:
+                    self.warn(name, f"Baked image {name} is missing, building it at load time. "
+                                    f"Run: python -m asgard.bake")
+                else:
+                    self.warn(None, f"No asset bake in {self.bake_dir}, images are cropped/scaled at load time. "
+                                    f"Run: python -m asgard.bake")
+
+            self.misses += 1
+            surf = build()
+            if self.recording and digest is not None:
+                self.pending[name] = (surf, source, digest)
+            return surf
+
+    def load_manifest(self):
+        path = self.manifest_path()
+        if not os.path.exists(path): return {}
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != self.version:
+                self.warn(path, f"Bake manifest {path} is from an older bake format, ignoring it. "
+                                f"Run: python -m asgard.bake")
+                return {}
+            return data['entries']
+        except (OSError, ValueError, KeyError, TypeError):
+            print(f"Ignoring broken bake manifest: {path}")
+            return {}
+
+    def load_sheet(self):
+        if self.sheet is None:
+            path = os.path.join(self.bake_dir, BAKE_SHEET)
+            DISPLAY.get()  # convert_alpha ต้องมีจอก่อน
+            try:
+                self.sheet = pygame.image.load(path).convert_alpha()
+            except (pygame.error, OSError):
+                self.warn(path, f"Cannot load bake sheet {path}, building images at load time. "
+                                f"Run: python -m asgard.bake")
+                self.sheet = False
+        return self.sheet or None
+
+    def load(self, entry):
+        sheet = self.load_sheet()
+        if sheet is None: return None
+        try:
+            surf = sheet.subsurface(entry['rect'])
+        except (ValueError, TypeError, KeyError):
+            return None
+        if entry.get('colorkey'):
+            surf.set_colorkey(entry['colorkey'])
+        return surf
+
+    def pack(self):
+        # ตอนจบ bake: เรียง variant ลง sheet แบบ shelf (สูงก่อน ซ้ายไปขวา เต็มแถวขึ้นแถวใหม่)
+        # เขียนไม่ได้ก็แค่ไม่ bake (ตอนรันจะทำเองเหมือนไม่มีไฟล์)
+        with self.lock:
+            items = sorted(self.pending.items(), key=lambda kv: (-kv[1][0].get_height(), kv[0]))
+            width = max([BAKE_SHEET_WIDTH] + [surf.get_width() for surf, _, _ in self.pending.values()])
+            x = y = row_h = 0
+            rects = {}
+            for name, (surf, _, _) in items:
+                w, h = surf.get_size()
+                if x + w > width:
+                    x, y, row_h = 0, y + row_h, 0
+                rects[name] = [x, y, w, h]
+                x += w
+                row_h = max(row_h, h)
+
+            sheet = pygame.Surface((width, max(1, y + row_h)), pygame.SRCALPHA)
+            sheet.fill((0, 0, 0, 0))
+            entries = {}
+            for name, (surf, source, digest) in items:
+                colorkey = surf.get_colorkey()
+                if colorkey:
+                    # เก็บพิกเซลจริง (รวมสี colorkey) แล้วตั้ง colorkey ให้ subsurface ตอนโหลด
+                    surf = surf.copy()
+                    surf.set_colorkey(None)
+                # พื้น sheet โปร่งใส ไม่มีภาพทับกัน -> BLEND_RGBA_MAX = copy พิกเซลตรงๆ รวม alpha
+                sheet.blit(surf, rects[name][:2], special_flags=pygame.BLEND_RGBA_MAX)
+                entries[name] = {
+                    'rect': rects[name],
+                    'source_path': source,
+                    'source': digest,
+                    'colorkey': list(colorkey) if colorkey else None,
+                }
+            try:
+                os.makedirs(self.bake_dir, exist_ok=True)
+                pygame.image.save(sheet, os.path.join(self.bake_dir, BAKE_SHEET))
+            except (pygame.error, OSError):
+                return
+            self.entries = entries
+            self.sheet = None
+            self.pending = {}
+            self.written = len(entries)
+            self.write_manifest()
+
+    def write_manifest(self):
+        path = self.manifest_path()
+        try:
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.version, 'sheet': BAKE_SHEET, 'entries': self.entries},
+                          f, indent=1, sort_keys=True)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def clear(self):
+        # ลบของที่ bake ไว้ทั้งหมด (ก่อน bake ใหม่ ไม่ให้มีไฟล์ที่ไม่มีใครใช้ค้าง)
+        with self.lock:
+            self.entries = {}
+            self.sheet = None
+            self.hashes = {}
+            self.pending = {}
+            self.warned = set()
+            if os.path.isdir(self.bake_dir):
+                for file_name in os.listdir(self.bake_dir):
+                    if file_name.endswith('.png') or file_name == 'manifest.json':
+                        try:
+                            os.remove(os.path.join(self.bake_dir, file_name))
+                        except OSError:
+                            pass
+
+    def stats(self):
+        return {
+            'entries': len(self.entries or {}),
+            'hits': self.hits,
+            'misses': self.misses,
+            'stale': self.stale,
+            'written': self.written,
+        }
+
+BAKED = BakedAssets()
+
+# --- Helper: โหลดภาพ ---
+# ภาพที่คืนไปเป็นของที่ใช้ร่วมกัน ห้ามแก้ไขตรงๆ (ถ้าจะแก้ให้ .copy() ก่อน)
+def load_safe_image(path, fallback_color=(255, 0, 255), scale=None):
+    scale = tuple(scale) if scale else None
+    key = ('image', path, scale, tuple(fallback_color))
+    return ASSETS.get(key, lambda: _load_image(path, fallback_color, scale))
+
+def _load_image(path, fallback_color, scale):
+    if os.path.exists(path):
+        # ภาพที่ย่อ ลองเอาตัวที่ bake ไว้ก่อน (ไม่ต้อง decode ต้นฉบับเต็มขนาด)
+        if scale:
+            return BAKED.get(f"image:{path}:{scale[0]}x{scale[1]}", path,
+                             lambda: _decode_image(path, fallback_color, scale))
+        return _decode_image(path, fallback_color, scale)
+    return _fallback_image(fallback_color, scale)
+
+def _decode_image(path, fallback_color, scale):
+    DISPLAY.get()  # convert_alpha ต้องมีจอก่อน
+    try:
+        img = pygame.image.load(path).convert_alpha()
+        if scale:
+            img = pygame.transform.scale(img, scale)
+        return img
+    except:
+        return _fallback_image(fallback_color, scale)
+
+def _fallback_image(fallback_color, scale):
+    w, h = scale if scale else (32, 32)
+    surf = pygame.Surface((w, h), pygame.SRCALPHA)
+    surf.fill(fallback_color)
+    return surf
+
+# --- Helper: โหลดเสียง (SFX) ---
+def load_safe_sound(path):
+    # mixer ยังไม่เปิด = ยังโหลดไม่ได้ ห้ามเก็บ None ลงแคช ไม่งั้นเปิด mixer ทีหลังแล้วก็ยังเงียบ
+    if not pygame.mixer.get_init():
+        return None
+    return ASSETS.get(('sound', path), lambda: _load_sound(path))
+
+def _load_sound(path):
+    if os.path.exists(path):
+        try:
+            return pygame.mixer.Sound(path)
+        except:
+            print(f"Error loading sound: {path}")
+            return None
+    return None
+
+# --- CLASS: FrameAtlas (ตัด/ย่อ/กลับด้านเฟรมครั้งเดียว แล้วใช้ร่วมกันทุก Animation) ---
+class FrameAtlas:
+    def __init__(self):
+        self.frame_sets = {}
+        self.lock = threading.RLock()
+
+    def get_frames(self, img, frame_size, frame_count, scale_to=None, flipped=False):
+        scale_to = tuple(scale_to) if scale_to else None
+        key = (img, tuple(frame_size), frame_count, scale_to, flipped)
+        frames = self.frame_sets.get(key)
+        if frames is None:
+            with self.lock:
+                frames = self.frame_sets.get(key)
+                if frames is None:
+                    if flipped:
+                        frames = tuple(pygame.transform.flip(f, True, False)
+                                       for f in self.get_frames(img, frame_size, frame_count, scale_to))
+                    else:
+                        frames = tuple(self.slice_frames(img, frame_size, frame_count, scale_to))
+                    self.frame_sets[key] = frames
+        return frames
+
+    @staticmethod
+    def slice_frames(img, frame_size, frame_count, scale_to):
+        frames = []
+        sheet_w, sheet_h = img.get_size()
+        frame_w, frame_h = frame_size
+
+        if sheet_w < frame_w or sheet_h < frame_h:
+            if scale_to:
+                img = pygame.transform.scale(img, scale_to)
+            frames.append(img)
+        else:
+            for i in range(frame_count):
+                if i * frame_w < sheet_w:
+                    rect = pygame.Rect(i * frame_w, 0, frame_w, frame_h)
+                    try:
+                        frame = img.subsurface(rect)
+                        if scale_to:
+                            frame = pygame.transform.scale(frame, scale_to)
+                        frames.append(frame)
+                    except: pass
+        
+        if not frames:
+            if scale_to: img = pygame.transform.scale(img, scale_to)
+            frames.append(img)
+        return frames
+
+    def forget(self, img):
+        # ภาพต้นฉบับหลุดจาก AssetCache แล้ว ทิ้งเฟรมที่ตัดจากมันด้วย ไม่งั้นโหลดใหม่ทีไรก็ได้ชุดเฟรมซ้ำค้างไว้เรื่อยๆ
+        with self.lock:
+            for key in [k for k in self.frame_sets if k[0] is img]:
+                del self.frame_sets[key]
+
+    def clear(self):
+        self.frame_sets.clear()
+
+FRAMES = FrameAtlas()
+ASSETS.on_evict.append(FRAMES.forget)
@@ -0,0 +1,145 @@
+import os
+import time
+import pygame
+
+from .settings import HEADLESS
+from .assets import load_safe_sound
+
+# --- CLASS: AudioManager (เสียงทั้งเกมผ่านที่เดียว) ---
+# - โหลดเสียงแต่ละไฟล์ครั้งเดียว ตั้งความดังที่ Channel ตอนเล่น (ไม่ไปแก้ Sound ที่ใช้ร่วมกัน)
+# - มี Channel จำกัด AUDIO_CHANNELS ช่อง: ช่องเต็ม = แย่งช่องที่ priority ต่ำสุด/เล่นมานานสุด ถ้าไม่มีให้แย่งก็ไม่เล่น
+# - เสียงเดียวกันเล่นซ้อนได้ไม่เกิน max_voices (หมูตายพร้อมกัน 8 ตัวไม่กินทุกช่อง)
+# - เพลง: จำว่าเล่นอะไรอยู่ เช็คไฟล์บนดิสก์ครั้งเดียวต่อ path
+# - เปิด mixer + โหลดเสียงทั้งชุดตอนจะเล่นเสียงแรก (import แล้วยังไม่แตะ mixer)
+AUDIO_CHANNELS = 8
+MUSIC_PATH = 'assets/sounds/bgm.mp3'
+MUSIC_VOLUME = 0.3  # 0.0 - 1.0 (0.3 ถือว่าเบาๆ พอดี)
+
+# ชื่อ: (ไฟล์, bus, ความดัง, priority (มาก = สำคัญ), เล่นซ้อนกันได้สูงสุด)
+SOUND_BANK = {
+    'coin': ('assets/sounds/coin.wav', 'sfx', 1.0, 2, 3),
+    'door_open': ('assets/sounds/door_open.wav', 'sfx', 0.5, 3, 1),
+    'swing': ('assets/sounds/player/swing.wav', 'player', 1.0, 2, 2),
+    'jump': ('assets/sounds/player/jump.wav', 'player', 0.4, 2, 1),
+    'hit': ('assets/sounds/player/hit.wav', 'player', 1.0, 3, 2),
+    'enemy_death': ('assets/sounds/enemy/death.wav', 'enemy', 0.4, 1, 3),
+}
+
+# ความดังแยกหมวด (คูณกับ master อีกที)
+VOLUME_BUSES = {'master': 1.0, 'music': 1.0, 'sfx': 1.0, 'player': 1.0, 'enemy': 1.0}
+
+class AudioManager:
+    def __init__(self, bank=SOUND_BANK, num_channels=AUDIO_CHANNELS):
+        self.bank = bank
+        self.num_channels = num_channels
+        self.buses = dict(VOLUME_BUSES)
+        self.sounds = {}
+        self.channels = []
+        self.voices = []          # ต่อ channel: (ชื่อเสียง, priority, เวลาที่เริ่ม) หรือ None
+        self.music_path = None    # เพลงที่สั่งเล่นอยู่ (None = หยุด)
+        self.music_found = {}     # path -> มีไฟล์ไหม
+        self.ready = False
+        self.enabled = False
+        self.stolen = 0
+        self.dropped = 0
+
+    def init(self):
+        # headless ไม่เปิด mixer = เงียบทั้งหมด
+        self.ready = True
+        if not HEADLESS and not pygame.mixer.get_init():
+            try:
+                pygame.mixer.init()
+            except pygame.error as e:
+                print(f"Audio disabled: {e}")
+        self.enabled = bool(pygame.mixer.get_init())
+        if not self.enabled: return
+        pygame.mixer.set_num_channels(self.num_channels)
+        self.channels = [pygame.mixer.Channel(i) for i in range(self.num_channels)]
+        self.voices = [None] * self.num_channels
+        for name, (path, *_) in self.bank.items():
+            self.sounds[name] = load_safe_sound(path)
+
+    def disable(self):
+        # เงียบถาวรโดยไม่เปิด mixer เลย (เช่น AsgardEnv ที่รันหลายตัวพร้อมกัน)
+        self.ready = True
+        self.enabled = False
+
+    def channel_volume(self, name):
+        _, bus, volume, _, _ = self.bank[name]
+        return volume * self.buses[bus] * self.buses['master']
+
+    def play(self, name):
+        if not self.ready: self.init()
+        if not self.enabled: return None
+        sound = self.sounds.get(name)
+        if sound is None: return None
+        priority, max_voices = self.bank[name][3], self.bank[name][4]
+
+        free = victim = oldest_same = None
+        same = 0
+        for i, ch in enumerate(self.channels):
+            voice = self.voices[i]
+            if voice is None or not ch.get_busy():
+                if free is None: free = i
+                continue
+            if voice[0] == name:
+                same += 1
+                if oldest_same is None or voice[2] < self.voices[oldest_same][2]: oldest_same = i
+            if voice[1] <= priority and (victim is None or voice[1:] < self.voices[victim][1:]):
+                victim = i
+
+        if same >= max_voices:
+            target = oldest_same
+            self.stolen += 1
+        elif free is not None:
+            target = free
+        elif victim is not None:
+            target = victim
+            self.stolen += 1
+        else:
+            self.dropped += 1
+            return None
+
+        ch = self.channels[target]
+        ch.set_volume(self.channel_volume(name))
+        ch.play(sound)
+        self.voices[target] = (name, priority, time.perf_counter())
+        return ch
+
+    def set_volume(self, bus, value):
+        self.buses[bus] = max(0.0, min(1.0, value))
+        if not self.enabled: return
+        pygame.mixer.music.set_volume(MUSIC_VOLUME * self.buses['music'] * self.buses['master'])
+        for ch, voice in zip(self.channels, self.voices):
+            if voice is not None and ch.get_busy():
+                ch.set_volume(self.channel_volume(voice[0]))
+
+    def music_exists(self, path):
+        found = self.music_found.get(path)
+        if found is None:
+            found = os.path.exists(path)
+            self.music_found[path] = found
+            if not found: print(f"Music file not found at: {path}")
+        return found
+
+    def play_music(self, path=MUSIC_PATH):
+        # เรียกได้ทุกเฟรม: ถ้าสั่งเพลงนี้ไปแล้ว (หรือรู้แล้วว่าไม่มีไฟล์) ไม่ต้องทำอะไร
+        if not self.ready: self.init()
+        if not self.enabled or self.music_path == path: return
+        self.music_path = path
+        if not self.music_exists(path): return
+        try:
+            pygame.mixer.music.load(path)
+            pygame.mixer.music.set_volume(MUSIC_VOLUME * self.buses['music'] * self.buses['master'])
+            # -1 คือให้วนซ้ำไปเรื่อยๆ
+            pygame.mixer.music.play(-1)
+            print("Background music started.")
+        except Exception as e:
+            print(f"Error loading music: {e}")
+
+    def stop_music(self):
+        if self.music_path is None: return
+        self.music_path = None
+        if self.enabled: pygame.mixer.music.stop()
+
+AUDIO = AudioManager()
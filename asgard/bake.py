@@ -0,0 +1,63 @@
+import os
+import time
+
+# ==========================================
+# Asset bake: ตัด/ย่อภาพไว้ล่วงหน้า รวมเป็น sheet เดียว ตอนรันเกมจะโหลดแค่ตัวที่เล็กแล้ว
+# (.cache/baked/sheet.png + manifest.json)
+#   python -m asgard.bake               -> bake ใหม่ทั้งหมด (ด่าน 1..MAX_LEVELS x 50 seed)
+#   python -m asgard.bake --seeds 200   -> ไล่ seed มากขึ้น (ได้ความสูงแพลตฟอร์ม/กำแพงครบกว่า)
+# variant ไหนไม่ได้ bake หรือภาพต้นฉบับเปลี่ยนทีหลัง เกมจะตัด/ย่อเองตอนรันเหมือนเดิม (แล้ว print เตือน)
+# ==========================================
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('ASGARD_HEADLESS', '1')
+
+from .settings import DISPLAY, MAX_LEVELS
+from .assets import ASSETS, BAKED, BAKE_SHEET
+from .entities import Coin
+from .level import generate_layout, instantiate_layout, level_width
+from .game import GameRenderer, get_arg
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BAKE_SEEDS = 50
+
+def bake(num_seeds=BAKE_SEEDS):
+    # สร้างทุกอย่างผ่านโค้ดเดียวกับตอนเล่น ตัวที่ผ่าน BAKED.get จะถูก pack ลง sheet ตอนจบ
+    # (ชื่อ variant จึงตรงกับที่เกมขอเสมอ) ของที่ซ้ำกันโดน ASSETS cache กันไว้ เขียนแค่ครั้งเดียว
+    DISPLAY.get()
+    BAKED.clear()
+    ASSETS.clear()
+    BAKED.recording = True
+    try:
+        for seed in range(num_seeds):
+            for lvl in range(1, MAX_LEVELS + 1):
+                # generate_layout ตรงๆ ไม่ผ่าน LayoutCache (ไม่ต้องเขียน layout เป็นพันไฟล์)
+                instantiate_layout(generate_layout(lvl, seed, level_width(lvl)))
+        Coin.load_images()
+        GameRenderer(DISPLAY.get())
+    finally:
+        BAKED.recording = False
+    BAKED.pack()
+
+def baked_bytes():
+    try:
+        return os.path.getsize(os.path.join(BAKED.bake_dir, BAKE_SHEET))
+    except OSError:
+        return 0
+
+def main():
+    os.chdir(ROOT)  # path ของ asset/cache เป็นแบบ relative กับ root ของ repo
+    num_seeds = int(get_arg('--seeds', BAKE_SEEDS))
+    t0 = time.perf_counter()
+    bake(num_seeds)
+    elapsed = time.perf_counter() - t0
+
+    sources = {entry['source_path'] for entry in BAKED.entries.values()}
+    print(f"Baked {len(BAKED.entries)} images from {len(sources)} sources into {BAKED.bake_dir}/{BAKE_SHEET} "
+          f"({baked_bytes() / 1024:.0f} KB) in {elapsed:.2f}s")
+    for name, entry in sorted(BAKED.entries.items()):
+        x, y, w, h = entry['rect']
+        print(f"  {name:<50} {w}x{h} at ({x}, {y})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+import os
+import sys
+import csv
+import json
+import math
+import time
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+# resource ไม่มีบน Windows (ใช้วัด RSS ตอน batch play เท่านั้น)
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from .settings import MAX_LEVELS, SIM_HZ, SIM_DT
+from .world import Inputs, NO_INPUT, World, idle_policy
+from .replay import Replay
+
+# --- CLASS: ScriptedPolicy (บอทเล่นเอง: ไต่แพลตฟอร์มไปหาประตู ฟันหมูที่เข้าใกล้) ---
+# ไม่ได้เก่งมาก แต่ตัดสินใจจาก World อย่างเดียว + rng ของตัวเอง -> seed เดิมเล่นเหมือนเดิมทุกครั้ง
+JUMP_REACH = 230   # ความสูงที่กระโดดขึ้นได้จริง (vel -20, gravity 0.8 ~ 250px)
+BOT_ATTACK_RANGE = 60
+
+class ScriptedPolicy:
+    def __init__(self, seed=0):
+        self.rng = random.Random(seed)
+        self.last_x = None
+        self.stuck = 0
+
+    def __call__(self, world):
+        if world.game_state == "MENU": return Inputs(start=True)
+        if world.game_state == "GAMEOVER": return Inputs(respawn=True)
+        if world.game_state != "PLAYING": return NO_INPUT
+
+        p = world.player.rect
+        door = world.door_obj.rect
+        if p.colliderect(door):
+            return Inputs(enter=True)
+
+        for e in world.enemies:
+            if not e.is_dying and abs(e.rect.centerx - p.centerx) < BOT_ATTACK_RANGE and abs(e.rect.centery - p.centery) < 40:
+                # หันหน้าเข้าหาหมูก่อน (attack ใช้ทิศที่หันอยู่)
+                facing_left = e.rect.centerx < p.centerx
+                if facing_left == world.player.flip:
+                    return Inputs(attack=True)
+                return Inputs(left=facing_left, right=not facing_left)
+
+        target_x, jump = door.centerx, False
+        if door.bottom < p.bottom - 20:
+            step = self.stepping_platform(world, p, door)
+            if step is not None:
+                target_x, jump = self.approach(world.player, step)
+
+        left = target_x < p.centerx - 4
+        right = target_x > p.centerx + 4
+        # กดเดินแต่ไม่ไปไหน (ติดกำแพง) -> กระโดด
+        self.stuck = self.stuck + 1 if (left or right) and self.last_x == p.x else 0
+        self.last_x = p.x
+        if self.stuck > 6 or self.rng.random() < 0.01: jump = True
+        return Inputs(left=left, right=right, jump=jump)
+
+    def stepping_platform(self, world, p, door):
+        # แพลตฟอร์มที่สูงกว่าเท้าแต่กระโดดถึง เลือกอันที่ใกล้ประตู (แนวนอน) และไม่ไกลตัวเกินไป
+        best, best_score = None, None
+        for obj in world.platforms + world.boxes:
+            r = obj.rect
+            if not (p.bottom - JUMP_REACH <= r.top < p.bottom - 10): continue
+            if r.top < door.bottom - 10: continue
+            score = abs(r.centerx - door.centerx) + abs(r.centerx - p.centerx) * 0.5
+            if best_score is None or score < best_score:
+                best, best_score = r, score
+        return best
+
+    def approach(self, player, r):
+        # ชนใต้แพลตฟอร์มไม่ได้: ต้องกระโดดจากระยะที่ตอนลอยถึงขอบ เท้าสูงพ้นขอบแล้ว และยังไม่ตกลงมา
+        # ค่า 20/0.8/5 = แรงกระโดด/gravity/ความเร็วเดินใน Player.move
+        p = player.rect
+        if not player.on_ground: return r.centerx, False
+        disc = math.sqrt(max(0.0, 400 - 1.6 * (p.bottom - r.top)))
+        lo = 5 * (20 - disc) / 0.8 + 6
+        hi = 5 * (20 + disc) / 0.8 - 20
+        from_left = p.centerx < r.centerx
+        gap = r.left - p.right if from_left else p.left - r.right
+        if gap < lo:
+            # ใกล้ไป (หรืออยู่ใต้มัน) -> ถอยออกไปตั้งหลัก
+            back = (lo + hi) / 2 + p.width / 2
+            return (r.left - back if from_left else r.right + back), False
+        return r.centerx, gap <= hi
+
+# --- เล่น replay แล้วต่อด้วย idle_policy เมื่อปุ่มหมด ---
+class ReplayPolicy:
+    def __init__(self, replay):
+        self.inputs = replay.inputs()
+
+    def __call__(self, world):
+        inp = next(self.inputs, None)
+        return inp if inp is not None else idle_policy(world)
+
+# --- Batch play: เล่นทั้งเกม (ด่าน 1-MAX_LEVELS) หลายพันรอบบน process pool แล้วสรุปผล ---
+BATCH_MAX_TICKS = 60 * SIM_HZ * 10   # 1 session เล่นได้ไม่เกิน 10 นาทีเวลาเกม
+
+def play_session(job):
+    session, seed, policy_name, replay_path, max_ticks, horde = job
+    if policy_name == 'replay':
+        replay = Replay.load(replay_path)
+        world = replay.new_world()
+        policy = ReplayPolicy(replay)
+    else:
+        world = World(seed, horde=horde)
+        policy = ScriptedPolicy(seed)
+
+    deaths = 0
+    door_times = []   # [ด่าน, วินาทีที่ใช้จนเข้าประตู]
+    level, level_start = world.cur_level, 0
+    ticks = 0
+    t0 = time.perf_counter()
+    while ticks < max_ticks and world.game_state != "END_DEMO":
+        state = world.game_state
+        world.step(policy(world))
+        ticks += 1
+        if world.game_state == "GAMEOVER" and state != "GAMEOVER":
+            deaths += 1
+        if world.cur_level == level + 1:
+            door_times.append([level, (ticks - level_start) * SIM_DT])
+        if world.cur_level != level or (state == "MENU" and world.game_state == "PLAYING"):
+            level, level_start = world.cur_level, ticks
+    elapsed = time.perf_counter() - t0
+
+    return {
+        'session': session,
+        'seed': world.seed,
+        'pid': os.getpid(),
+        'finished': world.game_state == "END_DEMO",
+        'level': min(world.cur_level, MAX_LEVELS),
+        'coins': world.score,
+        'deaths': deaths,
+        'ticks': ticks,
+        'ticks_per_sec': ticks / max(elapsed, 1e-9),
+        'time_to_door': door_times,
+        'maxrss_kb': max_rss_kb(),
+    }
+
+def max_rss_kb():
+    # ru_maxrss: Linux = KB, macOS = byte (Windows ไม่มี resource)
+    if resource is None: return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == 'darwin' else rss
+
+def run_batch(sessions, workers=None, replay_path=None, max_ticks=BATCH_MAX_TICKS, horde=0, base_seed=0):
+    # มี replay_path = ทุก session เล่นตาม replay นั้น, ไม่มี = ScriptedPolicy คนละ seed
+    policy = 'replay' if replay_path else 'scripted'
+    jobs = [(i, base_seed + i, policy, replay_path, max_ticks, horde) for i in range(sessions)]
+    t0 = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(play_session, jobs, chunksize=max(1, min(16, sessions // 64))))
+    return results, time.perf_counter() - t0
+
+def batch_report(results, elapsed):
+    n = len(results)
+    total_ticks = sum(r['ticks'] for r in results)
+    per_level = [[] for _ in range(MAX_LEVELS)]
+    for r in results:
+        for lvl, t in r['time_to_door']:
+            per_level[lvl - 1].append(t)
+    workers = {}
+    for r in results:
+        if r['maxrss_kb'] is not None:
+            workers[r['pid']] = max(workers.get(r['pid'], 0), r['maxrss_kb'])
+    mean = lambda xs: sum(xs) / len(xs) if xs else None
+    return {
+        'sessions': n,
+        'finished': sum(1 for r in results if r['finished']),
+        'wall_sec': elapsed,
+        'total_ticks': total_ticks,
+        'ticks_per_sec': total_ticks / max(elapsed, 1e-9),
+        'session_ticks_per_sec': mean([r['ticks_per_sec'] for r in results]),
+        'coins_mean': mean([r['coins'] for r in results]),
+        'coins_min': min((r['coins'] for r in results), default=None),
+        'coins_max': max((r['coins'] for r in results), default=None),
+        'deaths_mean': mean([r['deaths'] for r in results]),
+        'level_mean': mean([r['level'] for r in results]),
+        'time_to_door_mean': [mean(ts) for ts in per_level],
+        'levels_cleared': [len(ts) for ts in per_level],
+        'worker_maxrss_kb': workers,
+    }
+
+def print_batch_report(report):
+    print(f"{report['sessions']} sessions in {report['wall_sec']:.2f}s, "
+          f"{report['total_ticks']} ticks ({report['ticks_per_sec']:.0f} ticks/s total, "
+          f"{report['session_ticks_per_sec'] or 0:.0f} ticks/s per session)")
+    print(f"  finished all levels: {report['finished']}  avg level reached: {report['level_mean'] or 0:.2f}")
+    print(f"  coins avg {report['coins_mean'] or 0:.1f} (min {report['coins_min']}, max {report['coins_max']})"
+          f"  deaths avg {report['deaths_mean'] or 0:.2f}")
+    for lvl, (t, cleared) in enumerate(zip(report['time_to_door_mean'], report['levels_cleared']), 1):
+        if cleared: print(f"  level {lvl:>2}: cleared {cleared:>6}  time-to-door avg {t:.1f}s")
+    rss = report['worker_maxrss_kb']
+    if rss:
+        print(f"  worker max RSS: {min(rss.values()) / 1024:.1f}-{max(rss.values()) / 1024:.1f} MB ({len(rss)} workers)")
+
+def write_batch_report(path, report, results):
+    # .csv = 1 แถวต่อ session, อย่างอื่น = JSON (สรุป + ทุก session)
+    if path.endswith('.csv'):
+        fields = ['session', 'seed', 'pid', 'finished', 'level', 'coins', 'deaths', 'ticks', 'ticks_per_sec', 'maxrss_kb']
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(fields + ['time_to_door'])
+            for r in results:
+                writer.writerow([r[k] for k in fields] + [' '.join(f"{lvl}:{t:.3f}" for lvl, t in r['time_to_door'])])
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'summary': report, 'sessions': results}, f)
+    print(f"Batch report written to {path}")
@@ -0,0 +1,324 @@
+import os
+import sys
+import gc
+import json
+import time
+import random
+import subprocess
+import tracemalloc
+
+# ==========================================
+# Benchmark: build_level / collision / render
+# รันได้บนเครื่อง Linux ไม่มีจอ (SDL dummy video + audio)
+#   python -m asgard.bench                   -> รันทุก scenario
+#   python -m asgard.bench --quick           -> รอบสั้น (ไว้เช็คเร็วๆ)
+#   python -m asgard.bench --filter move     -> เฉพาะ scenario ที่ชื่อมีคำนี้
+#   python -m asgard.bench --save-baseline   -> บันทึกผลเป็น baseline
+#   python -m asgard.bench --threshold 0.15  -> ถ้า ops/s ตกเกิน 15% จาก baseline = regression (exit 1)
+# ==========================================
+# ต้องตั้งก่อน import ส่วนอื่นของ package (settings อ่านค่า HEADLESS ตอน import)
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('ASGARD_HEADLESS', '1')
+
+import pygame
+
+from . import world as world_module
+from .settings import DISPLAY, SCREEN_WIDTH, SCREEN_HEIGHT, MAX_LEVELS, SIM_DT
+from .assets import ASSETS, BAKED, FRAMES
+from .graphics import FONTS, HudText, Camera
+from .entities import Platform, Player, Enemy
+from .level import build_level, build_obstacle_grid, generate_layout, level_width
+from .world import Inputs, World, np
+from .game import GameRenderer
+from .env import AsgardEnv, VectorEnv, ENV_ACTIONS
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(ROOT, 'bench_baseline.json')
+DEFAULT_THRESHOLD = 0.15
+
+def get_arg(name, default=None):
+    if name in sys.argv:
+        idx = sys.argv.index(name)
+        if idx + 1 < len(sys.argv) and not sys.argv[idx + 1].startswith('--'):
+            return sys.argv[idx + 1]
+    return default
+
+# --- การวัดผล ---
+# ops/s = ค่าที่ดีที่สุดจากหลายรอบ, alloc วัดด้วย tracemalloc ทีละ op
+# หมายเหตุ: pixel ของ Surface จองฝั่ง SDL ไม่ถูกนับใน tracemalloc
+def measure(op, min_time, repeats):
+    op()  # warm-up (โหลด asset เข้า cache ฯลฯ)
+    best = 0.0
+    for _ in range(repeats):
+        count = 0
+        t0 = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < min_time:
+            op()
+            count += 1
+            elapsed = time.perf_counter() - t0
+        best = max(best, count / elapsed)
+
+    # peak = ไบต์สูงสุดที่จองชั่วคราวระหว่าง 1 op, kept = block ที่ยังค้างอยู่หลัง op (ชี้ว่ามี garbage/leak)
+    alloc_ops = max(1, min(200, int(best * 0.05)))
+    gc.collect()
+    tracemalloc.start()
+    peak_total = 0
+    start_blocks = sys.getallocatedblocks()
+    for _ in range(alloc_ops):
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        op()
+        _, peak = tracemalloc.get_traced_memory()
+        peak_total += peak - base
+    kept = sys.getallocatedblocks() - start_blocks
+    tracemalloc.stop()
+    return {'ops_per_sec': best, 'peak_bytes_per_op': peak_total / alloc_ops, 'kept_blocks_per_op': kept / alloc_ops}
+
+# --- Scenario ---
+def make_obstacles(n, seed=1, width=None, height=None):
+    rng = random.Random(seed)
+    width = width or SCREEN_WIDTH
+    height = height or SCREEN_HEIGHT
+    obstacles = [Platform(0, height - 100, width, 100)]
+    for _ in range(n - 1):
+        w = rng.randint(40, 200)
+        obstacles.append(Platform(rng.randint(0, width - w), rng.randint(100, height - 140), w, 28))
+    return obstacles
+
+def scenarios(quick):
+    sizes = (10, 100) if quick else (10, 100, 1000)
+    result = []
+
+    # cold start: process ใหม่ตั้งแต่ import package จนเมนูเฟรมแรกขึ้นจอ (ใช้จอ dummy ไม่ใช่โหมด headless)
+    startup_env = dict(os.environ)
+    startup_env.pop('ASGARD_HEADLESS', None)
+
+    def cold_start():
+        subprocess.run([sys.executable, '-m', 'asgard', '--startup-check'], cwd=ROOT, env=startup_env,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    result.append(('startup.first_frame', cold_start))
+
+    # build_level ทุกด่าน (asset อยู่ใน cache แล้ว)
+    def build_all():
+        for lvl in range(1, MAX_LEVELS + 1):
+            build_level(lvl)
+    result.append(('build_level.all_levels', build_all))
+
+    # สร้าง layout ทุกด่านแบบไม่ผ่าน LayoutCache (วัดเฉพาะตัว generator)
+    def generate_all():
+        for lvl in range(1, MAX_LEVELS + 1):
+            generate_layout(lvl, 0, level_width(lvl))
+    result.append(('generate_layout.all_levels', generate_all))
+
+    # build_level แบบ cache เย็น (ล้าง asset/frame cache ก่อนทุกครั้ง)
+    def build_cold():
+        ASSETS.clear()
+        FRAMES.clear()
+        build_level(5)
+    result.append(('build_level.cold_cache', build_cold))
+
+    # เหมือนข้างบนแต่ไม่ใช้ภาพที่ bake ไว้ (ตัด/ย่อจากต้นฉบับทุกครั้ง) เทียบกับ python -m asgard.bake
+    def build_cold_unbaked():
+        BAKED.enabled = False
+        try:
+            build_cold()
+        finally:
+            BAKED.enabled = True
+    result.append(('build_level.cold_cache.unbaked', build_cold_unbaked))
+
+    # ด่านสังเคราะห์ขนาดใหญ่: แพลตฟอร์ม 200 + หมู 100
+    def build_synthetic():
+        rng = random.Random(7)
+        plats = make_obstacles(200, seed=7)
+        [Enemy(p.rect.x, p.rect.top - 30, 60, rng) for p in plats[:100]]
+    result.append(('build_level.synthetic_200p_100e', build_synthetic))
+
+    move_inputs = Inputs(right=True)
+    for n in sizes:
+        grid = build_obstacle_grid(make_obstacles(n))
+        player = Player()
+
+        def player_move(player=player, grid=grid):
+            if player.rect.right >= SCREEN_WIDTH - 5:
+                player.rect.topleft = (100, 200)
+            player.move(grid, move_inputs)
+        result.append((f'player.move.{n}_obstacles', player_move))
+
+        rng = random.Random(3)
+        enemies = [Enemy(rng.randint(0, SCREEN_WIDTH - 40), SCREEN_HEIGHT - 130, 150, rng)
+                   for _ in range(32)]
+        player_rect = pygame.Rect(-100, -100, 34, 40)
+
+        def enemy_update(enemies=enemies, grid=grid):
+            for e in enemies:
+                e.update(player_rect, grid)
+        result.append((f'enemy.update_x32.{n}_obstacles', enemy_update))
+
+    anim = Player().anims['idle']
+
+    def anim_frame(flip=False):
+        anim.update(SIM_DT)
+        return anim.get_frame(flip)
+    result.append(('animation.get_frame', anim_frame))
+    result.append(('animation.get_frame_flipped', lambda: anim_frame(True)))
+
+    # ข้อความ HUD: ค่าเปลี่ยนทุกครั้ง (FreeType วาดใหม่) vs ค่าเดิม (HudText ใช้ภาพเดิมจาก TextCache)
+    hud_count = [0]
+    hud_font = FONTS.get('main')
+    hud_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    hud = HudText(hud_font, (255, 215, 0), "Coins: {}")
+
+    def hud_render():
+        hud_count[0] += 1
+        return hud.render(hud_surf, (20, 20), hud_count[0])
+    result.append(('text.hud_render.changed', hud_render))
+    result.append(('text.hud_render.same', lambda: hud.render(hud_surf, (20, 20), hud_count[0])))
+
+    surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    render_player = Player()
+    render_player.flip = True
+    cam = Camera(SCREEN_WIDTH, SCREEN_HEIGHT)
+    result.append(('player.render_flip', lambda: render_player.render(surf, cam)))
+
+    # เฟรมเต็มแบบ headless: หมู 64 + เหรียญ 64 (step + render ลง display dummy)
+    world = World()
+    world.step(Inputs(start=True))
+    renderer = GameRenderer(DISPLAY.get())
+    crowd_rng = random.Random(11)
+    floor = world.platforms[0].rect
+
+    def fill_crowd():
+        # เติมผ่าน pool ของ World เหมือนตอนเล่นจริง (วัด garbage ต่อเฟรมได้ตรง)
+        while len(world.enemies) < 64:
+            x = crowd_rng.randint(0, SCREEN_WIDTH - 40)
+            world.enemies.append(world.enemy_pool.acquire(x, floor.top - 30, 150, crowd_rng))
+        while len(world.coins_list) < 64:
+            world.coins_list.append(world.coin_pool.acquire(crowd_rng.randint(0, SCREEN_WIDTH - 40), 200))
+
+    def full_frame():
+        fill_crowd()
+        world.player.invincible_timer = 2
+        world.step()
+        if world.game_state != "PLAYING":
+            world.game_state = "PLAYING"
+        renderer.render(world)
+    result.append(('frame.headless_64e_64c', full_frame))
+
+    # ด่านกว้าง 2 จอ: หมู 64 ตัวกระจายทั้งด่าน (ส่วนใหญ่อยู่นอกจอ -> cull/อัปเดตห่างๆ)
+    wide = World()
+    wide.step(Inputs(start=True))
+    wide.start_game(MAX_LEVELS)
+    wide_floor = wide.platforms[0].rect
+    wide_rng = random.Random(13)
+
+    def wide_frame():
+        while len(wide.enemies) < 64:
+            x = wide_rng.randint(0, wide_floor.right - 40)
+            wide.enemies.append(wide.enemy_pool.acquire(x, wide_floor.top - 30, 150, wide_rng))
+        wide.player.invincible_timer = 2
+        wide.step()
+        if wide.game_state != "PLAYING":
+            wide.game_state = "PLAYING"
+        renderer.render(wide)
+    result.append(('frame.wide_level_64e', wide_frame))
+
+    # โหมด horde: หมู 2000 + เหรียญ 1000 ในด่าน 1 (object ทีละตัว vs NumPy array ถ้ามี numpy)
+    modes = [('objects', 10 ** 9)]
+    if np is not None: modes.append(('numpy', world_module.SOA_THRESHOLD))
+    for mode, threshold in modes:
+        saved = world_module.SOA_THRESHOLD
+        world_module.SOA_THRESHOLD = threshold
+        horde = World(horde=2000)
+        horde.step(Inputs(start=True))
+        world_module.SOA_THRESHOLD = saved
+        horde_rng = random.Random(17)
+
+        def horde_frame(horde=horde, horde_rng=horde_rng):
+            if horde.coin_arrays is not None:
+                need = 1000 - len(horde.coin_arrays)
+                if need > 0:
+                    xs = np.array([horde_rng.randint(0, SCREEN_WIDTH - 40) for _ in range(need)])
+                    horde.coin_arrays.spawn(xs, np.full(need, 200))
+            else:
+                while len(horde.coins_list) < 1000:
+                    horde.coins_list.append(horde.coin_pool.acquire(horde_rng.randint(0, SCREEN_WIDTH - 40), 200))
+            horde.player.invincible_timer = 2
+            horde.player.rect.topleft = (100, 0)
+            horde.step()
+            renderer.render(horde)
+        result.append((f'frame.horde_2000e_1000c.{mode}', horde_frame))
+
+    # AsgardEnv: 1 op = 1 env step ด้วย action สุ่ม (จบแล้ว reset ต่อ)
+    for obs_type in ('features', 'pixels'):
+        env = AsgardEnv(obs_type, seed=19)
+        env.reset(0)
+        env_rng = random.Random(19)
+
+        def env_step(env=env, env_rng=env_rng):
+            _, _, terminated, truncated, _ = env.step(env_rng.randrange(len(ENV_ACTIONS)))
+            if terminated or truncated: env.reset()
+        result.append((f'env.step.{obs_type}', env_step))
+
+    vec = VectorEnv(8, seed=23)
+    vec.reset()
+    vec_rng = random.Random(23)
+    result.append(('vector_env.step_x8.features',
+                   lambda: vec.step([vec_rng.randrange(len(ENV_ACTIONS)) for _ in range(8)])))
+
+    return result
+
+# --- baseline ---
+def load_baseline(path):
+    if not os.path.exists(path): return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def save_baseline(path, results):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'python': sys.version.split()[0], 'results': results}, f, indent=2)
+    print(f"Baseline saved to {path}")
+
+def main():
+    quick = '--quick' in sys.argv
+    name_filter = get_arg('--filter')
+    baseline_path = get_arg('--baseline', BASELINE_PATH)
+    threshold = float(get_arg('--threshold', DEFAULT_THRESHOLD))
+    min_time = 0.1 if quick else 0.5
+    repeats = 2 if quick else 5
+
+    os.chdir(ROOT)  # path ของ assets เป็น relative
+    baseline = load_baseline(baseline_path)
+    base_results = baseline['results'] if baseline else {}
+
+    results = {}
+    regressions = []
+    print(f"{'scenario':<38}{'ops/s':>12}{'peak B/op':>11}{'kept/op':>9}{'vs base':>10}")
+    for name, op in scenarios(quick):
+        if name_filter and name_filter not in name: continue
+        r = measure(op, min_time, repeats)
+        results[name] = r
+        change = ''
+        base = base_results.get(name)
+        if base:
+            ratio = r['ops_per_sec'] / base['ops_per_sec'] - 1.0
+            change = f"{ratio * 100:+.1f}%"
+            if ratio < -threshold:
+                regressions.append((name, ratio))
+                change += ' !'
+        print(f"{name:<38}{r['ops_per_sec']:>12.1f}{r['peak_bytes_per_op']:>11.0f}{r['kept_blocks_per_op']:>9.1f}{change:>10}")
+
+    if '--save-baseline' in sys.argv:
+        merged = dict(base_results)
+        merged.update(results)
+        save_baseline(baseline_path, merged)
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {threshold * 100:.0f}%:")
+        for name, ratio in regressions:
+            print(f"  {name}: {ratio * 100:+.1f}%")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,861 @@
+import os
+import math
+import random
+import pygame
+
+# numpy ไม่บังคับ: มีแล้วโหมด horde (หมู/เหรียญหลายพันตัว) คำนวณแบบ array ได้
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .settings import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, YELLOW, SIM_DT, TIMER_EPS, ANIM_FPS
+from .assets import ASSETS, BAKED, FRAMES, load_safe_image
+from .graphics import FONTS, Animation, AnimationManager, render_text
+from .audio import AUDIO
+
+# --- Helper: ตัวจับเวลานับถอยหลัง (วินาที) เหลือไม่เกิน TIMER_EPS = หมด (คืน 0) ---
+def countdown(timer, dt):
+    timer -= dt
+    return timer if timer > TIMER_EPS else 0.0
+
+# --- CLASS: Platform ---
+class Platform:
+    def __init__(self, x, y, w, h, image_path='assets/box/idle.png', is_wall=False):
+        self.rect = pygame.Rect(x, y, w, h)
+        self.is_wall = is_wall
+        
+        color = (100, 100, 100) if not is_wall else (80, 50, 50)
+        img = ASSETS.get(('platform_tile', image_path, h, color),
+                         lambda: self.load_tile(image_path, color, h))
+
+        surf_img = pygame.Surface((w, h), pygame.SRCALPHA)
+        iw = img.get_width()
+
+        if w <= iw:
+            x0 = (iw - w) // 2
+            crop = img.subsurface(pygame.Rect(x0, 0, w, h))
+            surf_img.blit(crop, (0, 0))
+        else:
+            for xx in range(0, w, iw):
+                surf_img.blit(img, (xx, 0))
+
+        self.image = surf_img
+
+    @staticmethod
+    def load_tile(image_path, color, h):
+        # ต้นฉบับบางรูปใหญ่มาก (mm.png 4000x980) ใช้ตัวที่ bake ไว้แล้วถ้ามี
+        return BAKED.get(f"tile:{image_path}:h{h}", image_path,
+                         lambda: Platform.make_tile(image_path, color, h))
+
+    @staticmethod
+    def make_tile(image_path, color, h):
+        img = load_safe_image(image_path, color).convert_alpha()
+        img.set_colorkey((0, 0, 0))
+
+        bbox = img.get_bounding_rect()
+        if bbox.width > 0 and bbox.height > 0:
+            img = img.subsurface(bbox).copy()
+
+        if img.get_height() != h and img.get_height() > 0:
+            new_w = int(img.get_width() * (h / img.get_height()))
+            img = pygame.transform.scale(img, (new_w, h))
+        return img
+
+    def render(self, surf):
+        surf.blit(self.image, (self.rect.x, self.rect.y))
+
+# --- CLASS: Decoration ---
+class Decoration:
+    def __init__(self, x, y, w, h, image_path='assets/environment/decorations.png'):
+        self.rect = pygame.Rect(x, y, w, h)
+        self.image = load_safe_image(image_path, (50, 50, 200), (w, h))
+
+    def render(self, surf):
+        surf.blit(self.image, (self.rect.x, self.rect.y))
+
+# --- CLASS: Door ---
+class Door:
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(x + 20, y + 20, 50, 80)
+        self.draw_x = x
+        self.draw_y = y
+        self.state = 'idle'
+
+        idle_img = load_safe_image('assets/door/idle.png')
+        opening_img = load_safe_image('assets/door/opening.png', fallback_color=(100,100,100))
+        
+        opening_frames = 5
+        if opening_img.get_width() > 46:
+             opening_frames = opening_img.get_width() // 46
+
+        self.anims = {
+            'idle': Animation(idle_img, (46, 56), 1, True, (92, 112)),
+            'opening': Animation(opening_img, (46, 56), opening_frames, False, (92, 112)),
+            'open': Animation(idle_img, (46, 56), 1, True, (92, 112))
+        }
+        self.manager = AnimationManager(self.anims)
+
+    def reset(self):
+        self.state = 'idle'
+        self.manager.set_state('idle')
+        for anim in self.anims.values(): anim.reset()
+
+    def open(self):
+        if self.state == 'idle':
+            self.state = 'opening'
+            self.manager.set_state('opening')
+            AUDIO.play('door_open')
+
+    def update(self, dt):
+        self.manager.update(dt)
+        if self.state == 'opening' and self.manager.is_done():
+            self.state = 'open'
+            self.manager.set_state('open')
+
+    def render(self, surf, cam):
+        frame = self.manager.get_frame()
+        return surf.blit(frame, (self.draw_x - cam.draw_x, self.draw_y - cam.draw_y))
+
+# --- CLASS: Box ---
+class Box:
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(x, y, 40, 40)
+        self.image = ASSETS.get(('box', 40, 40), self.load_image)
+
+    @staticmethod
+    def load_image():
+        return BAKED.get('box:assets/box/idle.png:40x40', 'assets/box/idle.png', Box.make_image)
+
+    @staticmethod
+    def make_image():
+        img = load_safe_image('assets/box/idle.png')
+        if img.get_width() >= 22 and img.get_height() >= 16:
+            img = img.subsurface(0, 0, 22, 16)
+        return pygame.transform.scale(img, (40, 40))
+
+    def render(self, surf):
+        surf.blit(self.image, (self.rect.x, self.rect.y))
+
+# --- CLASS: Pool (เก็บ object ที่เลิกใช้แล้วไว้ใช้ซ้ำ ไม่ต้องสร้างใหม่ทุกครั้ง) ---
+# class ที่ใช้กับ Pool ต้องมี reset(...) ที่รับ argument ชุดเดียวกับ __init__
+class Pool:
+    def __init__(self, cls):
+        self.cls = cls
+        self.free = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, *args, **kwargs):
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+            return obj
+        self.created += 1
+        return self.cls(*args, **kwargs)
+
+    def release(self, obj):
+        self.free.append(obj)
+
+    def release_all(self, objs):
+        # คืนทั้งลิสต์แล้วล้างลิสต์เดิม (ไม่สร้างลิสต์ใหม่)
+        self.free.extend(objs)
+        objs.clear()
+
+# --- CLASS: Coin ---
+COIN_LIFETIME = 5.0      # วินาทีก่อนเหรียญหายไป
+COIN_BLINK_TIME = 1.0    # วินาทีสุดท้ายที่กะพริบ
+COIN_BOB_SPEED = 12.0    # rad/s ของการลอยขึ้นลง
+
+class Coin:
+    __slots__ = ('rect', 'prev_x', 'prev_y', 'vel_y', 'gravity', 'collected', 'life_span', 'anim_timer')
+
+    # ภาพเหรียญ + แสงรอบเหรียญ ใช้ร่วมกันทุกเหรียญ (สร้างครั้งแรกที่มีเหรียญ)
+    image = None
+    glow_surf = None
+
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(x, y, 38, 38)
+        if Coin.image is None: Coin.load_images()
+        self.reset(x, y)
+
+    @staticmethod
+    def load_images():
+        Coin.image = load_safe_image('assets/items/coin.png', YELLOW, (38, 38))
+        glow = pygame.Surface((30, 30), pygame.SRCALPHA)
+        pygame.draw.circle(glow, (255, 255, 100, 100), (15, 15), 15)
+        Coin.glow_surf = glow
+
+    def reset(self, x, y):
+        self.rect.topleft = (x, y)
+        self.prev_x, self.prev_y = x, y
+        self.vel_y = -3
+        self.gravity = 0.2
+        self.collected = False
+        self.life_span = COIN_LIFETIME
+        self.anim_timer = 0
+
+    def update(self, grid, dt=SIM_DT):
+        self.prev_x, self.prev_y = self.rect.x, self.rect.y
+        if self.collected: return
+
+        self.vel_y += self.gravity
+        self.rect.y += int(self.vel_y)
+        
+        for obj in grid.query(self.rect):
+            if self.rect.colliderect(obj.rect):
+                if self.vel_y > 0:
+                    self.rect.bottom = obj.rect.top
+                    self.vel_y = 0
+
+        self.life_span = countdown(self.life_span, dt)
+        self.anim_timer += COIN_BOB_SPEED * dt
+
+    def render(self, surf, cam):
+        if self.collected: return None
+        
+        if self.life_span < COIN_BLINK_TIME - TIMER_EPS and int(self.anim_timer) % 2 == 0:
+            return None
+
+        offset_y = math.sin(self.anim_timer) * 3
+        x = round(cam.lerp(self.prev_x, self.rect.x)) - cam.draw_x
+        y = round(cam.lerp(self.prev_y, self.rect.y)) - cam.draw_y
+        
+        glow_rect = surf.blit(self.glow_surf, (x + self.rect.width // 2 - 15, y + self.rect.height // 2 - 15 + offset_y))
+        return surf.blit(self.image, (x, y + offset_y)).union(glow_rect)
+
+# --- CLASS: FloatingText ---
+FLOAT_TEXT_LIFE = 40 / 60   # วินาที
+FLOAT_TEXT_SPEED = -120      # px/s (ลอยขึ้น)
+
+class FloatingText:
+    __slots__ = ('x', 'y', 'prev_y', 'text', 'color', 'life', 'vel_y')
+
+    def __init__(self, x, y, text, color=WHITE):
+        self.reset(x, y, text, color)
+
+    def reset(self, x, y, text, color=WHITE):
+        self.x = x
+        self.y = y
+        self.prev_y = y
+        self.text = text
+        self.color = color
+        self.life = FLOAT_TEXT_LIFE
+        self.vel_y = FLOAT_TEXT_SPEED
+
+    def update(self, dt=SIM_DT):
+        self.prev_y = self.y
+        self.y += self.vel_y * dt
+        self.life = countdown(self.life, dt)
+        return self.life <= 0
+
+    def render(self, surf, cam):
+        alpha = min(255, round(self.life * 360))
+        txt_surf = render_text(FONTS.get('small'), self.text, self.color)
+        # Surface นี้ใช้ร่วมกันใน TextCache -> ตั้ง alpha แค่ตอน blit แล้วคืนค่าเดิม
+        txt_surf.set_alpha(alpha)
+        y = cam.lerp(self.prev_y, self.y)
+        rect = surf.blit(txt_surf, (self.x - txt_surf.get_width()//2 - cam.draw_x, y - cam.draw_y))
+        txt_surf.set_alpha(255)
+        return rect
+
+# --- CLASS: Player ---
+INVINCIBLE_TIME = 1.5    # วินาทีที่อมตะหลังโดนตี
+KNOCKBACK_TIME = 1 / 6   # วินาทีที่โดนกระเด็น
+
+class Player:
+    def __init__(self):
+        self.rect = pygame.Rect(100, 400, 34, 40)
+        self.sweep = pygame.Rect(self.rect)  # rect ที่ใช้ query ระหว่างขยับ (เขียนทับทุก tick)
+        self.prev_x, self.prev_y = self.rect.topleft  # ตำแหน่งก่อน step ล่าสุด (ไว้ interpolate ตอนวาด)
+        self.vel_y = 0
+        self.on_ground = False
+        self.flip = False
+        self.is_attacking = False
+        self.entering_door = False
+        self.door_target = None
+        
+        self.max_hp = 3
+        self.hp = 3
+        self.invincible_timer = 0
+        self.is_dead = False
+        self.knockback_timer = 0 
+        self.knockback_dir = 0 
+        self.door_delay = 0
+        self.DOOR_DELAY_FRAMES = 10
+        self.door_wait = None   # วินาทีที่ยืนรอหน้าประตูที่เปิดแล้ว
+        self.DOOR_DELAY = 0.0
+
+        anim_data = {
+            'idle': ('idle.png', 11, True),
+            'run': ('idle.png', 8, True),
+            'jump': ('idle.png', 1, True),
+            'fall': ('idle.png', 1, True),
+            'attack': ('attack.png', 3, False),
+            'door_in': ('door_in.png', 8, False),
+            'hit': ('idle.png', 2, False),
+            'die': ('idle.png', 10, False)
+        }
+
+        self.anims = {}
+        DRAW_SIZE = (70, 58)
+        
+        temp_anims = {}
+        for name, data in anim_data.items():
+            fname, frames, loop = data
+            path = f'assets/player/{fname}'
+            
+            if not os.path.exists(path):
+                if name == 'die': path = 'assets/player/idle.png'
+                elif name == 'door_in': path = 'assets/player/dooraa.png'
+                else: path = 'assets/player/door_enter.png'
+                if name == 'door_in': frames = 6
+            
+            img = load_safe_image(path)
+            temp_anims[name] = Animation(img, (78, 58), frames, loop, scale_to=DRAW_SIZE)
+
+        self.anims = temp_anims
+        self.draw_h = DRAW_SIZE[1]
+        self.manager = AnimationManager(self.anims)
+
+    def reset(self):
+        self.rect.topleft = (100, 400)
+        self.prev_x, self.prev_y = self.rect.topleft
+        self.entering_door = False
+        self.is_attacking = False
+        self.door_target = None
+        self.vel_y = 0
+        self.hp = self.max_hp
+        self.invincible_timer = 0
+        self.is_dead = False
+        self.flip = False
+        self.knockback_timer = 0
+        self.manager.set_state('idle')
+        self.door_delay = 0
+        self.door_wait = None
+
+    def take_damage(self, source_rect):
+        if self.invincible_timer > 0 or self.is_dead: return
+
+        self.hp -= 1
+        self.invincible_timer = INVINCIBLE_TIME
+        self.manager.set_state('hit')
+        self.is_attacking = False      
+        self.door_target = None        
+
+        KB_FORCE = 6
+
+        if self.rect.centerx < source_rect.centerx:
+            self.knockback_dir = -KB_FORCE
+        else:
+            self.knockback_dir = KB_FORCE
+
+        self.knockback_timer = KNOCKBACK_TIME
+        self.vel_y = -6       
+
+        if self.hp <= 0:
+            self.hp = 0
+            self.is_dead = True
+            self.manager.set_state('die')
+
+    def attack(self, enemies, enemy_arrays=None):
+        if not self.is_attacking and not self.entering_door and not self.is_dead and self.knockback_timer <= 0:
+            self.is_attacking = True
+            self.manager.set_state('attack')
+            
+            AUDIO.play('swing')
+
+            att_rect = self.rect.copy()
+            att_rect.width += 40
+            if self.flip: att_rect.x -= 40
+
+            hit_count = 0
+            for e in enemies:
+                if not e.is_dying and att_rect.colliderect(e.rect):
+                    e.die()
+                    hit_count += 1
+            if enemy_arrays is not None:
+                hit_count += enemy_arrays.kill_in(att_rect)
+            
+            if hit_count > 0:
+                AUDIO.play('hit')
+
+    def start_enter_door(self, door):
+        if not self.entering_door and not self.door_target and not self.is_dead and self.knockback_timer <= 0:
+            self.door_target = door
+            self.door_wait = None
+            door.open()
+
+    def move(self, grid, inputs, world_width=SCREEN_WIDTH, dt=SIM_DT):
+        self.prev_x, self.prev_y = self.rect.x, self.rect.y
+        if self.entering_door or self.door_target or self.is_dead: return
+
+        dx = 0
+
+        if self.knockback_timer > 0:
+            dx = self.knockback_dir
+            self.knockback_timer = countdown(self.knockback_timer, dt)
+        else:
+            if not self.is_attacking:
+                if inputs.left:
+                    dx = -5
+                    self.flip = True
+                    if self.on_ground: self.manager.set_state('run')
+                elif inputs.right:
+                    dx = 5
+                    self.flip = False
+                    if self.on_ground: self.manager.set_state('run')
+                else:
+                    if self.on_ground: self.manager.set_state('idle')
+
+                if inputs.jump and self.on_ground:
+                    self.vel_y = -20
+                    self.on_ground = False
+                    self.manager.set_state('jump')
+                    AUDIO.play('jump')
+
+        self.vel_y += 0.8
+        if self.vel_y > 15: self.vel_y = 15
+        dy = int(round(self.vel_y))
+        if dy == 0:
+            if self.vel_y > 0: dy = 1
+            elif self.vel_y < 0: dy = -1
+
+        sweep = self.sweep
+        sweep.update(self.rect)
+        self.rect.x += dx
+        sweep.union_ip(self.rect)
+        for obj in grid.query(sweep):
+            if self.rect.colliderect(obj.rect):
+                if dx > 0: self.rect.right = obj.rect.left
+                if dx < 0: self.rect.left = obj.rect.right
+
+        if self.rect.left < 0: self.rect.left = 0
+        if self.rect.right > world_width: self.rect.right = world_width
+
+        sweep.update(self.rect)
+        self.rect.y += dy
+        sweep.union_ip(self.rect)
+        self.on_ground = False
+        for obj in grid.query(sweep):
+            if self.rect.colliderect(obj.rect):
+                if dy > 0:
+                    self.rect.bottom = obj.rect.top
+                    self.vel_y = 0
+                    self.on_ground = True
+                elif dy < 0:
+                    self.rect.top = obj.rect.bottom
+                    self.vel_y = 0
+
+        if self.rect.top < 0:
+            self.rect.top = 0
+            if self.vel_y < 0: self.vel_y = 0
+
+        if self.rect.bottom >= SCREEN_HEIGHT:
+            self.rect.bottom = SCREEN_HEIGHT
+            self.vel_y = 0
+            self.on_ground = True
+
+        if not self.on_ground and not self.is_attacking:
+            if self.vel_y > 0: self.manager.set_state('fall')
+
+    def update(self, dt=SIM_DT):
+        self.manager.update(dt)
+        if self.invincible_timer > 0: self.invincible_timer = countdown(self.invincible_timer, dt)
+
+        if self.is_dead:
+            if self.manager.is_done() and self.manager.state == 'die':
+                return "dead"
+            return None
+
+        if self.is_attacking and self.manager.is_done() and self.manager.state == 'attack':
+            self.is_attacking = False
+
+        if self.door_target:
+            if self.door_target.state == 'open' and not self.entering_door:
+                if self.door_wait is None:
+                    self.door_wait = 0.0
+                else:
+                    self.door_wait += dt
+
+                self.manager.set_state('idle')
+                self.vel_y = 0
+                self.rect.centerx = self.door_target.rect.centerx
+
+                if self.door_wait >= self.DOOR_DELAY - TIMER_EPS:
+                    self.entering_door = True
+                    self.manager.set_state('door_in')
+
+            if self.entering_door and self.manager.is_done():
+                self.door_wait = None
+                return "next_level"
+        
+        if self.manager.state == 'hit' and self.manager.is_done():
+             if self.on_ground: self.manager.set_state('idle')
+
+        return None
+
+    def render(self, surf, cam):
+        # กะพริบ 7.5 ครั้ง/วินาที ระหว่างอมตะ
+        if self.invincible_timer > 0 and int(self.invincible_timer * 15 + TIMER_EPS) % 2 == 0: return None
+
+        frame = self.manager.get_frame(self.flip)
+
+        x = round(cam.lerp(self.prev_x, self.rect.x))
+        y = round(cam.lerp(self.prev_y, self.rect.y))
+        draw_x = x + self.rect.width // 2 - frame.get_width() // 2 - cam.draw_x
+        draw_y = y + self.rect.height - self.draw_h - cam.draw_y
+
+        return surf.blit(frame, (draw_x, draw_y))
+
+# --- CLASS: Enemy ---
+class Enemy:
+    __slots__ = ('rect', 'sweep', 'feet', 'prev_x', 'prev_y', 'start_x', 'dist', 'dir', 'speed', 'is_dying',
+                 'run_anim', 'die_anim')
+
+    def __init__(self, x, y, dist, rng=random, direction=None, speed=None):
+        self.rect = pygame.Rect(x, y, 34, 30)
+        # rect ชั่วคราวตอน update (ช่วงที่เดินผ่าน / พื้นใต้เท้า) เขียนทับทุก tick ไม่สร้างใหม่
+        self.sweep = pygame.Rect(self.rect)
+        self.feet = pygame.Rect(self.rect)
+
+        img = load_safe_image('assets/pig/run.png')
+        self.run_anim = Animation(img, (34, 28), 6, True, (44, 38))
+
+        die_img = load_safe_image('assets/pig/dead.png', fallback_color=(200, 50, 50))
+        self.die_anim = Animation(die_img, (34, 28), 6, False, (44, 38))
+        self.reset(x, y, dist, rng, direction, speed)
+
+    def reset(self, x, y, dist, rng=random, direction=None, speed=None):
+        # ใช้ซ้ำจาก Pool: ภาพ/เสียง/Animation เดิมใช้ต่อได้ ตั้งแค่สถานะใหม่
+        self.rect.topleft = (x, y)
+        self.prev_x, self.prev_y = x, y
+        self.start_x = x
+        self.dist = dist
+        self.dir = rng.choice([-1, 1]) if direction is None else direction
+        self.speed = rng.uniform(1.5, 2.5) if speed is None else speed
+        self.is_dying = False
+        self.run_anim.reset()
+        self.die_anim.reset()
+
+    def is_dead_finished(self):
+        return self.is_dying and self.die_anim.status == "done"
+
+    def die(self):
+        if not self.is_dying:
+            self.is_dying = True
+            AUDIO.play('enemy_death')
+
+    def update(self, player_rect, grid, dt=SIM_DT, world_width=SCREEN_WIDTH, steps=1):
+        # steps > 1 = หมูที่อยู่ไกลจอ อัปเดตนานๆ ครั้งแต่เดินทีละหลายก้าว
+        self.prev_x, self.prev_y = self.rect.x, self.rect.y
+        if self.is_dying:
+            self.die_anim.update(dt * steps)
+            return None
+        self.run_anim.update(dt * steps)
+
+        dx = self.dir * self.speed * steps
+        sweep = self.sweep
+        sweep.update(self.rect)
+        self.rect.x += dx
+        sweep.union_ip(self.rect)
+
+        for obj in grid.query(sweep):
+            if self.rect.colliderect(obj.rect):
+                if dx > 0:
+                    self.rect.right = obj.rect.left
+                    self.dir = -1
+                elif dx < 0:
+                    self.rect.left = obj.rect.right
+                    self.dir = 1
+                break
+
+        if self.rect.left < 0:
+            self.rect.left = 0
+            self.dir = 1
+        elif self.rect.right > world_width:
+            self.rect.right = world_width
+            self.dir = -1
+
+        ground_check = self.feet
+        ground_check.update(self.rect.x, self.rect.bottom + 2, self.rect.width, 6)
+        on_ground = False
+        for obj in grid.query(ground_check):
+            if ground_check.colliderect(obj.rect):
+                on_ground = True
+                break
+        if not on_ground:
+            self.dir *= -1
+
+        if self.rect.x > self.start_x + self.dist:
+            self.dir = -1
+        elif self.rect.x < self.start_x:
+            self.dir = 1
+
+        if self.rect.colliderect(player_rect):
+            return "hit"
+
+        return None
+
+    def render(self, surf, cam):
+        if self.is_dying:
+            frame = self.die_anim.get_frame()
+        else:
+            frame = self.run_anim.get_frame(self.dir == 1)
+
+        x = round(cam.lerp(self.prev_x, self.rect.x))
+        y = round(cam.lerp(self.prev_y, self.rect.y))
+        draw_x = x + self.rect.width // 2 - frame.get_width() // 2 - cam.draw_x
+        draw_y = y + self.rect.height - frame.get_height() - cam.draw_y
+        return surf.blit(frame, (draw_x, draw_y))
+
+# --- โหมด horde: เก็บหมู/เหรียญเป็น NumPy array (structure of arrays) แล้วคำนวณทีละทั้งชุด ---
+# ใช้เมื่อมี numpy และหมูในด่าน >= SOA_THRESHOLD ไม่งั้นใช้ Enemy/Coin ทีละ object เหมือนเดิม
+# กติกาเหมือน Enemy.update / Coin.update (ชนกำแพง, ขอบด่าน, เช็คพื้น, ระยะลาดตระเวน, แรงโน้มถ่วง, อายุเหรียญ)
+SOA_THRESHOLD = 200
+
+def round_half_away(v):
+    # ปัดแบบเดียวกับตอนใส่ float ให้ pygame.Rect (.5 ปัดออกจาก 0)
+    return np.trunc(v + np.copysign(0.5, v)).astype(np.int64)
+
+def obstacle_arrays(obstacles):
+    # (left, top, right, bottom) ของ obstacle ทุกชิ้น เรียงตามลำดับเดียวกับ grid
+    rects = [o.rect for o in obstacles] or [pygame.Rect(0, 0, 0, 0)]
+    data = np.array([(r.left, r.top, r.right, r.bottom) for r in rects], dtype=np.int64)
+    return data[:, 0], data[:, 1], data[:, 2], data[:, 3]
+
+def boxes_hit(x, y, w, h, obs):
+    # M x N: กล่อง (x, y, w, h) แต่ละตัวชน obstacle ชิ้นไหนบ้าง (เงื่อนไขเดียวกับ Rect.colliderect)
+    left, top, right, bottom = obs
+    x = x[:, None]
+    y = y[:, None]
+    return (x < right) & (left < x + w) & (y < bottom) & (top < y + h)
+
+def box_hits_rect(x, y, w, h, rect):
+    return (x < rect.right) & (rect.left < x + w) & (y < rect.bottom) & (rect.top < y + h)
+
+def horde_spawns(layout, count, rng):
+    # หมูเพิ่ม count ตัว สุ่มบนแพลตฟอร์มที่ไม่ใช่กำแพง (เว้นรอบจุดเกิดผู้เล่น)
+    plats = [(x, y, w) for kind, x, y, w, h in layout.platforms if kind != 'wall' and w >= 100]
+    spawns = []
+    for _ in range(count):
+        for _ in range(10):
+            x, y, w = rng.choice(plats)
+            ex = rng.randint(x, x + w - 34)
+            if ex > 350 or y < 300: break
+        spawns.append((ex, y - 30, min(150, max(60, w - 60)), rng.choice([-1, 1]), rng.uniform(1.5, 2.5)))
+    return spawns
+
+class EnemyArrays:
+    W, H = 34, 30
+    FIELDS = ('x', 'y', 'prev_x', 'prev_y', 'start_x', 'dist', 'dir', 'speed', 'dying', 'anim_time', 'die_time')
+
+    def __init__(self, spawns, obstacles):
+        data = np.array(spawns, dtype=np.float64).reshape(-1, 5)
+        self.x = data[:, 0].astype(np.int64)
+        self.y = data[:, 1].astype(np.int64)
+        self.prev_x = self.x.copy()
+        self.prev_y = self.y.copy()
+        self.start_x = self.x.copy()
+        self.dist = data[:, 2].astype(np.int64)
+        self.dir = data[:, 3].astype(np.int64)
+        self.speed = data[:, 4]
+        self.dying = np.zeros(len(data), dtype=bool)
+        self.anim_time = np.zeros(len(data))
+        self.die_time = np.zeros(len(data))
+        self.obstacles = obstacle_arrays(obstacles)
+
+        # เฟรมภาพชุดเดียวกับ Enemy (ได้จาก FrameAtlas ตัวเดียวกัน)
+        run_img = load_safe_image('assets/pig/run.png')
+        die_img = load_safe_image('assets/pig/dead.png', fallback_color=(200, 50, 50))
+        self.run_frames = FRAMES.get_frames(run_img, (34, 28), 6, (44, 38))
+        self.run_frames_flipped = FRAMES.get_frames(run_img, (34, 28), 6, (44, 38), flipped=True)
+        self.die_frames = FRAMES.get_frames(die_img, (34, 28), 6, (44, 38))
+
+    def __len__(self):
+        return len(self.x)
+
+    def rect_of(self, i):
+        return pygame.Rect(int(self.x[i]), int(self.y[i]), self.W, self.H)
+
+    def update(self, player_rect, world_width, dt=SIM_DT, active=None, tick=0, far_interval=1):
+        # คืน index ของหมูตัวแรกที่ชนผู้เล่น (-1 = ไม่มี)
+        # รอบการอัปเดตเหมือนลิสต์ Enemy ใน World: กำลังตาย/อยู่ใน active อัปเดตทุก tick
+        # ที่เหลืออัปเดตเมื่อ (tick + index) % far_interval == 0 แล้วเดินทีละ far_interval ก้าว
+        W, H = self.W, self.H
+        obs = self.obstacles
+        near = self.dying.copy()
+        if active is not None:
+            near |= box_hits_rect(self.x, self.y, W, H, active)
+        else:
+            near[:] = True
+        far = ~near & ((tick + np.arange(len(self.x))) % far_interval == 0)
+        moving = near | far
+        steps = np.where(far, far_interval, 1)
+        alive = ~self.dying & moving
+        self.prev_x[moving] = self.x[moving]
+        self.prev_y[moving] = self.y[moving]
+        self.anim_time[alive] += dt * steps[alive]
+        self.die_time[self.dying] += dt
+
+        dx = self.dir * self.speed * steps
+        x = np.where(alive, round_half_away(self.x + dx), self.x)
+        d = self.dir.copy()
+
+        # ชนกำแพง/แพลตฟอร์ม: ใช้ชิ้นแรกที่ชน (ลำดับเดียวกับ grid.query)
+        hit = boxes_hit(x, self.y, W, H, obs)
+        blocked = hit.any(axis=1) & alive
+        first = hit.argmax(axis=1)
+        right = blocked & (dx > 0)
+        left = blocked & (dx < 0)
+        x = np.where(right, obs[0][first] - W, x)
+        x = np.where(left, obs[2][first], x)
+        d[right] = -1
+        d[left] = 1
+
+        # ขอบด่าน
+        too_left = alive & (x < 0)
+        too_right = alive & (x + W > world_width)
+        x[too_left] = 0
+        d[too_left] = 1
+        x[too_right] = world_width - W
+        d[too_right] = -1
+
+        # ไม่มีพื้นข้างหน้า -> กลับตัว
+        on_ground = boxes_hit(x, self.y + H + 2, W, 6, obs).any(axis=1)
+        turn = alive & ~on_ground
+        d[turn] *= -1
+
+        # ระยะลาดตระเวน
+        d[alive & (x > self.start_x + self.dist)] = -1
+        d[alive & (x < self.start_x)] = 1
+
+        self.x = x
+        self.dir = d
+
+        touching = np.flatnonzero(alive & box_hits_rect(x, self.y, W, H, player_rect))
+        return int(touching[0]) if len(touching) else -1
+
+    def kill_in(self, rect):
+        # หมูที่โดน rect (เช่นระยะฟาด) เริ่มตาย คืนจำนวนตัวที่โดน
+        hit = ~self.dying & box_hits_rect(self.x, self.y, self.W, self.H, rect)
+        count = int(hit.sum())
+        if count:
+            self.dying |= hit
+            AUDIO.play('enemy_death')
+        return count
+
+    def remove_finished(self):
+        # ลบหมูที่เล่นท่าตายจบแล้ว คืนตำแหน่งเหรียญที่ต้องเกิด (xs, ys)
+        done = self.dying & (self.die_time * ANIM_FPS >= len(self.die_frames))
+        if not done.any(): return None
+        coin_x = self.x[done] + self.W // 2 - 12
+        coin_y = self.y[done] + self.H // 2 - 12
+        keep = ~done
+        for name in self.FIELDS:
+            setattr(self, name, getattr(self, name)[keep])
+        return coin_x, coin_y
+
+    def render(self, surf, cam, visible, dirty):
+        W, H = self.W, self.H
+        idx = np.flatnonzero(box_hits_rect(self.x, self.y, W, H, visible))
+        if not len(idx): return
+        x = round_half_away(self.prev_x[idx] + (self.x[idx] - self.prev_x[idx]) * cam.alpha)
+        y = round_half_away(self.prev_y[idx] + (self.y[idx] - self.prev_y[idx]) * cam.alpha)
+        fw, fh = self.run_frames[0].get_size()
+        draw_x = (x + W // 2 - fw // 2 - cam.draw_x).tolist()
+        draw_y = (y + H - fh - cam.draw_y).tolist()
+        run_i = ((self.anim_time[idx] * ANIM_FPS).astype(np.int64) % len(self.run_frames)).tolist()
+        die_i = np.minimum((self.die_time[idx] * ANIM_FPS).astype(np.int64), len(self.die_frames) - 1).tolist()
+        dying = self.dying[idx].tolist()
+        flipped = (self.dir[idx] == 1).tolist()
+        seq = []
+        for k in range(len(draw_x)):
+            if dying[k]: frame = self.die_frames[die_i[k]]
+            elif flipped[k]: frame = self.run_frames_flipped[run_i[k]]
+            else: frame = self.run_frames[run_i[k]]
+            seq.append((frame, (draw_x[k], draw_y[k])))
+        rects = surf.blits(seq, dirty.active)
+        if rects:
+            for r in rects: dirty.add(r)
+
+class CoinArrays:
+    SIZE = 38
+    FIELDS = ('x', 'y', 'prev_x', 'prev_y', 'vel_y', 'life', 'anim')
+
+    def __init__(self, obstacles):
+        self.x = np.zeros(0, dtype=np.int64)
+        self.y = np.zeros(0, dtype=np.int64)
+        self.prev_x = self.x.copy()
+        self.prev_y = self.y.copy()
+        self.vel_y = np.zeros(0)
+        self.life = np.zeros(0)
+        self.anim = np.zeros(0)
+        self.obstacles = obstacle_arrays(obstacles)
+        if Coin.image is None: Coin.load_images()
+
+    def __len__(self):
+        return len(self.x)
+
+    def spawn(self, xs, ys):
+        n = len(xs)
+        self.x = np.concatenate((self.x, xs))
+        self.y = np.concatenate((self.y, ys))
+        self.prev_x = np.concatenate((self.prev_x, xs))
+        self.prev_y = np.concatenate((self.prev_y, ys))
+        self.vel_y = np.concatenate((self.vel_y, np.full(n, -3.0)))
+        self.life = np.concatenate((self.life, np.full(n, COIN_LIFETIME)))
+        self.anim = np.concatenate((self.anim, np.zeros(n)))
+
+    def update(self, dt=SIM_DT):
+        if not len(self.x): return
+        S = self.SIZE
+        obs = self.obstacles
+        self.prev_x[:] = self.x
+        self.prev_y[:] = self.y
+        self.vel_y += 0.2
+        y = self.y + np.trunc(self.vel_y).astype(np.int64)
+
+        # ตกลงบนของ: วางบนชิ้นแรกที่ชน
+        hit = boxes_hit(self.x, y, S, S, obs)
+        land = hit.any(axis=1) & (self.vel_y > 0)
+        first = hit.argmax(axis=1)
+        y = np.where(land, obs[1][first] - S, y)
+        self.vel_y[land] = 0
+        self.y = y
+
+        self.life -= dt
+        self.anim += COIN_BOB_SPEED * dt
+
+    def collect(self, player_rect):
+        # เก็บเหรียญที่ชนผู้เล่น + ลบเหรียญหมดอายุ คืนตำแหน่ง (centerx, y) ของเหรียญที่เก็บได้
+        if not len(self.x): return ()
+        S = self.SIZE
+        picked = box_hits_rect(self.x, self.y, S, S, player_rect)
+        gone = picked | (self.life <= TIMER_EPS)
+        if not gone.any(): return ()
+        spots = list(zip((self.x[picked] + S // 2).tolist(), self.y[picked].tolist()))
+        keep = ~gone
+        for name in self.FIELDS:
+            setattr(self, name, getattr(self, name)[keep])
+        return spots
+
+    def render(self, surf, cam, visible, dirty):
+        S = self.SIZE
+        shown = box_hits_rect(self.x, self.y, S, S, visible)
+        shown &= ~((self.life < COIN_BLINK_TIME - TIMER_EPS) & (self.anim.astype(np.int64) % 2 == 0))
+        idx = np.flatnonzero(shown)
+        if not len(idx): return
+        x = round_half_away(self.prev_x[idx] + (self.x[idx] - self.prev_x[idx]) * cam.alpha) - cam.draw_x
+        y = round_half_away(self.prev_y[idx] + (self.y[idx] - self.prev_y[idx]) * cam.alpha) - cam.draw_y
+        y = y + np.sin(self.anim[idx]) * 3
+        image, glow = Coin.image, Coin.glow_surf
+        xs, ys = x.tolist(), y.tolist()
+        seq = []
+        for k in range(len(xs)):
+            seq.append((glow, (xs[k] + S // 2 - 15, ys[k] + S // 2 - 15)))
+            seq.append((image, (xs[k], ys[k])))
+        rects = surf.blits(seq, dirty.active)
+        if rects:
+            for r in rects: dirty.add(r)
@@ -0,0 +1,288 @@
+import os
+import random
+import multiprocessing
+
+# env ไม่ต้องมีหน้าต่าง/เสียงเลย ต้องตั้งก่อน import settings (settings อ่านค่า HEADLESS ตอน import)
+# ใช้ได้กับ process ลูกของ SubprocVectorEnv ด้วย (import module นี้ใหม่ หรือได้ environ จากตัวแม่)
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('ASGARD_HEADLESS', '1')
+
+import pygame
+
+# numpy ไม่บังคับ: มีแล้วโหมด horde (หมู/เหรียญหลายพันตัว) คำนวณแบบ array ได้
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .settings import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, RED, YELLOW
+from .entities import EnemyArrays, CoinArrays
+from .audio import AUDIO
+from .level import LayoutCache
+from .world import Inputs, World
+
+# --- CLASS: AsgardEnv (environment แบบ gym: reset(seed) / step(action) ไว้เทรนบอท) ---
+# action = index ใน ENV_ACTIONS (ปุ่มชุดเดียวกับ Player), 1 action เดิน frame_skip tick
+# observation:
+#   'features' = เวกเตอร์ float ขนาด ENV_FEATURES: ผู้เล่น, ประตู, หมู/เหรียญที่ใกล้สุด ENV_NEAREST ตัว (ตำแหน่งเทียบกับผู้เล่น)
+#   'pixels'   = ภาพ RGB ขนาด pixel_size (H, W, 3) จาก static layer ย่อ + กล่องสีแทนตัวละคร (ไม่ต้องวาด sprite)
+# มี numpy คืน np.ndarray ไม่มีก็คืน list / bytes
+ENV_ACTIONS = (
+    Inputs(),                          # 0 ยืนเฉยๆ
+    Inputs(left=True),                 # 1
+    Inputs(right=True),                # 2
+    Inputs(jump=True),                 # 3
+    Inputs(left=True, jump=True),      # 4
+    Inputs(right=True, jump=True),     # 5
+    Inputs(attack=True),               # 6
+    Inputs(enter=True),                # 7 เข้าประตู
+)
+ENV_NEAREST = 8
+ENV_FEATURES = 12 + 3 * ENV_NEAREST * 2
+ENV_PIXEL_SIZE = (96, 56)  # (W, H) = จอ 1200x700 ย่อ 12.5 เท่า
+ENV_MAX_STEPS = 4000
+ENV_REWARD_COIN = 1.0
+ENV_REWARD_LEVEL = 10.0
+ENV_REWARD_DEATH = -5.0
+ENV_COLORS = {'door': (0, 255, 255), 'coin': YELLOW, 'enemy': RED, 'dying': (120, 0, 0), 'player': WHITE}
+# seed ของ env สุ่มใหม่ทุก episode -> เก็บ layout แค่ในหน่วยความจำ (จำกัดจำนวน) ไม่เขียน .cache/layouts
+ENV_LAYOUTS = LayoutCache(cache_dir=None)
+
+class AsgardEnv:
+    actions = ENV_ACTIONS
+
+    def __init__(self, obs_type='features', frame_skip=1, max_steps=ENV_MAX_STEPS, horde=0,
+                 pixel_size=ENV_PIXEL_SIZE, seed=None):
+        if obs_type not in ('features', 'pixels'):
+            raise ValueError(f"Unknown obs_type: {obs_type}")
+        self.obs_type = obs_type
+        self.frame_skip = frame_skip
+        self.max_steps = max_steps
+        self.horde = horde
+        self.pixel_size = pixel_size
+        self.rng = random.Random(seed)
+        self.world = None
+        self.steps = 0
+        self.pixels = None
+        AUDIO.disable()  # เผื่อ settings ถูก import ไปแล้วแบบมีเสียง (AUDIO.play ไม่เปิด mixer)
+
+    def reset(self, seed=None):
+        if seed is None: seed = self.rng.randrange(2 ** 31)
+        if self.world is None:
+            self.world = World(seed, horde=self.horde, layouts=ENV_LAYOUTS)
+        # เริ่มจากเมนูเหมือนกด Enter (คะแนน/ด่าน/ผู้เล่นเริ่มใหม่หมด)
+        # tick กลับเป็น 0 ด้วย: หมูไกลจออัปเดตตาม (tick + idx) ไม่งั้น reset(seed) เดิมได้ผลไม่เหมือนเดิม
+        self.world.seed = seed
+        self.world.tick = 0
+        self.world.game_state = "MENU"
+        self.world.step(Inputs(start=True))
+        self.steps = 0
+        return self.observe(), self.info()
+
+    def step(self, action):
+        world = self.world
+        inp = action if isinstance(action, Inputs) else ENV_ACTIONS[action]
+        score, level = world.score, world.cur_level
+        for i in range(self.frame_skip):
+            world.step(inp if i == 0 else inp.held())
+            if world.game_state != "PLAYING": break
+        self.steps += 1
+
+        reward = (world.score - score) * ENV_REWARD_COIN + (world.cur_level - level) * ENV_REWARD_LEVEL
+        if world.game_state == "GAMEOVER": reward += ENV_REWARD_DEATH
+        terminated = world.game_state in ("GAMEOVER", "END_DEMO")
+        truncated = not terminated and self.steps >= self.max_steps
+        return self.observe(), reward, terminated, truncated, self.info()
+
+    def info(self):
+        w = self.world
+        return {'level': w.cur_level, 'score': w.score, 'hp': w.player.hp, 'state': w.game_state, 'seed': w.seed}
+
+    def observe(self):
+        return self.features() if self.obs_type == 'features' else self.render_pixels()
+
+    def features(self):
+        w = self.world
+        p = w.player
+        r = p.rect
+        sw, sh = float(SCREEN_WIDTH), float(SCREEN_HEIGHT)
+        lw, lh = float(w.level.layout.width), float(w.level.layout.height)
+        d = w.door_obj.rect
+        out = [r.x / lw, r.y / lh, p.vel_y / 20.0, float(p.on_ground), p.hp / float(p.max_hp),
+               float(p.flip), float(p.is_attacking), float(p.invincible_timer > 0),
+               (d.centerx - r.centerx) / sw, (d.centery - r.centery) / sh, d.x / lw, d.y / lh]
+
+        cx, cy = r.centerx, r.centery
+        # หมู: (dx, dy, กำลังตาย) เรียงจากใกล้สุด ช่องที่ไม่มีหมูเป็น 0
+        enemies = [(e.rect.centerx - cx, e.rect.centery - cy, float(e.is_dying)) for e in w.enemies]
+        arr = w.enemy_arrays
+        if arr is not None and len(arr):
+            dx = arr.x + arr.W // 2 - cx
+            dy = arr.y + arr.H // 2 - cy
+            near = np.argsort(dx * dx + dy * dy)[:ENV_NEAREST]
+            enemies += [(int(dx[i]), int(dy[i]), float(arr.dying[i])) for i in near]
+        coins = [(c.rect.centerx - cx, c.rect.centery - cy, 1.0) for c in w.coins_list]
+        arr = w.coin_arrays
+        if arr is not None and len(arr):
+            dx = arr.x + arr.SIZE // 2 - cx
+            dy = arr.y + arr.SIZE // 2 - cy
+            near = np.argsort(dx * dx + dy * dy)[:ENV_NEAREST]
+            coins += [(int(dx[i]), int(dy[i]), 1.0) for i in near]
+        for items in (enemies, coins):
+            items.sort(key=lambda t: t[0] * t[0] + t[1] * t[1])
+            for i in range(ENV_NEAREST):
+                if i < len(items):
+                    dx, dy, flag = items[i]
+                    out += (dx / sw, dy / sh, flag)
+                else:
+                    out += (0.0, 0.0, 0.0)
+        return np.array(out, dtype=np.float32) if np is not None else out
+
+    def render_pixels(self):
+        if self.pixels is None:
+            self.pixels = EnvPixelRenderer(self.pixel_size)
+        return self.pixels.render(self.world)
+
+# --- CLASS: EnvPixelRenderer (ภาพเล็กๆ สำหรับ AsgardEnv) ---
+# static layer ของด่านย่อครั้งเดียวตอนเปลี่ยนด่าน แต่ละ step แค่ blit ส่วนที่กล้องเห็น + fill กล่องสี
+class EnvPixelRenderer:
+    def __init__(self, size):
+        self.size = size
+        self.surface = pygame.Surface(size)
+        self.sx = size[0] / SCREEN_WIDTH
+        self.sy = size[1] / SCREEN_HEIGHT
+        self.level = None
+        self.background = None
+
+    def render(self, world):
+        if self.level is not world.level:
+            self.level = world.level
+            static = world.level.static_layer or world.level.prerender()
+            lw, lh = world.level.layout.width, world.level.layout.height
+            self.background = pygame.transform.smoothscale(
+                static.get_surface(), (round(lw * self.sx), round(lh * self.sy)))
+
+        cam = world.camera
+        sx, sy = self.sx, self.sy
+        ox, oy = cam.x * sx, cam.y * sy
+        surf = self.surface
+        surf.blit(self.background, (0, 0), (round(ox), round(oy), self.size[0], self.size[1]))
+
+        def box(rect, color):
+            surf.fill(color, (round(rect.x * sx - ox), round(rect.y * sy - oy),
+                              max(1, round(rect.w * sx)), max(1, round(rect.h * sy))))
+
+        box(world.door_obj.rect, ENV_COLORS['door'])
+        for c in world.coins_list: box(c.rect, ENV_COLORS['coin'])
+        for e in world.enemies: box(e.rect, ENV_COLORS['dying' if e.is_dying else 'enemy'])
+        for arr, w, h in ((world.coin_arrays, CoinArrays.SIZE, CoinArrays.SIZE),
+                          (world.enemy_arrays, EnemyArrays.W, EnemyArrays.H)):
+            if arr is None or not len(arr): continue
+            dying = getattr(arr, 'dying', None)
+            for i in range(len(arr)):
+                color = ENV_COLORS['coin'] if dying is None else ENV_COLORS['dying' if dying[i] else 'enemy']
+                box(pygame.Rect(int(arr.x[i]), int(arr.y[i]), w, h), color)
+        box(world.player.rect, ENV_COLORS['player'])
+
+        data = pygame.image.tobytes(surf, 'RGB')
+        if np is None: return data
+        return np.frombuffer(data, dtype=np.uint8).reshape(self.size[1], self.size[0], 3)
+
+# --- CLASS: VectorEnv (หลาย env เดินพร้อมกันใน process เดียว) ---
+# env ที่จบ (terminated/truncated) reset เองทันที obs ตัวสุดท้ายอยู่ใน info['final_observation']
+class VectorEnv:
+    def __init__(self, num_envs, seed=None, **kwargs):
+        rng = random.Random(seed)
+        self.envs = [AsgardEnv(seed=rng.randrange(2 ** 31), **kwargs) for _ in range(num_envs)]
+        self.num_envs = num_envs
+
+    def reset(self, seeds=None):
+        seeds = seeds if seeds is not None else [None] * self.num_envs
+        results = [env.reset(s) for env, s in zip(self.envs, seeds)]
+        return self.stack([o for o, _ in results]), [info for _, info in results]
+
+    def step(self, actions):
+        obs, rewards, terms, truncs, infos = [], [], [], [], []
+        for env, action in zip(self.envs, actions):
+            o, r, term, trunc, info = env.step(action)
+            if term or trunc:
+                info['final_observation'] = o
+                o, _ = env.reset()
+            obs.append(o)
+            rewards.append(r)
+            terms.append(term)
+            truncs.append(trunc)
+            infos.append(info)
+        if np is not None:
+            rewards, terms, truncs = np.array(rewards, dtype=np.float32), np.array(terms), np.array(truncs)
+        return self.stack(obs), rewards, terms, truncs, infos
+
+    def stack(self, obs):
+        return np.stack(obs) if np is not None and not isinstance(obs[0], bytes) else obs
+
+    def close(self):
+        pass
+
+# --- CLASS: SubprocVectorEnv (VectorEnv กระจายไปหลาย process คุยกันผ่าน Pipe) ---
+# แต่ละ worker ถือ VectorEnv ของตัวเองหลายตัว ส่งงานทีละก้อนต่อ step (ลด overhead ของ pipe)
+def _env_worker(conn, num_envs, seed, kwargs):
+    envs = VectorEnv(num_envs, seed, **kwargs)
+    while True:
+        cmd, data = conn.recv()
+        if cmd == 'step':
+            conn.send(envs.step(data))
+        elif cmd == 'reset':
+            conn.send(envs.reset(data))
+        elif cmd == 'close':
+            conn.close()
+            return
+
+class SubprocVectorEnv:
+    def __init__(self, num_envs, workers=None, seed=None, **kwargs):
+        workers = max(1, min(num_envs, workers or os.cpu_count() or 1))
+        rng = random.Random(seed)
+        counts = [num_envs // workers + (1 if i < num_envs % workers else 0) for i in range(workers)]
+        self.num_envs = num_envs
+        self.slices = []
+        self.conns = []
+        self.procs = []
+        start = 0
+        for count in counts:
+            parent, child = multiprocessing.Pipe()
+            proc = multiprocessing.Process(target=_env_worker, args=(child, count, rng.randrange(2 ** 31), kwargs),
+                                           daemon=True)
+            proc.start()
+            child.close()
+            self.conns.append(parent)
+            self.procs.append(proc)
+            self.slices.append((start, start + count))
+            start += count
+
+    def reset(self, seeds=None):
+        for conn, (a, b) in zip(self.conns, self.slices):
+            conn.send(('reset', seeds[a:b] if seeds is not None else None))
+        results = [conn.recv() for conn in self.conns]
+        return self.concat([r[0] for r in results]), [i for r in results for i in r[1]]
+
+    def step(self, actions):
+        actions = list(actions)
+        for conn, (a, b) in zip(self.conns, self.slices):
+            conn.send(('step', actions[a:b]))
+        results = [conn.recv() for conn in self.conns]
+        obs, rewards, terms, truncs = [self.concat([r[k] for r in results]) for k in range(4)]
+        return obs, rewards, terms, truncs, [i for r in results for i in r[4]]
+
+    def concat(self, parts):
+        if np is not None and isinstance(parts[0], np.ndarray):
+            return np.concatenate(parts)
+        return [x for part in parts for x in part]
+
+    def close(self):
+        for conn in self.conns:
+            try:
+                conn.send(('close', None))
+            except:
+                pass
+        for proc in self.procs:
+            proc.join(timeout=1)
@@ -0,0 +1,304 @@
+import sys
+import time
+import pygame
+
+from . import IMPORT_STARTED
+from .settings import (HEADLESS, DISPLAY, SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLACK, YELLOW, MAX_LEVELS,
+                       SIM_DT, FPS, MAX_FRAME_DT, MAX_SIM_STEPS, STARTUP_BUDGET_MS)
+from .assets import load_safe_image
+from .graphics import FONTS, HudText, DirtyRectRenderer, render_text, CULL_MARGIN
+from .audio import AUDIO
+from .profiler import PROFILER
+from .level import generate_layouts
+from .world import Inputs, World, run_headless
+from .replay import InputRecorder, Replay
+from .batch import BATCH_MAX_TICKS, run_batch, batch_report, print_batch_report, write_batch_report
+
+# --- CLASS: GameRenderer (วาด World ลงจอ) ---
+class GameRenderer:
+    def __init__(self, screen):
+        self.screen = screen
+        self.static_layer = None
+        self.dirty = DirtyRectRenderer()
+        self.score_hud = HudText(FONTS.get('main'), YELLOW, "Coins: {}")
+        self.level_hud = HudText(FONTS.get('small'), WHITE, "Level: {}/{}")
+        self.level_serial = None
+        self.cam_pos = None
+        self.heart_img = load_safe_image('assets/lives_coins/health_bar.png', (255, 0, 0), (30, 30))
+        # ม่านดำโปร่งแสงของหน้า GAMEOVER/END_DEMO สร้างครั้งเดียว เปลี่ยนแค่ alpha
+        self.shade = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.shade.fill((0, 0, 0))
+
+    def sync_level(self, world):
+        # world ที่ยังอยู่เมนูครั้งแรกยังไม่มีด่าน
+        if world.level is not None and self.level_serial != world.level_serial:
+            self.level_serial = world.level_serial
+            # ด่านที่ prefetch มามี static layer วาดเสร็จแล้ว ไม่งั้นวาดตอนนี้
+            self.static_layer = world.level.static_layer or world.level.prerender()
+            self.dirty.invalidate()
+
+    def render(self, world, alpha=1.0):
+        # alpha = ตำแหน่งระหว่าง step ก่อนหน้ากับ step ล่าสุด (ดู main loop)
+        screen = self.screen
+        dirty = self.dirty
+        game_state = world.game_state
+        player = world.player
+        door_obj = world.door_obj
+        cam = world.camera
+        # นอกจากตอนเล่น world ไม่ได้ step -> วาดตำแหน่งล่าสุดนิ่งๆ
+        cam.interpolate(alpha if game_state == "PLAYING" else 1.0)
+        self.sync_level(world)
+
+        if game_state == "MENU":
+            screen.fill(BLACK)
+
+            title_txt = render_text(FONTS.get('main'), "Asgard King Ood", (255, 215, 0))
+            sub_txt = render_text(FONTS.get('small'), "Press ENTER to Start", WHITE)
+            screen.blit(title_txt, (SCREEN_WIDTH//2 - title_txt.get_width()//2, SCREEN_HEIGHT//2 - 50))
+            screen.blit(sub_txt, (SCREEN_WIDTH//2 - sub_txt.get_width()//2, SCREEN_HEIGHT//2 + 20))
+            self.present(False)
+            return
+
+        # พื้นหลัง + ของตกแต่ง + แพลตฟอร์ม + กล่อง (วาดไว้แล้วใน static_layer)
+        prof = PROFILER
+        prof.lap('misc')
+        use_dirty = dirty.enabled and game_state == "PLAYING"
+        if (cam.draw_x, cam.draw_y) != self.cam_pos:
+            # กล้องขยับ = พื้นหลังเลื่อนทั้งจอ -> dirty rect ช่วยไม่ได้ วาดเต็มจอ
+            self.cam_pos = (cam.draw_x, cam.draw_y)
+            dirty.invalidate()
+        if use_dirty:
+            dirty.begin(screen, self.static_layer.view(cam))
+        else:
+            self.static_layer.render(screen, cam)
+        prof.lap('render.static')
+
+        # วาดเฉพาะของที่อยู่ในจอ (+ ขอบ)
+        visible = cam.view_rect(CULL_MARGIN)
+        if visible.colliderect(door_obj.rect): dirty.add(door_obj.render(screen, cam))
+        
+        for c in world.coins_list:
+            if visible.colliderect(c.rect): dirty.add(c.render(screen, cam))
+        if world.coin_arrays is not None: world.coin_arrays.render(screen, cam, visible, dirty)
+
+        for e in world.enemies:
+            if visible.colliderect(e.rect): dirty.add(e.render(screen, cam))
+        if world.enemy_arrays is not None: world.enemy_arrays.render(screen, cam, visible, dirty)
+        dirty.add(player.render(screen, cam))
+
+        for t in world.floating_texts: dirty.add(t.render(screen, cam))
+        prof.lap('render.entities')
+
+        for i in range(player.hp):
+            dirty.add(screen.blit(self.heart_img, (SCREEN_WIDTH - 40 - (i * 35), 20)))
+        
+        dirty.add(self.score_hud.render(screen, (20, 20), world.score))
+        dirty.add(self.level_hud.render(screen, (20, 55), world.cur_level, MAX_LEVELS))
+
+        if game_state == "PLAYING" and player.rect.colliderect(door_obj.rect) and not player.door_target:
+            help_txt = render_text(FONTS.get('main'), "Press SPACEBAR", (255, 255, 0))
+            dirty.add(screen.blit(help_txt, (door_obj.rect.x - 50 - cam.draw_x, door_obj.rect.y - 40 - cam.draw_y)))
+        prof.lap('render.hud')
+
+        if game_state == "GAMEOVER":
+            self.shade.set_alpha(200)
+            screen.blit(self.shade, (0, 0))
+            
+            msg1 = render_text(FONTS.get('main'), "YOU DIED", (255, 50, 50))
+            msg2 = render_text(FONTS.get('small'), "Press 'R' to Respawn", WHITE)
+            msg3 = render_text(FONTS.get('small'), "Press 'Q' to Quit", (200, 200, 200))
+            
+            screen.blit(msg1, (SCREEN_WIDTH//2 - msg1.get_width()//2, SCREEN_HEIGHT//2 - 60))
+            screen.blit(msg2, (SCREEN_WIDTH//2 - msg2.get_width()//2, SCREEN_HEIGHT//2))
+            screen.blit(msg3, (SCREEN_WIDTH//2 - msg3.get_width()//2, SCREEN_HEIGHT//2 + 40))
+
+        if game_state == "END_DEMO":
+            self.shade.set_alpha(220)
+            screen.blit(self.shade, (0, 0))
+            
+            end_msg = render_text(FONTS.get('main'), "END DEMO", (255, 215, 0))
+            sub_msg = render_text(FONTS.get('small'), f"Total Coins: {world.score}", YELLOW)
+            quit_msg = render_text(FONTS.get('small'), "Press 'Q' to Quit", (200, 200, 200))
+            
+            screen.blit(end_msg, (SCREEN_WIDTH//2 - end_msg.get_width()//2, SCREEN_HEIGHT//2 - 50))
+            screen.blit(sub_msg, (SCREEN_WIDTH//2 - sub_msg.get_width()//2, SCREEN_HEIGHT//2 + 10))
+            screen.blit(quit_msg, (SCREEN_WIDTH//2 - quit_msg.get_width()//2, SCREEN_HEIGHT//2 + 50))
+
+        self.present(use_dirty)
+
+    def present(self, use_dirty):
+        prof = PROFILER
+        if prof.show_overlay:
+            self.dirty.add(prof.render_overlay(self.screen))
+        prof.lap('render.overlay')
+        if use_dirty:
+            self.dirty.present()
+        else:
+            pygame.display.flip()
+            self.dirty.invalidate()
+        prof.lap('display.flip')
+
+def get_arg(name, default=None):
+    if name in sys.argv:
+        idx = sys.argv.index(name)
+        if idx + 1 < len(sys.argv): return sys.argv[idx + 1]
+    return default
+
+# --- Main Loop ---
+# --- สุ่ม layout หลายพัน seed บนทุก core แล้วสรุปผล (--layouts N) ---
+def run_layout_survey(num_seeds, workers=None):
+    jobs = [(lvl, seed) for seed in range(num_seeds) for lvl in range(1, MAX_LEVELS + 1)]
+    t0 = time.perf_counter()
+    layouts = generate_layouts(jobs, workers)
+    elapsed = time.perf_counter() - t0
+
+    total = len(layouts)
+    short_path = sum(1 for l in layouts if l.stats['intermediate_placed'] < l.stats['path_expected'] - 2)
+    no_approach = sum(1 for l in layouts if not l.stats['approach_placed'])
+    few_enemies = sum(1 for l in layouts if l.stats['enemies'] < l.stats['enemies_wanted'])
+    regenerated = sum(1 for l in layouts if l.stats['attempts'] > 1)
+    unreachable = sum(1 for l in layouts if not l.stats['reachable'])
+    print(f"{total} layouts in {elapsed:.2f}s ({total / max(elapsed, 1e-9):.0f} layouts/s)")
+    print(f"  path platforms missing : {short_path} ({short_path * 100 / total:.1f}%)")
+    print(f"  approach not placed    : {no_approach} ({no_approach * 100 / total:.1f}%)")
+    print(f"  fewer enemies than want: {few_enemies} ({few_enemies * 100 / total:.1f}%)")
+    print(f"  regenerated (no path)  : {regenerated} ({regenerated * 100 / total:.1f}%)")
+    print(f"  door unreachable       : {unreachable} ({unreachable * 100 / total:.1f}%)")
+    return layouts
+
+def print_summary(world, ticks, elapsed):
+    print(f"{ticks} ticks in {elapsed:.2f}s ({ticks / max(elapsed, 1e-9):.0f} ticks/s), "
+          f"level {world.cur_level}, coins {world.score}, state {world.game_state}")
+
+def main():
+    import_ms = (time.perf_counter() - IMPORT_STARTED) * 1000
+    # --startup-check: วาดเมนูเฟรมแรกแล้วออกเลย exit 1 ถ้าช้ากว่า STARTUP_BUDGET_MS
+    startup_check = '--startup-check' in sys.argv
+    replay_path = get_arg('--replay')
+    # --speed: 1 = เวลาจริง, 10 = เร็ว 10 เท่า, 0 = เร็วที่สุดเท่าที่ทำได้ (headless เป็น 0 เสมอ)
+    speed = float(get_arg('--speed', 1))
+    # --fps: เพดานเฟรมวาด (ไม่เกี่ยวกับความเร็วเกม ฟิสิกส์เดินที่ SIM_HZ เสมอ) 0 = ไม่จำกัด
+    render_fps = int(get_arg('--fps', FPS))
+    # --profile-out ไฟล์.csv/.json: เปิด profiler แล้ว dump เวลาทุกเฟรมตอนจบ (F4 = dump ระหว่างเล่น)
+    profile_out = get_arg('--profile-out')
+    if profile_out: PROFILER.enabled = True
+    # --horde N: เพิ่มหมู N ตัวทุกด่าน (เยอะพอ + มี numpy จะใช้ EnemyArrays/CoinArrays)
+    horde = int(get_arg('--horde', 0))
+
+    if get_arg('--layouts'):
+        workers = get_arg('--workers')
+        run_layout_survey(int(get_arg('--layouts')), int(workers) if workers else None)
+        return
+
+    # --batch N: เล่นทั้งเกม N รอบบน process pool ด้วยบอท (หรือ --replay ไฟล์) แล้วสรุปผล
+    #   --max-ticks จำกัดความยาวต่อ session, --seed seed แรก, --report ไฟล์.json/.csv
+    if get_arg('--batch'):
+        workers = get_arg('--workers')
+        results, elapsed = run_batch(int(get_arg('--batch')), int(workers) if workers else None, replay_path,
+                                     int(get_arg('--max-ticks', BATCH_MAX_TICKS)), horde, int(get_arg('--seed', 0)))
+        report = batch_report(results, elapsed)
+        print_batch_report(report)
+        report_path = get_arg('--report')
+        if report_path: write_batch_report(report_path, report, results)
+        return
+
+    if HEADLESS:
+        if replay_path:
+            replay = Replay.load(replay_path)
+            inputs = replay.inputs()
+            world, elapsed = run_headless(len(replay), lambda w: next(inputs), replay.new_world())
+            print_summary(world, len(replay), elapsed)
+        else:
+            ticks = int(get_arg('--ticks', 10000))
+            world, elapsed = run_headless(ticks, world=World(horde=horde))
+            print_summary(world, ticks, elapsed)
+        if profile_out: PROFILER.dump(profile_out)
+        return
+
+    replay = Replay.load(replay_path) if replay_path else None
+    replay_inputs = replay.inputs() if replay else None
+    renderer = GameRenderer(DISPLAY.get())
+    world = replay.new_world(prefetch=True) if replay else World(prefetch=True, horde=horde)
+
+    clock = pygame.time.Clock()
+    record_path = get_arg('--record')
+    recorder = InputRecorder(world.seed, world.horde) if record_path else None
+    t0 = time.perf_counter()
+    # Fixed timestep: สะสมเวลาจริงของแต่ละเฟรมไว้ แล้วเดิน World ทีละ SIM_DT จนกว่าจะตามทัน
+    # เฟรมช้า = เดินหลาย step, เฟรมเร็วกว่า SIM_HZ = อาจไม่เดินเลย แล้ววาดแบบ interpolate ระหว่าง 2 step ล่าสุด
+    accumulator = 0.0
+    frame_dt = SIM_DT
+    pending = Inputs()  # ปุ่มที่ยังไม่มี step ไหนรับไป
+    if replay and speed == 0:
+        frame_cap = 0
+    else:
+        frame_cap = render_fps
+    max_steps = MAX_SIM_STEPS * max(1, int(speed)) if replay else MAX_SIM_STEPS
+
+    prof = PROFILER
+    while True:
+        prof.begin_frame()
+        events = pygame.event.get()
+        for event in events:
+            if event.type == pygame.QUIT:
+                if recorder: recorder.save(record_path)
+                if profile_out: prof.dump(profile_out)
+                world.prefetcher.shutdown()
+                pygame.quit()
+                sys.exit()
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F2:
+                    renderer.dirty.toggle()
+                elif event.key == pygame.K_F3:
+                    prof.toggle_overlay()
+                elif event.key == pygame.K_F4:
+                    prof.dump(profile_out or 'profile.json')
+        prof.lap('events')
+
+        if replay:
+            # เล่น replay: เร็ว speed เท่าของเวลาจริง (speed 0 = เฟรมละ tick แต่ไม่จำกัดเฟรม)
+            accumulator = accumulator + frame_dt * speed if speed > 0 else SIM_DT
+        else:
+            pending = pending.merged(Inputs.from_pygame(events))
+            accumulator += frame_dt
+
+        steps = 0
+        while accumulator >= SIM_DT and steps < max_steps:
+            accumulator -= SIM_DT
+            steps += 1
+            if replay:
+                inp = next(replay_inputs, None)
+                if inp is None:
+                    print_summary(world, len(replay), time.perf_counter() - t0)
+                    if profile_out: prof.dump(profile_out)
+                    world.prefetcher.shutdown()
+                    pygame.quit()
+                    return
+            else:
+                inp = pending
+                pending = pending.held()
+                if recorder: recorder.record(inp)
+            world.step(inp, SIM_DT)
+        if steps == max_steps:
+            # ตามไม่ทันจริงๆ -> ทิ้งเวลาที่ค้าง (เกมช้าลงชั่วคราว ดีกว่าค้างไปเรื่อยๆ)
+            accumulator = min(accumulator, SIM_DT)
+
+        prof.lap('misc')
+        renderer.render(world, min(1.0, accumulator / SIM_DT))
+        if startup_check:
+            # วัดเวลาตั้งแต่เริ่ม import package จนเมนูเฟรมแรกขึ้นจอ
+            startup_ms = (time.perf_counter() - IMPORT_STARTED) * 1000
+            print(f"Startup: import {import_ms:.0f} ms, first frame {startup_ms:.0f} ms (budget {STARTUP_BUDGET_MS} ms)")
+            world.prefetcher.shutdown()
+            pygame.quit()
+            sys.exit(0 if startup_ms <= STARTUP_BUDGET_MS else 1)
+
+        # --- [เพิ่มใหม่] เล่นเพลงตอนอยู่เมนู/ตอนเล่น หยุดเพลงตอนตาย/จบเกม ---
+        # ทำหลังวาด: เฟรมแรกขึ้นจอได้ก่อนเปิด mixer/โหลดเสียง
+        if world.game_state in ("MENU", "PLAYING"):
+            AUDIO.play_music()
+        else:
+            AUDIO.stop_music()
+        prof.lap('audio')
+        prof.end_frame()
+        frame_dt = min(clock.tick(frame_cap) / 1000.0, MAX_FRAME_DT)
@@ -0,0 +1,297 @@
+import os
+from collections import OrderedDict
+import pygame
+
+from .settings import DISPLAY, BLACK, ANIM_FPS
+from .assets import FRAMES
+
+# --- CLASS: Fonts (โหลดฟอนต์ตอนใช้ครั้งแรก) ---
+# ใช้ฟอนต์ที่มากับเกม (Monocraft) -> ภาพเหมือนกันทุกเครื่อง ไม่ต้องสแกนฟอนต์ในเครื่อง
+# FreeType วาดทั้งบรรทัดเร็วกว่า blit ทีละตัวจาก atlas -> ข้อความที่ซ้ำให้ TextCache เก็บไว้ ไม่ต้องวาดใหม่
+# ถ้าไฟล์หาย/โหลดไม่ได้ ค่อยใช้ SysFont แบบเดิม
+FONT_PATH = 'assets/Monocraft.ttf'
+FALLBACK_FONT = 'Arial'
+FONT_SPECS = {
+    # ชื่อ: (ขนาด, ตัวหนา)
+    'main': (30, True),
+    'small': (20, False),
+}
+
+class Fonts:
+    def __init__(self, path=FONT_PATH, specs=FONT_SPECS):
+        self.path = path
+        self.specs = specs
+        self.fonts = {}
+
+    def get(self, name):
+        font = self.fonts.get(name)
+        if font is None:
+            if not pygame.font.get_init(): pygame.font.init()
+            size, bold = self.specs[name]
+            font = self.load(size, bold)
+            self.fonts[name] = font
+        return font
+
+    def load(self, size, bold):
+        if os.path.exists(self.path):
+            try:
+                font = pygame.font.Font(self.path, size)
+                font.set_bold(bold)
+                return font
+            except Exception as e:
+                print(f"Error loading font {self.path}: {e}")
+        return pygame.font.SysFont(FALLBACK_FONT, size, bold=bold)
+
+FONTS = Fonts()
+
+# --- CLASS: TextCache (เก็บ Surface ตัวหนังสือที่ render แล้ว) ---
+TEXT_CACHE_SIZE = 256
+
+class TextCache:
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, tuple(color), antialias)
+        surf = self.entries.get(key)
+        if surf is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return surf
+
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        self.entries[key] = surf
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surf
+
+TEXTS = TextCache()
+
+# --- Helper: render ตัวหนังสือผ่าน cache (Surface ที่ได้ใช้ร่วมกัน ห้ามแก้ค้างไว้) ---
+def render_text(font, text, color, antialias=True):
+    return TEXTS.render(font, text, color, antialias)
+
+# --- CLASS: HudText (ตัวหนังสือ HUD ที่ render ใหม่เฉพาะตอนค่าเปลี่ยน) ---
+class HudText:
+    def __init__(self, font, color, fmt):
+        self.font = font
+        self.color = color
+        self.fmt = fmt
+        self.values = None
+        self.image = None
+
+    def render(self, surf, pos, *values):
+        if values != self.values:
+            self.values = values
+            self.image = render_text(self.font, self.fmt.format(*values), self.color)
+        return surf.blit(self.image, pos)
+
+# --- CLASS: Animation ---
+class Animation:
+    def __init__(self, img, frame_size, frame_count, loop=True, scale_to=None, fps=ANIM_FPS):
+        self.loop = loop
+        self.fps = fps
+        self.status = "playing"
+        self.sheet = (img, frame_size, frame_count, scale_to)
+        self.frames = FRAMES.get_frames(img, frame_size, frame_count, scale_to)
+        self.flipped_frames = None  # ขอจาก atlas ตอนต้องใช้ครั้งแรก
+
+        self.index = 0
+
+    def update(self, dt):
+        # เดินเฟรมตามเวลา (เรียกจาก update ของเจ้าของ ไม่ใช่ตอน render)
+        if self.status == "done": return
+        count = len(self.frames)
+        self.index += dt * self.fps
+        if self.index >= count:
+            if self.loop:
+                self.index %= count
+            else:
+                self.index = count - 1
+                self.status = "done"
+
+    def get_frame(self, flip=False):
+        frames = self.frames
+        if flip:
+            if self.flipped_frames is None:
+                self.flipped_frames = FRAMES.get_frames(*self.sheet, flipped=True)
+            frames = self.flipped_frames
+        return frames[int(self.index)]
+
+    def reset(self):
+        self.index = 0
+        self.status = "playing"
+
+# --- CLASS: AnimationManager ---
+class AnimationManager:
+    def __init__(self, animations):
+        self.animations = animations
+        self.state = 'idle'
+
+    def set_state(self, state):
+        if state not in self.animations:
+            if 'idle' in self.animations: state = 'idle'
+            else: return
+                
+        if self.state != state:
+            self.state = state
+            self.animations[self.state].reset()
+
+    def update(self, dt):
+        self.animations[self.state].update(dt)
+
+    def get_frame(self, flip=False):
+        return self.animations[self.state].get_frame(flip)
+
+    def is_done(self):
+        return self.animations[self.state].status == "done"
+
+# --- CLASS: Camera (มุมกล้องที่ตามผู้เล่นในด่านที่กว้างกว่าจอ) ---
+# ตำแหน่งทุกอย่างใน World เป็นพิกัดโลก ตอนวาดค่อยลบ cam.draw_x / cam.draw_y
+# x/y = ตำแหน่งหลัง step ล่าสุด, draw_x/draw_y = ตำแหน่งที่ interpolate ระหว่าง 2 step ล่าสุดตาม alpha
+CULL_MARGIN = 64          # วาดเฉพาะของที่อยู่ในจอ + ขอบเท่านี้ (ภาพใหญ่กว่า rect ชนนิดหน่อย)
+ACTIVE_MARGIN = 400       # หมูที่อยู่ห่างขอบจอไม่เกินนี้อัปเดตทุก tick
+FAR_UPDATE_INTERVAL = 4   # หมูที่ไกลกว่านั้นอัปเดตทุกกี่ tick
+
+class Camera:
+    def __init__(self, view_w, view_h):
+        self.x = self.y = 0
+        self.prev_x = self.prev_y = 0
+        self.draw_x = self.draw_y = 0
+        self.alpha = 1.0
+        self.view_w = view_w
+        self.view_h = view_h
+        self.world_w = view_w
+        self.world_h = view_h
+
+    def set_world(self, world_w, world_h):
+        self.world_w = world_w
+        self.world_h = world_h
+        self.x = self.y = 0
+        self.snap()
+
+    def follow(self, rect):
+        # ให้ผู้เล่นอยู่กลางจอ แต่ไม่เลยขอบด่าน
+        self.prev_x, self.prev_y = self.x, self.y
+        x = rect.centerx - self.view_w // 2
+        y = rect.centery - self.view_h // 2
+        self.x = max(0, min(x, self.world_w - self.view_w))
+        self.y = max(0, min(y, self.world_h - self.view_h))
+
+    def snap(self):
+        # ตัดภาพ (เปลี่ยนด่าน/เกิดใหม่) ไม่ต้องเลื่อนกล้องมาจากตำแหน่งเดิม
+        self.prev_x, self.prev_y = self.x, self.y
+        self.draw_x, self.draw_y = self.x, self.y
+
+    def interpolate(self, alpha):
+        # alpha = สัดส่วนเวลาที่เลย step ล่าสุดไปแล้ว (0..1) เรียกก่อนวาดทุกเฟรม
+        self.alpha = alpha
+        self.draw_x = round(self.lerp(self.prev_x, self.x))
+        self.draw_y = round(self.lerp(self.prev_y, self.y))
+
+    def lerp(self, prev, cur):
+        return prev + (cur - prev) * self.alpha
+
+    def view_rect(self, margin=0, out=None):
+        # out = Rect ที่จะเขียนทับ (เรียกทุก tick ไม่ต้องสร้าง Rect ใหม่)
+        if out is None: out = pygame.Rect(0, 0, 0, 0)
+        out.update(self.x - margin, self.y - margin, self.view_w + margin * 2, self.view_h + margin * 2)
+        return out
+
+# --- CLASS: StaticLayer (วาดพื้นหลัง/ของตกแต่ง/แพลตฟอร์ม/กล่อง รวมไว้ในภาพเดียว) ---
+# ของพวกนี้ไม่ขยับหลัง build_level แล้ว เลยวาดครั้งเดียวต่อด่าน (ขนาดเท่าทั้งด่าน)
+# แต่ละเฟรม blit เฉพาะส่วนที่กล้องเห็นทีเดียวทั้งจอ
+class StaticLayer:
+    def __init__(self, size):
+        DISPLAY.get()  # convert ต้องมีจอก่อน
+        self.surface = pygame.Surface(size).convert()
+        self.bg_img = None
+        self.decorations = []
+        self.platforms = []
+        self.boxes = []
+        self.dirty = True
+
+    def set_level(self, bg_img, decorations, platforms, boxes):
+        self.bg_img = bg_img
+        self.decorations = decorations
+        self.platforms = platforms
+        self.boxes = boxes
+        self.dirty = True
+
+    def invalidate(self):
+        # เรียกเมื่อของนิ่งในด่านเปลี่ยน (เพิ่ม/ลบ/ย้าย) ให้วาดใหม่ตอนเฟรมถัดไป
+        self.dirty = True
+
+    def rebuild(self):
+        self.surface.fill(BLACK)
+        if self.bg_img and self.bg_img.get_width() > 0:
+            # ภาพพื้นหลังขนาดเท่าจอ ปูต่อกันไปจนสุดด่าน
+            for x in range(0, self.surface.get_width(), self.bg_img.get_width()):
+                self.surface.blit(self.bg_img, (x, 0))
+        for dec in self.decorations: dec.render(self.surface)
+        for p in self.platforms: p.render(self.surface)
+        for b in self.boxes: b.render(self.surface)
+        self.dirty = False
+
+    def get_surface(self):
+        if self.dirty: self.rebuild()
+        return self.surface
+
+    def view(self, cam):
+        # ส่วนที่กล้องเห็น (subsurface ไม่ได้ copy pixel)
+        return self.get_surface().subsurface((cam.draw_x, cam.draw_y, cam.view_w, cam.view_h))
+
+    def render(self, surf, cam):
+        surf.blit(self.get_surface(), (0, 0), (cam.draw_x, cam.draw_y, cam.view_w, cam.view_h))
+
+# --- CLASS: DirtyRectRenderer (อัปเดตจอเฉพาะบริเวณที่มีของขยับ) ---
+# แต่ละเฟรม: คืนพื้นหลังจาก static layer เฉพาะ rect ที่วาดไว้เฟรมก่อน -> วาดของที่ขยับ
+# -> ส่งเฉพาะ rect เก่า+ใหม่ ไปที่ pygame.display.update() แทน flip ทั้งจอ
+DIRTY_RECT_RENDERING = False  # กด F2 ระหว่างเล่นเพื่อสลับโหมด
+
+class DirtyRectRenderer:
+    def __init__(self, enabled=DIRTY_RECT_RENDERING):
+        self.enabled = enabled
+        self.prev_rects = []
+        self.rects = []
+        self.needs_full = True
+        self.full_frame = True
+        self.active = False  # อยู่ระหว่าง begin() กับ present() ไหม (โหมดปกติไม่ต้องเก็บ rect)
+
+    def invalidate(self):
+        # ฉากเปลี่ยนทั้งจอ (เปลี่ยนด่าน/เปลี่ยน state/สลับโหมด/กล้องขยับ) -> เฟรมถัดไปวาดเต็มจอ
+        self.needs_full = True
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.invalidate()
+
+    def begin(self, screen, background):
+        self.full_frame = self.needs_full
+        self.needs_full = False
+        # self.rects ตอนนี้ = rect ที่วาดไว้เฟรมก่อน -> คืนพื้นหลังตรงนั้น
+        if self.full_frame:
+            screen.blit(background, (0, 0))
+        else:
+            for r in self.rects:
+                screen.blit(background, r, r)
+        # สลับลิสต์สองใบไปมา ไม่สร้างลิสต์ใหม่ทุกเฟรม
+        self.prev_rects, self.rects = self.rects, self.prev_rects
+        self.rects.clear()
+        self.active = True
+
+    def add(self, rect):
+        if rect and self.active: self.rects.append(rect)
+
+    def present(self):
+        # prev_rects ตอนนี้ = rect ของเฟรมก่อน (ถูกลบด้วยพื้นหลังแล้ว) ต้องอัปเดตด้วย
+        if self.full_frame:
+            pygame.display.flip()
+        else:
+            self.prev_rects.extend(self.rects)
+            pygame.display.update(self.prev_rects)
+        self.active = False
@@ -0,0 +1,739 @@
+import os
+import json
+import hashlib
+import random
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import pygame
+
+from .settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from .assets import load_safe_image
+from .graphics import StaticLayer
+from .entities import Platform, Decoration, Door, Box, Enemy
+
+# --- CLASS: SpatialHash (กริดสำหรับหา obstacle ที่อยู่ใกล้ rect) ---
+# สร้างครั้งเดียวต่อด่านจากของนิ่ง (แพลตฟอร์ม/กำแพง/กล่อง) แล้วใช้ร่วมกันทั้ง Player, Enemy, Coin
+SPATIAL_CELL_SIZE = 128
+
+class SpatialHash:
+    def __init__(self, cell_size=SPATIAL_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.items = []
+        self.found = []   # ผลของ query ล่าสุด (ลิสต์เดิมทุกครั้ง ไม่สร้างลิสต์ใหม่ทุก tick)
+        self.order = []   # index ที่เจอ ใช้ตอน rect คร่อมหลายช่อง
+
+    def cell_range(self, rect):
+        cs = self.cell_size
+        x0, y0 = rect.left // cs, rect.top // cs
+        x1 = max(rect.left, rect.right - 1) // cs
+        y1 = max(rect.top, rect.bottom - 1) // cs
+        return x0, y0, x1, y1
+
+    def insert(self, item, rect=None):
+        if rect is None: rect = item.rect
+        order = len(self.items)
+        self.items.append(item)
+        x0, y0, x1, y1 = self.cell_range(rect)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                self.cells.setdefault((cx, cy), []).append(order)
+
+    def query(self, rect):
+        # ของที่อยู่ในช่องเดียวกับ rect เรียงตามลำดับที่ insert (ผลเหมือนวนลิสต์ obstacles เดิม)
+        # ผู้เรียกต้อง colliderect เองอีกที และใช้ผลให้เสร็จก่อน query ครั้งถัดไป (คืน self.found ตัวเดิม)
+        x0, y0, x1, y1 = self.cell_range(rect)
+        cells = self.cells
+        items = self.items
+        found = self.found
+        found.clear()
+        if x0 == x1 and y0 == y1:
+            for i in cells.get((x0, y0), ()):
+                found.append(items[i])
+            return found
+        order = self.order
+        order.clear()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                order.extend(cells.get((cx, cy), ()))
+        order.sort()
+        last = -1
+        for i in order:
+            if i != last:
+                found.append(items[i])
+                last = i
+        return found
+
+    def clear(self):
+        self.cells.clear()
+        self.items.clear()
+        self.found.clear()
+
+def build_obstacle_grid(obstacles):
+    grid = SpatialHash()
+    for obj in obstacles: grid.insert(obj)
+    return grid
+
+# --- Helper ตรวจสอบการซ้อนทับ ---
+def check_overlap(new_rect, existing_rects, margin=40):
+    check_rect = new_rect.inflate(margin * 2, margin * 2)
+    for r in existing_rects:
+        if check_rect.colliderect(r):
+            return True
+    return False
+
+# --- CLASS: OccupancyGrid (ดัชนีพื้นที่ที่ถูกจองแล้ว ใช้ตอนวางของใน generate_layout) ---
+# แทน check_overlap ที่ต้องไล่ทุก rect: ดูเฉพาะช่องกริดรอบๆ rect ที่ขยายด้วย margin
+class OccupancyGrid(SpatialHash):
+    def add(self, rect):
+        self.insert(rect, rect)
+
+    def is_free(self, rect, margin=0):
+        check_rect = rect.inflate(margin * 2, margin * 2)
+        x0, y0, x1, y1 = self.cell_range(check_rect)
+        cells = self.cells
+        items = self.items
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                for idx in cells.get((cx, cy), ()):
+                    if check_rect.colliderect(items[idx]):
+                        return False
+        return True
+
+    def free_spans(self, x_min, x_max, y, w, h, margin=0):
+        # ช่วงของ x (ซ้ายของ rect ขนาด w*h ที่แถว y) ที่วางได้โดยไม่ชนของเดิม -> [(lo, hi), ...] รวมปลายทั้งสองข้าง
+        row = pygame.Rect(x_min - margin, y - margin, (x_max - x_min) + w + margin * 2, h + margin * 2)
+        blocked = []
+        for r in self.query(row):
+            if row.top < r.bottom and r.top < row.bottom:
+                # rect ที่ x ชน r เมื่อ r.left - margin - w < x < r.right + margin
+                blocked.append((r.left - margin - w + 1, r.right + margin - 1))
+        blocked.sort()
+        spans = []
+        lo = x_min
+        for b_lo, b_hi in blocked:
+            if b_hi < lo: continue
+            if b_lo > x_max: break
+            if b_lo > lo: spans.append((lo, b_lo - 1))
+            lo = max(lo, b_hi + 1)
+        if lo <= x_max: spans.append((lo, x_max))
+        return spans
+
+    def sample_free(self, rng, x_min, x_max, y, w, h, margin=0):
+        # สุ่ม x จากช่วงที่ว่างจริงๆ เลย (สุ่มครั้งเดียว ไม่ต้องสุ่มแล้วทิ้ง) ไม่มีที่ว่าง = None
+        spans = self.free_spans(x_min, x_max, y, w, h, margin)
+        total = sum(hi - lo + 1 for lo, hi in spans)
+        if total <= 0: return None
+        pick = rng.randrange(total)
+        for lo, hi in spans:
+            size = hi - lo + 1
+            if pick < size: return lo + pick
+            pick -= size
+        return None
+
+# --- ฟังก์ชันสร้างด่าน ---
+def level_seed(lvl, seed=0):
+    # seed 0 = ผังด่านเดิมของเกม (random.seed(lvl * 100))
+    # seed อื่นผสมด้วย hash: lvl * 100 + seed จะชนกันข้าม session (seed 100 ด่าน 1 = seed 0 ด่าน 2)
+    if seed == 0: return lvl * 100
+    digest = hashlib.sha256(f"asgard-level:{seed}:{lvl}".encode('ascii')).digest()
+    return int.from_bytes(digest[:8], 'big')
+
+# ตัวเลขตำแหน่งใน generate_layout ตั้งไว้สำหรับด่านกว้าง 1200 ด่านที่กว้างกว่านี้ขยายไปทางขวา
+BASE_LEVEL_WIDTH = 1200
+
+def level_width(lvl):
+    # ด่าน 1-3 กว้างเท่าจอ จากนั้นกว้างขึ้นด่านละ 300 สูงสุด 2 จอ
+    return min(SCREEN_WIDTH + max(0, lvl - 3) * 300, 2 * SCREEN_WIDTH)
+
+# ชนิดแพลตฟอร์มใน layout -> (ภาพ, เป็นกำแพงไหม)
+PLATFORM_KINDS = {
+    'floor': ('assets/bg/pp.png', False),
+    'path': ('assets/bg/oo.png', False),
+    'door': ('assets/bg/mm.png', False),
+    'extra': ('assets/bg/oo.png', False),
+    'wall': ('assets/box/idle.png', True),
+}
+
+# --- CLASS: LevelLayout (ผังด่านแบบข้อมูลล้วน ไม่มี Surface ส่งข้าม process ได้) ---
+class LevelLayout:
+    def __init__(self, level, seed, width, height):
+        self.level = level
+        self.seed = seed
+        self.width = width
+        self.height = height
+        self.platforms = []    # (kind, x, y, w, h) เรียงตามลำดับที่สร้าง
+        self.boxes = []        # (x, y)
+        self.enemies = []      # (x, y, dist, dir, speed)
+        self.decorations = []  # (x, y, w, h)
+        self.door = None       # (x, y)
+        self.stats = {}        # ตัวเลขไว้ตรวจผัง เช่น วาง path platform ได้กี่อัน
+
+    def to_dict(self):
+        return {
+            'level': self.level, 'seed': self.seed, 'width': self.width, 'height': self.height,
+            'platforms': self.platforms, 'boxes': self.boxes, 'enemies': self.enemies,
+            'decorations': self.decorations, 'door': self.door, 'stats': self.stats,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        layout = cls(data['level'], data['seed'], data['width'], data['height'])
+        layout.platforms = [tuple(p) for p in data['platforms']]
+        layout.boxes = [tuple(b) for b in data['boxes']]
+        layout.enemies = [tuple(e) for e in data['enemies']]
+        layout.decorations = [tuple(d) for d in data['decorations']]
+        layout.door = tuple(data['door'])
+        layout.stats = dict(data.get('stats', {}))
+        return layout
+
+# ผังที่สุ่มได้แล้วเดินไปถึงประตูไม่ได้ = สุ่มใหม่ด้วย Random ตัวถัดไปของ seed เดิม (ไม่เกิน LAYOUT_ATTEMPTS รอบ)
+# รอบแรกใช้ level_seed ตรงๆ ผังที่ไปถึงประตูได้อยู่แล้วจึงเหมือนเดิม
+LAYOUT_ATTEMPTS = 8
+
+def generate_layout(lvl, seed=0, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+    # สุ่มผังด่านอย่างเดียว (ใช้แค่ pygame.Rect ไม่แตะจอ/ภาพ)
+    # ใช้ Random ของด่านเอง (ไม่แตะ random ตัว global) เพื่อให้ replay ได้ผลเดิมทุกครั้ง
+    base = level_seed(lvl, seed)
+    for attempt in range(LAYOUT_ATTEMPTS):
+        rng = random.Random(base if attempt == 0 else f"{base}:{attempt}")
+        layout = place_layout(rng, lvl, seed, width, height)
+        reachable = door_reachable(layout)
+        if reachable: break
+    layout.stats['attempts'] = attempt + 1
+    layout.stats['reachable'] = reachable
+    return layout
+
+def place_layout(rng, lvl, seed, width, height):
+    layout = LevelLayout(lvl, seed, width, height)
+    extra_w = max(0, width - BASE_LEVEL_WIDTH)  # ความกว้างที่เกิน 1 จอ (0 = ผังเหมือนเดิมทุกอย่าง)
+    platforms = []  # Rect ของแพลตฟอร์มที่ไม่ใช่กำแพง (ไว้สุ่มที่เกิดหมู)
+    enemy_grid = OccupancyGrid()
+
+    def clamp(v, lo, hi):
+        return lo if v < lo else hi if v > hi else v
+
+    def add_platform(kind, rect):
+        layout.platforms.append((kind, rect.x, rect.y, rect.w, rect.h))
+        if kind != 'wall': platforms.append(rect)
+
+    def add_enemy(ex, ey, edist):
+        layout.enemies.append((ex, ey, edist, rng.choice([-1, 1]), rng.uniform(1.5, 2.5)))
+        enemy_grid.add(pygame.Rect(ex, ey, 34, 30))
+
+    floor_y = 600
+    floor = pygame.Rect(0, floor_y, width, height - floor_y)
+    add_platform('floor', floor)
+
+    occupied = OccupancyGrid()
+    occupied.add(floor)
+    spawn_safe_zone = pygame.Rect(50, 350, 200, 150)
+    occupied.add(spawn_safe_zone)
+    decor_grid = OccupancyGrid()
+
+    # ประตู (ด่านกว้างเลื่อนประตูไปทางขวาสุด)
+    zone = lvl % 3
+    if zone == 1: door_x = rng.randint(880, BASE_LEVEL_WIDTH - 160)   
+    elif zone == 2: door_x = rng.randint(700, 880)                  
+    else: door_x = rng.randint(520, 720)                  
+
+    if door_x < 520: door_x = 520
+    door_x += extra_w
+    min_tier = 1 if lvl <= 2 else 2
+    door_tier = rng.randint(min_tier, 3)
+    door_y = floor_y - (120 + door_tier * 100)
+
+    DOOR_PLAT_W, DOOR_PLAT_H = 150, 20
+    door_plat_left = door_x - 29
+    door_plat_top  = door_y + 105
+    door_plat_rect = pygame.Rect(door_plat_left, door_plat_top, DOOR_PLAT_W, DOOR_PLAT_H)
+
+    LOG_H = 28
+    PATH_H = LOG_H
+    path_platforms = []
+
+    start_w = rng.randint(120, 370)
+    start_x = rng.randint(100, 250)
+    start_y = floor_y - rng.randint(100, 320)
+    start_rect = pygame.Rect(start_x, start_y, start_w, PATH_H)
+    
+    if check_overlap(start_rect, [spawn_safe_zone], margin=10):
+        start_y = spawn_safe_zone.bottom + 20
+        start_rect.y = start_y
+
+    if occupied.is_free(start_rect, margin=20):
+        add_platform('path', start_rect)
+        path_platforms.append(start_rect)
+        occupied.add(start_rect)
+
+    approach_w = rng.randint(180, 260)
+    gap_to_door = rng.randint(150, 450)
+    approach_x = door_plat_left - gap_to_door - approach_w
+    approach_x = clamp(approach_x, 80, width - approach_w - 30)
+    approach_y = door_plat_top - rng.randint(10, 250)
+    approach_y = clamp(approach_y, 340, floor_y - 80)
+
+    if path_platforms:
+        last = path_platforms[-1]
+        dist_x = max(0, door_plat_left - last.right)
+    else:
+        dist_x = max(0, door_plat_left - 160)
+
+    total_steps = clamp((dist_x // 200) + 3 + door_tier, 4, 8) 
+    intermediate_count = max(0, total_steps - 2)
+    placed_count = 0
+
+    for i in range(intermediate_count):
+        attempts = 0
+        placed = False
+        while attempts < 14 and not placed:
+            w = rng.randint(100, 300)
+            gap = rng.randint(180, 350) 
+            if path_platforms:
+                prev = path_platforms[-1]
+                x = prev.right + gap
+                if x + w > approach_x - 100: x = (approach_x - 20) - w
+            else:
+                x = rng.randint(160, 360)
+            x = clamp(x, 20, width - w - 20)
+            prev_y = path_platforms[-1].y if path_platforms else (floor_y - 100)
+            MAX_Y_STEP = 75
+            MIN_Y_STEP = 30 
+            remaining = (intermediate_count - i + 1)
+            ideal_step = (approach_y - prev_y) / max(1, remaining)
+            ideal_step = clamp(ideal_step, -MAX_Y_STEP, MAX_Y_STEP)
+            if abs(ideal_step) < MIN_Y_STEP: ideal_step = MIN_Y_STEP * (1 if ideal_step >= 0 else -1)
+            desired_y = int(round(prev_y + ideal_step + rng.randint(-5, 5)))
+            desired_y = int(round(desired_y / 10) * 10)
+            desired_y = clamp(desired_y, 150, floor_y - 80)
+            new_rect = pygame.Rect(x, desired_y, w, PATH_H)
+            
+            if occupied.is_free(new_rect, margin=40):
+                add_platform('path', new_rect)
+                path_platforms.append(new_rect)
+                occupied.add(new_rect)
+                placed = True
+                placed_count += 1
+            attempts += 1
+
+    attempts = 0
+    approach_placed = False
+    while attempts < 18:
+        new_rect = pygame.Rect(approach_x, approach_y, approach_w, PATH_H)
+        if occupied.is_free(new_rect, margin=40):
+            add_platform('path', new_rect)
+            path_platforms.append(new_rect)
+            occupied.add(new_rect)
+            approach_placed = True
+            break
+        approach_x = clamp(approach_x + rng.randint(-40, 40), 30, width - approach_w - 30)
+        approach_y = clamp(approach_y + rng.randint(-20, 20), 140, floor_y - 80)
+        attempts += 1
+
+    add_platform('door', door_plat_rect)
+    occupied.add(door_plat_rect)
+    layout.door = (door_x, door_y)
+
+    # Platforms เสริม
+    num_platforms = rng.randint(2, 4) + extra_w // 300
+    for _ in range(num_platforms):
+        attempts = 0
+        while attempts < 10:
+            w = rng.randint(120, 220)
+            x = rng.randint(100, width - w - 50)
+            tiers = [floor_y - 100, floor_y - 220, floor_y - 280]
+            y = rng.choice(tiers) + rng.randint(-10, 10)
+            PLAT_H = LOG_H
+            cx = x + w // 2
+            if abs(cx - door_x) < 180 and y > (door_plat_top - 120):
+                attempts += 1
+                continue
+            new_rect = pygame.Rect(x, y, w, PLAT_H)
+            if occupied.is_free(new_rect, margin=40):
+                add_platform('extra', new_rect)
+                occupied.add(new_rect)
+                if rng.random() > 0.6: layout.boxes.append((x + w // 2 - 20, y - 40))
+                break
+            attempts += 1
+
+    # Walls (ต่อท้ายสุดของ platforms เหมือนเดิม)
+    walls = []
+    num_walls = rng.randint(1, 2) + extra_w // 600
+    for _ in range(num_walls):
+        attempts = 0
+        while attempts < 10:
+            w = rng.randint(40, 60)
+            h = rng.randint(100, 140)
+            x = rng.randint(350, 850 + extra_w)
+            y = floor_y - h
+            new_rect = pygame.Rect(x, y, w, h)
+            if occupied.is_free(new_rect, margin=30):
+                walls.append(new_rect)
+                occupied.add(new_rect)
+                break
+            attempts += 1
+
+    # ศัตรู
+    for idx, plat in enumerate(path_platforms):
+        if idx == 0 and rng.random() < 0.6: continue
+        if rng.random() < 0.75:
+            ex_min = plat.x + 20
+            ex_max = plat.right - 100
+            if ex_max > ex_min:
+                ex = rng.randint(ex_min, ex_max)
+                ey = plat.top - 30
+                edist = min(150, max(60, plat.width - 60))
+                e_rect = pygame.Rect(ex, ey, 34, 30)
+                if enemy_grid.is_free(e_rect, margin=10):
+                    add_enemy(ex, ey, edist)
+
+    if path_platforms:
+        plat = path_platforms[-1]
+        ex_min = plat.x + 20
+        ex_max = plat.right - 100
+        if ex_max > ex_min:
+            ex = rng.randint(ex_min, ex_max)
+            ey = plat.top - 30
+            edist = min(160, max(70, plat.width - 70))
+            e_rect = pygame.Rect(ex, ey, 34, 30)
+            if enemy_grid.is_free(e_rect, margin=10):
+                add_enemy(ex, ey, edist)
+
+    num_enemies = min(2 + lvl, 8) + extra_w // 300
+    spawnable_platforms = list(platforms)
+    safety = 0
+    while len(layout.enemies) < num_enemies and safety < 50:
+        chosen_plat = rng.choice(spawnable_platforms)
+        ex_min = chosen_plat.x + 20
+        ex_max = chosen_plat.right - 100
+        if ex_max <= ex_min:
+            safety += 1
+            continue
+        ey = chosen_plat.top - 30
+        # สุ่มเฉพาะตำแหน่งที่ว่างบนแพลตฟอร์มนั้น (ไม่ต้องสุ่มแล้วเช็คชนทีละครั้ง)
+        ex = enemy_grid.sample_free(rng, ex_min, ex_max, ey, 34, 30, margin=10)
+        if ex is not None:
+            edist = min(100, max(60, chosen_plat.width - 60))
+            add_enemy(ex, ey, edist)
+        safety += 1
+
+    # Decorations
+    for _ in range(4 + extra_w // 300):
+        attempts = 0
+        while attempts < 10:
+            w, h = 100, 100
+            x = rng.randint(10, width - w - 10)
+            y = rng.randint(180, 190)
+            new_rect = pygame.Rect(x, y, w, h)
+            if decor_grid.is_free(new_rect, margin=10):
+                layout.decorations.append((x, y, w, h))
+                decor_grid.add(new_rect)
+                break
+            attempts += 1
+
+    for rect in walls: add_platform('wall', rect)
+
+    layout.stats = {
+        'path_expected': intermediate_count + 2,
+        'path_placed': len(path_platforms),
+        'intermediate_placed': placed_count,
+        'approach_placed': approach_placed,
+        'enemies': len(layout.enemies),
+        'enemies_wanted': num_enemies,
+    }
+    return layout
+
+# --- ตรวจว่าผู้เล่นไปถึงประตูได้จริง ---
+# จำลองการกระโดดด้วยฟิสิกส์เดียวกับ Player.move ชนแพลตฟอร์ม/กำแพง/กล่องแบบของจริง (หัวชนใต้แพลตฟอร์มได้)
+# เริ่มจากที่ที่ผู้เล่นเกิดแล้วไล่ว่ากระโดดไปยืนบนอะไรต่อได้บ้าง จนถึงแพลตฟอร์มที่ยืนแล้วชนประตู
+PLAYER_W, PLAYER_H = 34, 40
+PLAYER_SPAWN = (100, 400)
+WALK_SPEED, JUMP_VEL, GRAVITY, MAX_FALL = 5, -20, 0.8, 15
+
+def fall_step(vel):
+    vel = min(vel + GRAVITY, MAX_FALL)
+    dy = int(round(vel))
+    if dy == 0: dy = 1 if vel > 0 else -1 if vel < 0 else 0
+    return vel, dy
+
+def jump_arc(ticks=200):
+    # ความสูงของเท้า (เทียบกับจุดกระโดด) หลังแต่ละ tick ของการกระโดดที่ไม่ชนอะไร
+    vel, rise, arc = JUMP_VEL, 0, []
+    for _ in range(ticks):
+        vel, dy = fall_step(vel)
+        rise -= dy
+        arc.append(rise)
+    return arc
+
+JUMP_ARC = jump_arc()
+JUMP_PEAK = max(JUMP_ARC)
+
+def air_ticks(rise):
+    # จำนวน tick ที่ลอยอยู่ก่อนเท้าตกลงมาถึงความสูง rise (ไว้ตัดเป้าที่ไกลเกินเดินถึงกลางอากาศ)
+    peak = JUMP_ARC.index(JUMP_PEAK)
+    for t in range(peak, len(JUMP_ARC)):
+        if JUMP_ARC[t] <= rise: return t + 1
+    return len(JUMP_ARC)
+
+def simulate_jump(solids, width, height, x, bottom, direction, jump, delay=0, stop_below=None, max_ticks=200):
+    # เดินทาง direction ตั้งแต่ tick ที่ delay (กระโดดตั้งแต่ tick แรกถ้า jump) คืน rect ที่ลงไปยืน หรือ None
+    rect = pygame.Rect(x, bottom - PLAYER_H, PLAYER_W, PLAYER_H)
+    vel = JUMP_VEL if jump else 0
+    for t in range(max_ticks):
+        dx = WALK_SPEED * direction if t >= delay else 0
+        vel, dy = fall_step(vel)
+        if dx:
+            rect.x += dx
+            for i in rect.collidelistall(solids):
+                if dx > 0: rect.right = solids[i].left
+                else: rect.left = solids[i].right
+            if rect.left < 0: rect.left = 0
+            if rect.right > width: rect.right = width
+        rect.y += dy
+        landed = None
+        for i in rect.collidelistall(solids):
+            if dy > 0:
+                rect.bottom = solids[i].top
+                vel = 0
+                landed = solids[i]
+            elif dy < 0:
+                rect.top = solids[i].bottom
+                vel = 0
+        if rect.top < 0:
+            rect.top = 0
+            if vel < 0: vel = 0
+        # เดินตกจากขอบ: ยังยืนอยู่ระดับเดิม = ยังเดินอยู่ ยังไม่ถือว่าลงที่ไหน
+        if landed is not None and (jump or rect.bottom != bottom): return landed
+        if rect.bottom >= height: return None
+        if stop_below is not None and vel > 0 and rect.bottom > stop_below: return None
+    return None
+
+def jump_starts(src, dst, stand_lo, stand_hi):
+    # x ที่น่าจะกระโดดจาก src ไปลง dst ได้: ให้ตัวพ้นขอบ dst พอดีตอนเท้าสูงพ้นผิวบน (+ ระยะเผื่อ)
+    starts = []
+    rise = src.top - dst.top
+    clear = next((t for t, h in enumerate(JUMP_ARC) if h >= rise + 2), None)
+    for direction in (1, -1):
+        if clear is not None:
+            edge = dst.left - PLAYER_W - WALK_SPEED * clear if direction > 0 else dst.right + WALK_SPEED * clear
+            for slack in (10, -10, 30, 60, -30):
+                starts.append((edge - slack * direction, direction, True, 0))
+            starts.append((dst.centerx - PLAYER_W // 2, direction, True, 8))
+    if rise < 0:
+        # ต่ำกว่า: เดินตกจากขอบ
+        starts.append((stand_hi, 1, False, 0))
+        starts.append((stand_lo, -1, False, 0))
+    return [(max(stand_lo, min(stand_hi, x)), d, j, delay) for x, d, j, delay in starts]
+
+def door_reachable(layout):
+    solids = [pygame.Rect(x, y, w, h) for _, x, y, w, h in layout.platforms]
+    solids += [pygame.Rect(x, y, 40, 40) for x, y in layout.boxes]
+    door = pygame.Rect(layout.door[0] + 20, layout.door[1] + 20, 50, 80)  # rect เดียวกับ Door
+    width, height = layout.width, layout.height
+
+    def at_door(surface):
+        return door.colliderect(pygame.Rect(surface.left, surface.top - PLAYER_H, surface.width, PLAYER_H))
+
+    start = simulate_jump(solids, width, height, PLAYER_SPAWN[0], PLAYER_SPAWN[1] + PLAYER_H, 0, False)
+    if start is None: return False
+    if at_door(start): return True
+    # ลองเป้าที่ใกล้ประตูก่อน เจอทางแล้วหยุดเลย
+    targets = sorted(solids, key=lambda r: abs(r.centerx - door.centerx))
+    seen = {id(start)}
+    stack = [start]
+    while stack:
+        src = stack.pop()
+        stand_lo, stand_hi = src.left - PLAYER_W + 4, src.right - 4
+        for dst in targets:
+            if id(dst) in seen: continue
+            rise = src.top - dst.top
+            if rise > JUMP_PEAK - 2: continue
+            gap = max(dst.left - src.right, src.left - dst.right, 0) - PLAYER_W
+            if gap > WALK_SPEED * air_ticks(rise): continue
+            for x, direction, jump, delay in jump_starts(src, dst, stand_lo, stand_hi):
+                if pygame.Rect(x, src.top - PLAYER_H, PLAYER_W, PLAYER_H).collidelist(solids) != -1: continue
+                landed = simulate_jump(solids, width, height, x, src.top, direction, jump, delay, dst.top + 15)
+                if landed is None or id(landed) in seen: continue
+                if at_door(landed): return True
+                seen.add(id(landed))
+                stack.append(landed)
+                if landed is dst: break
+    return False
+
+# --- CLASS: LayoutCache (เก็บ layout ที่สุ่มแล้วไว้ในหน่วยความจำ + ไฟล์ JSON บนดิสก์) ---
+# key = เลขด่าน + seed + รุ่นของตัวสุ่ม + ขนาดจอ -> แก้ generate_layout เมื่อไหร่ให้เพิ่ม GENERATOR_VERSION
+# cache_dir=None = เก็บแค่ในหน่วยความจำ (seed สุ่มไม่ซ้ำกันเช่นของ AsgardEnv ไม่ต้องเขียนลงดิสก์)
+GENERATOR_VERSION = 5
+LAYOUT_CACHE_DIR = os.path.join('.cache', 'layouts')
+LAYOUT_MEMORY_LIMIT = 256  # layout ที่เก็บในหน่วยความจำ (ตัดตัวที่ไม่ได้ใช้นานที่สุดออกก่อน)
+
+class LayoutCache:
+    def __init__(self, cache_dir=LAYOUT_CACHE_DIR, version=GENERATOR_VERSION, memory_limit=LAYOUT_MEMORY_LIMIT):
+        self.cache_dir = cache_dir
+        self.version = version
+        self.memory_limit = memory_limit
+        self.memory = OrderedDict()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def path_for(self, lvl, seed, width, height):
+        return os.path.join(self.cache_dir, f"v{self.version}_{width}x{height}_s{seed}_l{lvl}.json")
+
+    def get(self, lvl, seed=0, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+        key = (lvl, seed, width, height)
+        with self.lock:
+            layout = self.memory.get(key)
+            if layout is not None:
+                self.memory_hits += 1
+                self.memory.move_to_end(key)
+                return layout
+
+            path = self.path_for(lvl, seed, width, height) if self.cache_dir else None
+            layout = self.load(path) if path else None
+            if layout is not None:
+                self.disk_hits += 1
+            else:
+                self.misses += 1
+                layout = generate_layout(lvl, seed, width, height)
+                if path: self.save(path, layout)
+            self.memory[key] = layout
+            while len(self.memory) > self.memory_limit:
+                self.memory.popitem(last=False)
+            return layout
+
+    def load(self, path):
+        if not os.path.exists(path): return None
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != self.version: return None
+            return LevelLayout.from_dict(data['layout'])
+        except (OSError, ValueError, KeyError, TypeError):
+            print(f"Ignoring broken layout cache file: {path}")
+            return None
+
+    def save(self, path, layout):
+        # เขียนไม่ได้ (เช่นโฟลเดอร์อ่านอย่างเดียว) ก็แค่ไม่ cache
+        # ไฟล์ tmp ชื่อไม่ซ้ำกัน: worker ของ batch/replay หลาย process อาจเขียน seed เดียวกันพร้อมกัน
+        tmp_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(suffix='.tmp', prefix=os.path.basename(path) + '.', dir=self.cache_dir)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.version, 'layout': layout.to_dict()}, f, separators=(',', ':'))
+            os.replace(tmp_path, path)
+        except OSError:
+            if tmp_path and os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    def clear_memory(self):
+        with self.lock:
+            self.memory.clear()
+
+LAYOUTS = LayoutCache()
+
+# --- แปลง layout เป็น object จริง (โหลดภาพ/เสียง ต้องมีจอแล้ว) ---
+def instantiate_layout(layout):
+    platforms = []
+    for kind, x, y, w, h in layout.platforms:
+        image_path, is_wall = PLATFORM_KINDS[kind]
+        platforms.append(Platform(x, y, w, h, image_path, is_wall=is_wall))
+    boxes = [Box(x, y) for x, y in layout.boxes]
+    decorations = [Decoration(x, y, w, h, 'assets/environment/decorations.png') for x, y, w, h in layout.decorations]
+    enemies = [Enemy(x, y, dist, direction=d, speed=sp) for x, y, dist, d, sp in layout.enemies]
+    door = Door(*layout.door)
+    bg_image = load_safe_image('assets/bg/background.png', (40, 40, 50), (SCREEN_WIDTH, layout.height))
+    return platforms, boxes, decorations, enemies, door, bg_image
+
+def build_level(lvl, seed=0):
+    return instantiate_layout(LAYOUTS.get(lvl, seed, level_width(lvl)))
+
+# --- สร้าง/ตรวจ layout จำนวนมากแบบขนาน (process pool ไม่ต้องมีจอ) ---
+def generate_layouts(jobs, workers=None):
+    # jobs = [(lvl, seed), ...]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_generate_layout_job, jobs, chunksize=64))
+
+def _generate_layout_job(job):
+    lvl, seed = job
+    return generate_layout(lvl, seed, level_width(lvl))
+
+# --- CLASS: LoadedLevel (ด่านที่สร้างเสร็จแล้ว พร้อมสลับเข้า World) ---
+class LoadedLevel:
+    def __init__(self, level, seed=0, prerender=False, layouts=LAYOUTS):
+        self.level = level
+        self.seed = seed
+        self.layout = layouts.get(level, seed, level_width(level))
+        (self.platforms, self.boxes, self.decorations, self.enemies,
+         self.door, self.bg_img) = instantiate_layout(self.layout)
+        self.grid = build_obstacle_grid(self.platforms + self.boxes)
+        self.static_layer = None
+        if prerender: self.prerender()
+
+    def reset(self, enemy_pool=None):
+        # เกิดใหม่ในด่านเดิม: ของนิ่ง/grid/static layer ใช้ต่อ ตั้งหมูกับสถานะประตูใหม่
+        # มี pool = คืนหมูชุดเดิมเข้า pool แล้วหยิบกลับมาตั้งค่าใหม่ (ลิสต์เดิม ไม่สร้าง Enemy ใหม่)
+        if enemy_pool is None:
+            self.enemies = [Enemy(x, y, dist, direction=d, speed=sp) for x, y, dist, d, sp in self.layout.enemies]
+        else:
+            enemy_pool.release_all(self.enemies)
+            for x, y, dist, d, sp in self.layout.enemies:
+                self.enemies.append(enemy_pool.acquire(x, y, dist, random, d, sp))
+        self.door.reset()
+
+    def prerender(self):
+        self.static_layer = StaticLayer((self.layout.width, self.layout.height))
+        self.static_layer.set_level(self.bg_img, self.decorations, self.platforms, self.boxes)
+        self.static_layer.rebuild()
+        return self.static_layer
+
+# --- CLASS: LevelPrefetcher (สร้างด่านถัดไปใน thread แยกระหว่างที่เล่นด่านปัจจุบัน) ---
+# ตอนเข้าประตูจะได้สลับด่านทันที ถ้ายังสร้างไม่เสร็จค่อย build_level แบบเดิม
+class LevelPrefetcher:
+    def __init__(self, prerender=True, layouts=LAYOUTS):
+        self.prerender = prerender
+        self.layouts = layouts
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='level-prefetch')
+        self.pending = {}  # (level, seed) -> Future มีได้ทีละด่าน
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0     # hit ที่ต้องรอให้สร้างเสร็จก่อน
+        self.dropped = 0   # ด่านที่สร้างรอไว้แต่ไม่มีใครมาเอา
+
+    def request(self, level, seed=0):
+        # ขอด่านใหม่ = ด่านที่ขอไว้ก่อนหน้าไม่ได้ใช้แล้ว (เริ่มใหม่/กลับเมนู) ทิ้งไปเลย
+        # ไม่งั้นด่านที่สร้างเสร็จ (ภาพ static layer ทั้งด่าน + grid) ค้างใน pending ไปตลอด
+        key = (level, seed)
+        for other in [k for k in self.pending if k != key]:
+            self.pending.pop(other).cancel()
+            self.dropped += 1
+        if key not in self.pending:
+            self.pending[key] = self.executor.submit(LoadedLevel, level, seed, self.prerender, self.layouts)
+
+    def take(self, level, seed=0):
+        # ยังสร้างไม่เสร็จ = รอ thread ที่สร้างอยู่ (สร้างซ้ำเองในเฟรมนี้จะช้ากว่า)
+        # คืน None แค่ตอนไม่ได้ขอไว้ หรือสร้างแล้ว error -> World สร้างเองแบบเดิม
+        future = self.pending.pop((level, seed), None)
+        if future is None:
+            self.misses += 1
+            return None
+        if not future.done():
+            self.waits += 1
+        try:
+            loaded = future.result()
+        except Exception:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return loaded
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.pending.clear()
@@ -0,0 +1,123 @@
+import csv
+import json
+import time
+from collections import deque
+import pygame
+
+from .settings import SCREEN_WIDTH, WHITE
+from .graphics import FONTS
+
+# --- CLASS: FrameProfiler (จับเวลาแต่ละส่วนของ main loop) ---
+# ใช้แบบ lap: profiler.lap('ชื่อ') = เวลาตั้งแต่ lap ก่อนหน้าถึงตอนนี้ นับเป็นของส่วนนั้น
+PROFILE_HISTORY = 600        # จำนวนเฟรมที่ใช้คิด p50/p95/p99 บน overlay
+PROFILE_KEEP = 60 * 60 * 10  # จำนวนเฟรมสูงสุดที่เก็บไว้ dump ลงไฟล์ (~10 นาที)
+PROFILE_OVERLAY_REFRESH = 30 # อัปเดตตัวเลขบน overlay ทุกกี่เฟรม
+
+class FrameProfiler:
+    def __init__(self, history=PROFILE_HISTORY, keep=PROFILE_KEEP):
+        self.enabled = False
+        self.show_overlay = False
+        self.history = deque(maxlen=history)
+        self.records = deque(maxlen=keep)
+        self.current = {}
+        self.frame_no = 0
+        self.in_frame = False  # begin_frame ตอนเปิดอยู่แล้วหรือยัง (เปิดกลางเฟรม = ข้ามเฟรมนั้นไป)
+        self.frame_start = 0.0
+        self.last = 0.0
+        self.overlay = None
+        self.overlay_age = 0
+
+    def toggle_overlay(self):
+        self.show_overlay = not self.show_overlay
+        if self.show_overlay: self.enabled = True
+        self.overlay_age = PROFILE_OVERLAY_REFRESH
+
+    def begin_frame(self):
+        self.in_frame = self.enabled
+        if not self.enabled: return
+        self.frame_start = self.last = time.perf_counter()
+        self.current = {}
+
+    def lap(self, name):
+        if not self.in_frame: return
+        now = time.perf_counter()
+        self.current[name] = self.current.get(name, 0.0) + (now - self.last) * 1000.0
+        self.last = now
+
+    def end_frame(self):
+        if not self.in_frame: return
+        self.in_frame = False
+        total = (time.perf_counter() - self.frame_start) * 1000.0
+        self.frame_no += 1
+        record = (self.frame_no, total, self.current)
+        self.history.append(record)
+        self.records.append(record)
+
+    def percentiles(self, records=None):
+        totals = sorted(r[1] for r in (self.history if records is None else records))
+        if not totals: return {'p50': 0.0, 'p95': 0.0, 'p99': 0.0}
+        n = len(totals) - 1
+        return {'p50': totals[int(n * 0.50)], 'p95': totals[int(n * 0.95)], 'p99': totals[int(n * 0.99)]}
+
+    def section_averages(self, records=None):
+        records = self.history if records is None else records
+        sums = {}
+        for _, _, sections in records:
+            for name, ms in sections.items():
+                sums[name] = sums.get(name, 0.0) + ms
+        count = max(1, len(records))
+        return {name: total / count for name, total in sums.items()}
+
+    def section_names(self):
+        names = []
+        for _, _, sections in self.records:
+            for name in sections:
+                if name not in names: names.append(name)
+        return names
+
+    def dump(self, path):
+        # .csv = 1 แถวต่อเฟรม, อย่างอื่น = JSON (สรุป + ทุกเฟรม)
+        records = list(self.records)
+        if path.endswith('.csv'):
+            names = self.section_names()
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(['frame', 'total_ms'] + names)
+                for frame_no, total, sections in records:
+                    writer.writerow([frame_no, f"{total:.4f}"] + [f"{sections.get(n, 0.0):.4f}" for n in names])
+        else:
+            data = {
+                'frames': len(records),
+                'percentiles_ms': self.percentiles(records),
+                'section_avg_ms': self.section_averages(records),
+                'records': [{'frame': n, 'total_ms': t, 'sections': sec} for n, t, sec in records],
+            }
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+        print(f"Profile written to {path} ({len(records)} frames)")
+
+    def render_overlay(self, surf):
+        self.overlay_age += 1
+        if self.overlay is None or self.overlay_age >= PROFILE_OVERLAY_REFRESH:
+            self.overlay_age = 0
+            self.overlay = self.build_overlay()
+        return surf.blit(self.overlay, (SCREEN_WIDTH - self.overlay.get_width() - 10, 60))
+
+    def build_overlay(self):
+        pct = self.percentiles()
+        lines = [f"frame ms  p50 {pct['p50']:.2f}  p95 {pct['p95']:.2f}  p99 {pct['p99']:.2f}"]
+        avgs = sorted(self.section_averages().items(), key=lambda kv: -kv[1])
+        lines += [f"{name:<16}{ms:7.3f}" for name, ms in avgs]
+        # ตัวเลขเปลี่ยนตลอด -> render ตรงๆ ไม่ผ่าน TextCache
+        texts = [FONTS.get('small').render(line, True, WHITE) for line in lines]
+        w = max(t.get_width() for t in texts) + 16
+        h = sum(t.get_height() for t in texts) + 12
+        panel = pygame.Surface((w, h), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        y = 6
+        for t in texts:
+            panel.blit(t, (8, y))
+            y += t.get_height()
+        return panel
+
+PROFILER = FrameProfiler()
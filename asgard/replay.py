@@ -0,0 +1,58 @@
+import json
+
+from .level import GENERATOR_VERSION
+from .world import Inputs, World
+
+# --- CLASS: InputRecorder (บันทึกปุ่มทุก tick + seed ของด่าน) ---
+# ไฟล์เป็น JSON: inputs เก็บแบบ run-length [[bitmask, จำนวน tick], ...]
+# generator = GENERATOR_VERSION ตอนอัด: ตัวสร้างด่านเปลี่ยนแล้วด่านไม่เหมือนเดิม เล่นปุ่มชุดเดิมก็ไม่ตรง
+REPLAY_VERSION = 1
+
+class InputRecorder:
+    def __init__(self, seed=0, horde=0):
+        self.seed = seed
+        self.horde = horde
+        self.runs = []
+
+    def record(self, inputs):
+        bits = inputs.to_bits()
+        if self.runs and self.runs[-1][0] == bits:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([bits, 1])
+
+    def save(self, path):
+        data = {'version': REPLAY_VERSION, 'generator': GENERATOR_VERSION,
+                'seed': self.seed, 'horde': self.horde, 'inputs': self.runs}
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+
+# --- CLASS: Replay (เล่นปุ่มที่บันทึกไว้กลับเข้า World.step) ---
+class Replay:
+    def __init__(self, seed, runs, horde=0):
+        self.seed = seed
+        self.runs = runs
+        self.horde = horde
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version: {data.get('version')}")
+        if data.get('generator') != GENERATOR_VERSION:
+            raise ValueError(f"Replay was recorded with level generator {data.get('generator')}, "
+                             f"this build generates levels with {GENERATOR_VERSION}")
+        return cls(data.get('seed', 0), data['inputs'], data.get('horde', 0))
+
+    def __len__(self):
+        return sum(count for _, count in self.runs)
+
+    def inputs(self):
+        for bits, count in self.runs:
+            inp = Inputs.from_bits(bits)
+            for _ in range(count):
+                yield inp
+
+    def new_world(self, prefetch=False):
+        return World(self.seed, prefetch, self.horde)
@@ -0,0 +1,57 @@
+import os
+import sys
+import pygame
+
+# --- ตั้งค่าเกม ---
+# --headless (หรือ env ASGARD_HEADLESS=1): ไม่มีหน้าต่าง ไม่มีเสียง ไม่จำกัดเฟรม (ใช้ SDL dummy driver)
+# --layouts / --batch ไม่ต้องใช้จอเลยนับเป็น headless ด้วย
+HEADLESS = ('--headless' in sys.argv or '--layouts' in sys.argv or '--batch' in sys.argv
+            or os.environ.get('ASGARD_HEADLESS') == '1')
+if HEADLESS:
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+SCREEN_WIDTH, SCREEN_HEIGHT = 1200, 700
+CAPTION = "Asgard King Ood - Sounds & Coins"
+
+# import package นี้ไม่เปิดหน้าต่าง/เสียง/ฟอนต์ใดๆ ทั้งสิ้น แต่ละอย่าง init ตอนใช้ครั้งแรก:
+#   จอ = DISPLAY.get() (โหลดภาพครั้งแรกก็เรียกให้เอง เพราะ convert_alpha ต้องมีจอ)
+#   ฟอนต์ = FONTS.get() ใน graphics, เสียง = AUDIO ใน audio
+# --- CLASS: Display (หน้าต่างเกม สร้างตอนมีคนขอครั้งแรก) ---
+class Display:
+    def __init__(self, size=(SCREEN_WIDTH, SCREEN_HEIGHT), caption=CAPTION):
+        self.size = size
+        self.caption = caption
+        self.surface = None
+
+    def get(self):
+        if self.surface is None:
+            pygame.display.init()
+            self.surface = pygame.display.set_mode(self.size)
+            pygame.display.set_caption(self.caption)
+        return self.surface
+
+DISPLAY = Display()
+
+# เวลาตั้งแต่เริ่ม import package จนวาดเมนูเฟรมแรกเสร็จ (python -m asgard --startup-check)
+STARTUP_BUDGET_MS = 300
+
+# --- สีและการตั้งค่า ---
+WHITE = (255, 255, 255)
+RED = (255, 0, 0)
+BLACK = (0, 0, 0)
+YELLOW = (255, 215, 0)
+MAX_LEVELS = 10
+
+# --- เวลา (วินาที) ---
+# ตัวจับเวลา/แอนิเมชันทั้งหมดนับเป็นวินาที เดินตาม dt ที่ส่งเข้า World.step ไม่ผูกกับจำนวนเฟรม
+# ฟิสิกส์เดินทีละ SIM_DT คงที่เสมอ (main loop สะสมเวลาแล้วเดินกี่ step ก็ได้ต่อเฟรม) ส่วนการวาดวิ่งอิสระ
+SIM_HZ = 60
+SIM_DT = 1.0 / SIM_HZ      # dt ของ 1 tick
+# ลบ dt สะสมมีเศษ float (10 x 1/60 ไม่ได้ 1/6 พอดี) -> เวลาที่เหลือไม่เกินนี้นับว่าหมดแล้ว
+# ตัวจับเวลาจะหมดใน tick เดียวกับตัวนับเฟรมแบบเดิม (knockback 10, อมตะ 90, เหรียญ 300 tick)
+TIMER_EPS = 1e-9
+FPS = 60                   # เพดานเฟรมวาดปกติ (--fps N เปลี่ยนได้, 0 = ไม่จำกัด)
+MAX_FRAME_DT = 0.1         # เฟรมที่ค้างนานกว่านี้ (ลากหน้าต่าง/โหลดด่าน) นับเท่านี้พอ
+MAX_SIM_STEPS = 8          # เดินตามเวลาไม่เกินกี่ step ต่อเฟรม (กันเครื่องช้าแล้วยิ่งตามยิ่งช้า)
+ANIM_FPS = 30              # ความเร็วแอนิเมชันปกติ (เฟรมภาพต่อวินาที)
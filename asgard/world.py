@@ -0,0 +1,287 @@
+import time
+import random
+import pygame
+
+# numpy ไม่บังคับ: มีแล้วโหมด horde (หมู/เหรียญหลายพันตัว) คำนวณแบบ array ได้
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .settings import SCREEN_WIDTH, SCREEN_HEIGHT, YELLOW, MAX_LEVELS, SIM_DT
+from .graphics import Camera, ACTIVE_MARGIN, FAR_UPDATE_INTERVAL
+from .entities import (Player, Enemy, Coin, FloatingText, Pool, EnemyArrays, CoinArrays,
+                       SOA_THRESHOLD, horde_spawns)
+from .audio import AUDIO
+from .profiler import PROFILER
+from .level import LAYOUTS, SpatialHash, LoadedLevel, LevelPrefetcher, level_seed
+
+# --- CLASS: Inputs (สถานะปุ่มของ 1 tick) ---
+# left/right/jump = กดค้าง, ที่เหลือ = กดครั้งเดียวใน tick นั้น
+class Inputs:
+    def __init__(self, left=False, right=False, jump=False, attack=False, enter=False,
+                 start=False, respawn=False, quit=False):
+        self.left = left
+        self.right = right
+        self.jump = jump
+        self.attack = attack
+        self.enter = enter
+        self.start = start
+        self.respawn = respawn
+        self.quit = quit
+
+    @classmethod
+    def from_pygame(cls, events):
+        keys = pygame.key.get_pressed()
+        inp = cls(left=keys[pygame.K_a], right=keys[pygame.K_d], jump=keys[pygame.K_w])
+        for event in events:
+            if event.type != pygame.KEYDOWN: continue
+            if event.key == pygame.K_j: inp.attack = True
+            elif event.key == pygame.K_SPACE: inp.enter = True
+            elif event.key == pygame.K_RETURN: inp.start = True
+            elif event.key == pygame.K_r: inp.respawn = True
+            elif event.key == pygame.K_q: inp.quit = True
+        return inp
+
+    def merged(self, newer):
+        # รวมปุ่มของหลายเฟรมที่ยังไม่มี sim step มารับ: ปุ่มค้างเอาสถานะล่าสุด ปุ่มกดครั้งเดียวไม่ให้หาย
+        return Inputs(newer.left, newer.right, newer.jump,
+                      self.attack or newer.attack, self.enter or newer.enter, self.start or newer.start,
+                      self.respawn or newer.respawn, self.quit or newer.quit)
+
+    def held(self):
+        # เฉพาะปุ่มค้าง ใช้กับ sub-step ที่ 2 เป็นต้นไปในเฟรมเดียวกัน (ปุ่มกดครั้งเดียวใช้แค่ step แรก)
+        return Inputs(self.left, self.right, self.jump)
+
+    # แปลงเป็น bitmask สำหรับบันทึก replay
+    FIELDS = ('left', 'right', 'jump', 'attack', 'enter', 'start', 'respawn', 'quit')
+
+    def to_bits(self):
+        bits = 0
+        for i, name in enumerate(self.FIELDS):
+            if getattr(self, name): bits |= 1 << i
+        return bits
+
+    @classmethod
+    def from_bits(cls, bits):
+        return cls(*[bool(bits & (1 << i)) for i in range(len(cls.FIELDS))])
+
+NO_INPUT = Inputs()
+
+# --- CLASS: World (ตรรกะเกมทั้งหมด ไม่ยุ่งกับจอ/เสียงเพลง/นาฬิกา) ---
+class World:
+    def __init__(self, seed=0, prefetch=False, horde=0, layouts=LAYOUTS):
+        self.seed = seed
+        self.horde = horde  # หมูเพิ่มต่อด่าน (--horde N) ไว้ทดสอบด่านที่มีหมูเป็นพันๆ
+        self.layouts = layouts
+        self.prefetcher = LevelPrefetcher(layouts=layouts) if prefetch else None
+        self.level = None
+        self.player = Player()
+        self.cur_level = 1
+        self.game_state = "MENU"
+        self.score = 0
+        self.coins_list = []
+        self.floating_texts = []
+        # object ที่เกิด/หายระหว่างเล่นวนใช้จาก pool (เล่นไปนานๆ ไม่สร้าง garbage ต่อเฟรม)
+        self.coin_pool = Pool(Coin)
+        self.text_pool = Pool(FloatingText)
+        self.enemy_pool = Pool(Enemy)
+        self.enemy_arrays = None  # EnemyArrays/CoinArrays แทนลิสต์ object เมื่อหมูเยอะ (ต้องมี numpy)
+        self.coin_arrays = None
+        self.platforms, self.boxes, self.decorations, self.enemies = [], [], [], []
+        self.door_obj = None
+        self.bg_img = None
+        self.obstacle_grid = SpatialHash()
+        self.camera = Camera(SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.active = pygame.Rect(0, 0, 0, 0)  # บริเวณรอบจอที่หมูอัปเดตทุก tick (เขียนทับทุก tick)
+        self.level_serial = 0  # เพิ่มทุกครั้งที่โหลดด่านใหม่ ให้ฝั่ง render รู้ว่าต้องสร้าง static layer ใหม่
+        self.tick = 0
+        # ยังไม่สร้างด่านจนกว่าจะกดเริ่มจากเมนู (เมนูขึ้นได้ทันที) ถ้ามี prefetcher ให้สร้างด่าน 1 รอไว้ระหว่างนี้
+        if self.prefetcher: self.prefetcher.request(1, seed)
+
+    def start_game(self, level):
+        self.cur_level = level
+        loaded = None
+        if self.level is not None and self.level.level == level and self.level.seed == self.seed:
+            loaded = self.level
+            loaded.reset(self.enemy_pool)
+        elif self.prefetcher:
+            loaded = self.prefetcher.take(level, self.seed)
+        if loaded is None:
+            loaded = LoadedLevel(level, self.seed, layouts=self.layouts)
+        self.level = loaded
+        self.platforms, self.boxes, self.decorations = loaded.platforms, loaded.boxes, loaded.decorations
+        self.enemies, self.door_obj, self.bg_img = loaded.enemies, loaded.door, loaded.bg_img
+        self.obstacle_grid = loaded.grid
+        self.setup_horde(loaded)
+        self.level_serial += 1
+        if self.prefetcher and level < MAX_LEVELS:
+            self.prefetcher.request(level + 1, self.seed)
+        self.player.reset()
+        self.player.rect.topleft = (100, 400)
+        self.camera.set_world(loaded.layout.width, loaded.layout.height)
+        self.camera.follow(self.player.rect)
+        self.camera.snap()
+        self.coin_pool.release_all(self.coins_list)
+        self.text_pool.release_all(self.floating_texts)
+
+    def setup_horde(self, loaded):
+        self.enemy_arrays = self.coin_arrays = None
+        extra = []
+        if self.horde:
+            rng = random.Random(level_seed(loaded.level, self.seed) + 1)
+            extra = horde_spawns(loaded.layout, self.horde, rng)
+        if np is not None and len(loaded.layout.enemies) + len(extra) >= SOA_THRESHOLD:
+            obstacles = loaded.grid.items
+            self.enemy_arrays = EnemyArrays(list(loaded.layout.enemies) + extra, obstacles)
+            self.coin_arrays = CoinArrays(obstacles)
+            self.enemies = []
+        else:
+            for x, y, dist, d, sp in extra:
+                self.enemies.append(self.enemy_pool.acquire(x, y, dist, random, d, sp))
+
+    def step(self, inputs=NO_INPUT, dt=SIM_DT):
+        self.tick += 1
+        player = self.player
+
+        if self.game_state == "MENU":
+            if inputs.start:
+                self.game_state = "PLAYING"
+                self.score = 0
+                self.start_game(1)
+
+        elif self.game_state == "PLAYING":
+            if inputs.attack:
+                player.attack(self.enemies, self.enemy_arrays)
+            if inputs.enter:
+                if player.rect.colliderect(self.door_obj.rect):
+                    player.start_enter_door(self.door_obj)
+
+        elif self.game_state == "GAMEOVER":
+            if inputs.respawn:
+                self.game_state = "PLAYING"
+                self.start_game(self.cur_level)
+            elif inputs.quit:
+                self.game_state = "MENU"
+
+        elif self.game_state == "END_DEMO":
+            if inputs.quit:
+                self.game_state = "MENU"
+
+        PROFILER.lap('step.input')
+        if self.game_state == "PLAYING":
+            self.update_playing(inputs, dt)
+
+    def update_playing(self, inputs, dt):
+        player = self.player
+        grid = self.obstacle_grid
+        world_w = self.level.layout.width
+
+        prof = PROFILER
+        self.door_obj.update(dt)
+        prof.lap('door')
+        player.move(grid, inputs, world_w, dt)
+        prof.lap('player.move')
+
+        # หมูใกล้จออัปเดตทุก tick หมูไกลๆ อัปเดตทุก FAR_UPDATE_INTERVAL tick (สลับกันตามลำดับในลิสต์)
+        # ลบของออกจากลิสต์แบบ in-place: เลื่อนตัวที่เหลือมาข้างหน้า (ลำดับเดิม) แล้วตัดท้าย
+        active = self.camera.view_rect(ACTIVE_MARGIN, self.active)
+        enemies = self.enemies
+        keep = 0
+        for idx, e in enumerate(enemies):
+            if e.is_dying or active.colliderect(e.rect):
+                res = e.update(player.rect, grid, dt, world_w)
+            elif (self.tick + idx) % FAR_UPDATE_INTERVAL == 0:
+                res = e.update(player.rect, grid, dt, world_w, FAR_UPDATE_INTERVAL)
+            else:
+                res = None
+            if res == "hit":
+                player.take_damage(e.rect)
+            
+            if e.is_dead_finished():
+                self.coins_list.append(self.coin_pool.acquire(e.rect.centerx - 12, e.rect.centery - 12))
+                self.enemy_pool.release(e)
+            else:
+                enemies[keep] = e
+                keep += 1
+        del enemies[keep:]
+
+        horde = self.enemy_arrays
+        if horde is not None:
+            hit = horde.update(player.rect, world_w, dt, active, self.tick, FAR_UPDATE_INTERVAL)
+            if hit >= 0:
+                player.take_damage(horde.rect_of(hit))
+            spawned = horde.remove_finished()
+            if spawned is not None:
+                self.coin_arrays.spawn(*spawned)
+        prof.lap('enemies')
+
+        coins = self.coins_list
+        keep = 0
+        for c in coins:
+            c.update(grid, dt)
+            if not c.collected and player.rect.colliderect(c.rect):
+                c.collected = True
+                self.score += 1
+                self.floating_texts.append(self.text_pool.acquire(c.rect.centerx, c.rect.y, "+1", YELLOW))
+                AUDIO.play('coin')
+            if c.collected or c.life_span <= 0:
+                self.coin_pool.release(c)
+            else:
+                coins[keep] = c
+                keep += 1
+        del coins[keep:]
+
+        if self.coin_arrays is not None:
+            self.coin_arrays.update(dt)
+            spots = self.coin_arrays.collect(player.rect)
+            for cx, cy in spots:
+                self.score += 1
+                self.floating_texts.append(self.text_pool.acquire(cx, cy, "+1", YELLOW))
+            if spots:
+                AUDIO.play('coin')
+        prof.lap('coins')
+
+        texts = self.floating_texts
+        keep = 0
+        for t in texts:
+            if t.update(dt):
+                self.text_pool.release(t)
+            else:
+                texts[keep] = t
+                keep += 1
+        del texts[keep:]
+        prof.lap('texts')
+
+        res = player.update(dt)
+        self.camera.follow(player.rect)
+        prof.lap('player.update')
+        
+        if res == "dead":
+            self.game_state = "GAMEOVER"
+        
+        if res == "next_level":
+            self.cur_level += 1
+            if self.cur_level > MAX_LEVELS:
+                self.game_state = "END_DEMO"
+            else:
+                self.start_game(self.cur_level)
+
+# --- โหมด headless: รัน World.step รัวๆ ไม่มีหน้าต่าง/เสียง/จำกัดเฟรม ---
+def idle_policy(world):
+    # กดเริ่มเกม/เกิดใหม่ให้อัตโนมัติ นอกนั้นยืนเฉยๆ
+    if world.game_state == "MENU": return Inputs(start=True)
+    if world.game_state == "GAMEOVER": return Inputs(respawn=True)
+    return NO_INPUT
+
+def run_headless(ticks, policy=idle_policy, world=None):
+    world = world or World()
+    t0 = time.perf_counter()
+    prof = PROFILER
+    for _ in range(ticks):
+        prof.begin_frame()
+        world.step(policy(world))
+        prof.lap('misc')
+        prof.end_frame()
+    elapsed = time.perf_counter() - t0
+    return world, elapsed
@@ -0,0 +1,11 @@
+import os
+import sys
+
+# เทสต์รันแบบไม่มีจอ/เสียง และ path ของ asset เป็นแบบ relative กับ root ของ repo
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('ASGARD_HEADLESS', '1')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
@@ -0,0 +1,79 @@
+import tracemalloc
+from types import SimpleNamespace
+
+import pygame
+import pytest
+
+from asgard.entities import Enemy, Player
+from asgard.level import build_obstacle_grid
+from asgard.world import Inputs, NO_INPUT, World
+
+# ฉากเล็กๆ พิกัดไม่เกิน 256 (int ช่วงนี้ Python แคชไว้ ไม่นับเป็นการจองหน่วยความจำ)
+# ที่เหลือที่จองได้ต่อการเรียกคือ iterator ของ for loop อย่างเดียว ไม่มี Rect/list ใหม่
+LOOP_ONLY_BYTES = 200
+
+def solid(x, y, w, h):
+    return SimpleNamespace(rect=pygame.Rect(x, y, w, h))
+
+@pytest.fixture
+def traced():
+    tracemalloc.start()
+    yield
+    tracemalloc.stop()
+
+def worst_peak(fn, calls=300):
+    worst = 0
+    for _ in range(calls):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        fn()
+        worst = max(worst, tracemalloc.get_traced_memory()[1] - before)
+    return worst
+
+def test_query_fills_one_buffer_in_insert_order():
+    grid = build_obstacle_grid([solid(0, 200, 250, 40), solid(120, 100, 60, 28), solid(130, 0, 10, 250)])
+    a = grid.query(pygame.Rect(100, 90, 100, 150))  # คร่อมหลายช่อง: ได้ครบ ไม่ซ้ำ เรียงตามลำดับ insert
+    assert a is grid.found
+    assert [o.rect.topleft for o in a] == [(0, 200), (120, 100), (130, 0)]
+    b = grid.query(pygame.Rect(5, 130, 10, 10))
+    assert b is a and [o.rect.topleft for o in b] == [(0, 200)]
+
+def test_entity_steps_allocate_no_rects_or_lists(traced):
+    grid = build_obstacle_grid([solid(0, 200, 250, 40), solid(120, 100, 60, 28), solid(200, 150, 20, 50)])
+    player = Player()
+    player.rect.topleft = (20, 160)
+    enemy = Enemy(40, 170, 60, direction=1, speed=2)
+    run = Inputs(right=True)
+
+    def player_step():
+        player.move(grid, run, 250)
+        if player.rect.x > 150: player.rect.x = 20
+
+    assert worst_peak(player_step) < LOOP_ONLY_BYTES
+    assert worst_peak(lambda: enemy.update(player.rect, grid, 1 / 60, 250)) < LOOP_ONLY_BYTES
+    assert worst_peak(lambda: grid.query(player.rect)) < LOOP_ONLY_BYTES
+
+def test_steady_state_play_reuses_pooled_objects(traced):
+    # ตีหมูให้ตายทั้งด่าน -> เหรียญ -> เก็บเหรียญ -> ตัวเลขลอย แล้วเริ่มด่านเดิมใหม่ วนหลายรอบ
+    world = World(0)
+    world.step(Inputs(start=True))
+    player = world.player
+
+    def play_round():
+        world.start_game(1)
+        for pig in list(world.enemies):
+            pig.die()
+        for _ in range(120):
+            for coin in world.coins_list:
+                coin.rect.center = player.rect.center
+            world.step(NO_INPUT)
+        assert not world.enemies and not world.coins_list
+
+    play_round()
+    created = (world.enemy_pool.created, world.coin_pool.created, world.text_pool.created)
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(5):
+        play_round()
+    assert (world.enemy_pool.created, world.coin_pool.created, world.text_pool.created) == created
+    assert world.coin_pool.reused > 0 and world.text_pool.reused > 0
+    assert tracemalloc.get_traced_memory()[0] - before < 16 * 1024
@@ -0,0 +1,56 @@
+import pygame
+
+from asgard.assets import ASSETS, AssetCache, load_safe_image, load_safe_sound
+
+def surface(w=10, h=10):
+    return pygame.Surface((w, h), pygame.SRCALPHA)
+
+def test_loads_once_and_shares_the_asset():
+    cache = AssetCache()
+    calls = []
+    def loader():
+        calls.append(1)
+        return surface()
+    first = cache.get('a', loader)
+    assert cache.get('a', loader) is first
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_evicts_least_recently_used_within_budget():
+    one = 10 * 10 * 4
+    cache = AssetCache(budget=2 * one)
+    evicted = []
+    cache.on_evict.append(evicted.append)
+    a = cache.get('a', surface)
+    b = cache.get('b', surface)
+    cache.get('a', surface)  # a ใช้ล่าสุด b ต้องโดนไล่ก่อน
+    cache.get('c', surface)
+    assert list(cache.entries) == ['a', 'c']
+    assert evicted == [b]
+    assert cache.bytes_held == 2 * one
+
+    cache.set_budget(one)
+    assert list(cache.entries) == ['c']
+    assert evicted == [b, a]
+    assert cache.stats()['evictions'] == 2
+
+def test_keeps_the_newest_entry_even_over_budget():
+    cache = AssetCache(budget=1)
+    big = cache.get('big', lambda: surface(100, 100))
+    assert list(cache.entries) == ['big'] and cache.entries['big'][0] is big
+
+def test_load_safe_image_is_shared():
+    a = load_safe_image('assets/box/idle.png')
+    assert load_safe_image('assets/box/idle.png') is a
+    assert load_safe_image('assets/box/idle.png', scale=(20, 20)).get_size() == (20, 20)
+
+def test_sound_requested_before_mixer_init_is_not_cached_as_missing():
+    assert pygame.mixer.get_init() is None
+    assert load_safe_sound('assets/sounds/coin.wav') is None
+    assert ('sound', 'assets/sounds/coin.wav') not in ASSETS.entries
+    pygame.mixer.init()
+    try:
+        assert load_safe_sound('assets/sounds/coin.wav') is not None
+    finally:
+        ASSETS.clear()
+        pygame.mixer.quit()
@@ -0,0 +1,81 @@
+import pygame
+import pytest
+
+from asgard.assets import ASSETS
+from asgard.audio import AudioManager
+
+# ชื่อ: (ไฟล์, bus, ความดัง, priority, เล่นซ้อนได้สูงสุด)
+BANK = {
+    'low': ('assets/sounds/coin.wav', 'enemy', 1.0, 1, 8),
+    'mid': ('assets/sounds/coin.wav', 'player', 0.5, 2, 8),
+    'high': ('assets/sounds/coin.wav', 'sfx', 1.0, 3, 8),
+    'coin': ('assets/sounds/coin.wav', 'sfx', 1.0, 2, 3),
+}
+
+@pytest.fixture
+def audio():
+    # mixer ของ SDL dummy driver เล่นได้จริงแต่ไม่มีเสียงออก ต้องปิดคืนหลังเทสต์ (ตัวอื่นคาดว่า mixer ปิดอยู่)
+    pygame.mixer.init()
+    try:
+        manager = AudioManager(BANK, num_channels=4)
+        manager.init()
+        assert manager.enabled
+        # เสียงเงียบยาว 5 วินาที ช่องจะไม่ว่างระหว่างเทสต์
+        freq, size, channels = pygame.mixer.get_init()
+        silence = pygame.mixer.Sound(buffer=bytes(freq * 5 * channels * abs(size) // 8))
+        for name in BANK:
+            manager.sounds[name] = silence
+        yield manager
+    finally:
+        pygame.mixer.quit()
+        ASSETS.clear()
+
+def playing(manager):
+    return sorted(v[0] for v, ch in zip(manager.voices, manager.channels) if v is not None and ch.get_busy())
+
+def test_same_sound_is_capped_at_max_voices(audio):
+    channels = [audio.play('coin') for _ in range(5)]
+    assert playing(audio) == ['coin'] * 3
+    assert audio.stolen == 2 and audio.dropped == 0
+    # เกินแล้วแย่งตัวที่เล่นมานานสุดของเสียงเดียวกัน
+    assert channels[3] is channels[0] and channels[4] is channels[1]
+
+def test_full_channels_steal_lowest_priority_then_oldest(audio):
+    lows = [audio.play('low') for _ in range(4)]
+    assert audio.play('high') is lows[0]
+    assert audio.play('mid') is lows[1]
+    assert playing(audio) == ['high', 'low', 'low', 'mid']
+    audio.play('high')
+    audio.play('high')
+    assert playing(audio) == ['high', 'high', 'high', 'mid']
+    assert audio.stolen == 4
+    # ไม่มีช่องที่ priority ต่ำกว่าหรือเท่ากัน -> ไม่เล่น
+    assert audio.play('low') is None
+    assert audio.dropped == 1
+    assert audio.play('mid') is not None  # แย่ง mid ตัวเดิม (priority เท่ากัน)
+
+def test_bus_volume_applies_to_playing_channels(audio):
+    ch = audio.play('mid')
+    assert ch.get_volume() == pytest.approx(0.5, abs=0.01)
+    audio.set_volume('player', 0.5)
+    assert ch.get_volume() == pytest.approx(0.25, abs=0.01)
+    audio.set_volume('master', 2.0)
+    assert audio.buses['master'] == 1.0
+
+def test_headless_stays_silent_without_opening_the_mixer(capsys):
+    manager = AudioManager(BANK)
+    assert manager.play('coin') is None
+    manager.play_music('assets/sounds/missing.mp3')
+    assert not manager.enabled and pygame.mixer.get_init() is None
+    assert capsys.readouterr().out == ''
+
+def test_music_file_is_checked_once(audio, capsys, monkeypatch):
+    checks = []
+    exists = audio.music_exists
+    monkeypatch.setattr(audio, 'music_exists', lambda path: checks.append(path) or exists(path))
+    for _ in range(10):
+        audio.play_music('assets/sounds/missing.mp3')
+    audio.stop_music()
+    audio.play_music('assets/sounds/missing.mp3')
+    assert len(checks) == 2 and len(audio.music_found) == 1
+    assert capsys.readouterr().out.count('not found') == 1
@@ -0,0 +1,107 @@
+import os
+import random
+
+import pygame
+
+from asgard.settings import DISPLAY
+from asgard.assets import BAKE_SHEET, BakedAssets
+
+def noise_surface(w, h, seed):
+    rng = random.Random(seed)
+    surf = pygame.Surface((w, h), pygame.SRCALPHA)
+    for y in range(h):
+        for x in range(w):
+            surf.set_at((x, y), (rng.randrange(256), rng.randrange(256), rng.randrange(256), rng.randrange(256)))
+    return surf
+
+def same_pixels(a, b):
+    return a.get_size() == b.get_size() and pygame.image.tobytes(a, 'RGBA') == pygame.image.tobytes(b, 'RGBA')
+
+def write_source(path, seed):
+    pygame.image.save(noise_surface(16, 12, seed), str(path))
+    return str(path)
+
+def make_variants(tmp_path):
+    # ชื่อ variant -> (ต้นฉบับ, ภาพที่ได้)
+    tile = noise_surface(300, 20, 3)
+    tile.set_colorkey((0, 0, 0))
+    return {
+        'image:a:40x30': (write_source(tmp_path / 'a.png', 1), noise_surface(40, 30, 1)),
+        'image:b:600x10': (write_source(tmp_path / 'b.png', 2), noise_surface(600, 10, 2)),
+        'tile:c:h20': (write_source(tmp_path / 'c.png', 3), tile),
+    }
+
+def bake(bake_dir, variants):
+    baked = BakedAssets(bake_dir)
+    baked.recording = True
+    for name, (source, surf) in variants.items():
+        baked.get(name, source, lambda surf=surf: surf)
+    baked.recording = False
+    baked.pack()
+    return baked
+
+def never_built():
+    raise AssertionError("baked variant was rebuilt")
+
+def test_bake_round_trip(tmp_path):
+    DISPLAY.get()
+    bake_dir = str(tmp_path / 'baked')
+    variants = make_variants(tmp_path)
+    assert bake(bake_dir, variants).written == 3
+    assert sorted(os.listdir(bake_dir)) == ['manifest.json', BAKE_SHEET]
+
+    baked = BakedAssets(bake_dir)
+    loaded = {name: baked.get(name, source, never_built) for name, (source, _) in variants.items()}
+    assert baked.stats()['hits'] == 3 and baked.misses == 0
+    for name, (_, surf) in variants.items():
+        assert same_pixels(loaded[name], surf), name
+        assert loaded[name].get_colorkey() == surf.get_colorkey(), name
+    # ทุกตัวเป็น subsurface ของ sheet เดียว (decode ครั้งเดียว)
+    sheets = {id(surf.get_parent()) for surf in loaded.values()}
+    assert len(sheets) == 1 and None not in {surf.get_parent() for surf in loaded.values()}
+
+def test_bake_is_keyed_on_source_content(tmp_path, capsys):
+    DISPLAY.get()
+    bake_dir = str(tmp_path / 'baked')
+    variants = make_variants(tmp_path)
+    bake(bake_dir, variants)
+    source, surf = variants['image:a:40x30']
+
+    # เวลาแก้ไขเปลี่ยนแต่เนื้อไฟล์เดิม -> ยังใช้ของที่ bake ไว้
+    st = os.stat(source)
+    os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+    assert same_pixels(BakedAssets(bake_dir).get('image:a:40x30', source, never_built), surf)
+
+    # เนื้อไฟล์เปลี่ยน (ขนาดเท่าเดิม เวลาเดิม) -> ทำใหม่ตอนรัน แล้วเตือนครั้งเดียว
+    data = bytearray(open(source, 'rb').read())
+    data[-20] ^= 0xFF
+    with open(source, 'wb') as f:
+        f.write(data)
+    os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns))
+    capsys.readouterr()
+    baked = BakedAssets(bake_dir)
+    rebuilt = pygame.Surface((40, 30))
+    for _ in range(3):
+        assert baked.get('image:a:40x30', source, lambda: rebuilt) is rebuilt
+    assert baked.stale == 3 and baked.hits == 0
+    assert capsys.readouterr().out.count('is stale') == 1
+
+def test_missing_variants_are_reported(tmp_path, capsys):
+    DISPLAY.get()
+    bake_dir = str(tmp_path / 'baked')
+    variants = make_variants(tmp_path)
+    bake(bake_dir, variants)
+    capsys.readouterr()
+    baked = BakedAssets(bake_dir)
+    source = variants['image:a:40x30'][0]
+    built = pygame.Surface((8, 8))
+    assert baked.get('image:a:8x8', source, lambda: built) is built
+    assert 'image:a:8x8 is missing' in capsys.readouterr().out
+    # ไม่มีไฟล์ต้นฉบับ = ไม่มีอะไรให้ bake ไม่ต้องเตือน
+    assert baked.get('tile:nope:h5', str(tmp_path / 'nope.png'), lambda: built) is built
+    assert capsys.readouterr().out == ''
+    # ยังไม่เคย bake เลย -> เตือนบรรทัดเดียว
+    empty = BakedAssets(str(tmp_path / 'empty'))
+    empty.get('image:a:8x8', source, lambda: built)
+    empty.get('image:a:9x9', source, lambda: built)
+    assert capsys.readouterr().out.count('No asset bake') == 1
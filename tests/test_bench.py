@@ -0,0 +1,50 @@
+import json
+import sys
+
+import pytest
+
+from asgard import bench
+
+def test_quick_scenarios_run():
+    names = []
+    for name, op in bench.scenarios(quick=True):
+        op()
+        names.append(name)
+    assert len(names) == len(set(names))
+    for prefix in ('build_level.', 'player.move.', 'enemy.update', 'frame.', 'text.'):
+        assert any(n.startswith(prefix) for n in names), prefix
+
+def test_measure_reports_allocations():
+    held = []
+    quiet = bench.measure(lambda: None, 0.01, 1)
+    churn = bench.measure(lambda: bytes(10000), 0.01, 1)
+    leak = bench.measure(lambda: held.append([0] * 10), 0.01, 1)
+    assert quiet['ops_per_sec'] > 0
+    assert quiet['peak_bytes_per_op'] < 1000 <= 10000 <= churn['peak_bytes_per_op']
+    assert churn['kept_blocks_per_op'] < 1 <= leak['kept_blocks_per_op']
+
+def run_main(monkeypatch, *args):
+    monkeypatch.setattr(bench, 'scenarios', lambda quick: [('fast.op', lambda: None), ('other.op', lambda: None)])
+    monkeypatch.setattr(sys, 'argv', ['bench', '--quick'] + list(args))
+    bench.main()
+
+def test_baseline_compare_and_save(monkeypatch, tmp_path, capsys):
+    path = str(tmp_path / 'baseline.json')
+    run_main(monkeypatch, '--baseline', path, '--filter', 'fast', '--save-baseline')
+    saved = json.load(open(path))['results']
+    assert list(saved) == ['fast.op']
+
+    # ช้ากว่า baseline เกิน threshold -> exit 1 และบอกชื่อ scenario
+    saved['fast.op']['ops_per_sec'] *= 1000
+    with open(path, 'w') as f:
+        json.dump({'results': saved}, f)
+    capsys.readouterr()
+    with pytest.raises(SystemExit) as exc:
+        run_main(monkeypatch, '--baseline', path)
+    assert exc.value.code == 1
+    out = capsys.readouterr().out
+    assert '1 regression(s)' in out and 'fast.op' in out.split('regression(s)')[1]
+    assert 'other.op' in out
+
+    # threshold สูงพอ = ผ่าน
+    run_main(monkeypatch, '--baseline', path, '--threshold', '1.0')
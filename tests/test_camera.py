@@ -0,0 +1,72 @@
+import pygame
+
+from asgard.settings import DISPLAY, SCREEN_WIDTH, SCREEN_HEIGHT, MAX_LEVELS
+from asgard.graphics import Camera, ACTIVE_MARGIN, CULL_MARGIN, FAR_UPDATE_INTERVAL
+from asgard.entities import Enemy
+from asgard.game import GameRenderer
+from asgard.world import Inputs, NO_INPUT, World
+
+def test_camera_follows_inside_level_bounds():
+    cam = Camera(800, 600)
+    cam.set_world(2400, 600)
+    cam.follow(pygame.Rect(100, 300, 10, 10))
+    assert (cam.x, cam.y) == (0, 0)
+    cam.follow(pygame.Rect(1200, 300, 10, 10))
+    assert (cam.x, cam.y) == (1205 - 400, 0)
+    cam.follow(pygame.Rect(2390, 300, 10, 10))
+    assert (cam.x, cam.y) == (2400 - 800, 0)
+    # วาดระหว่าง step: เลื่อนจากตำแหน่งก่อนหน้าไปตำแหน่งล่าสุด
+    cam.interpolate(0.5)
+    assert cam.draw_x == round(805 + (1600 - 805) * 0.5)
+    cam.snap()
+    assert cam.draw_x == 1600 and cam.prev_x == 1600
+
+    out = pygame.Rect(0, 0, 0, 0)
+    assert cam.view_rect(50, out) is out
+    assert out == pygame.Rect(1550, -50, 900, 700)
+
+def wide_level_world():
+    world = World(0)
+    world.step(Inputs(start=True))
+    world.start_game(MAX_LEVELS)
+    assert world.level.layout.width > SCREEN_WIDTH
+    return world
+
+def test_render_skips_offscreen_enemies(monkeypatch):
+    world = wide_level_world()
+    renderer = GameRenderer(DISPLAY.get())
+    drawn = []
+    render = Enemy.render
+    monkeypatch.setattr(Enemy, 'render', lambda self, surf, cam: drawn.append(self) or render(self, surf, cam))
+    renderer.render(world)
+    visible = world.camera.view_rect(CULL_MARGIN)
+    expected = [e for e in world.enemies if visible.colliderect(e.rect)]
+    assert drawn == expected
+    assert 0 < len(drawn) < len(world.enemies)
+
+def test_far_enemies_update_every_few_ticks(monkeypatch):
+    world = wide_level_world()
+    calls = {}
+    update = Enemy.update
+
+    def counting(self, player_rect, grid, dt, world_w, steps=1):
+        calls.setdefault(id(self), []).append(steps)
+        return update(self, player_rect, grid, dt, world_w, steps)
+    monkeypatch.setattr(Enemy, 'update', counting)
+
+    active = world.camera.view_rect(ACTIVE_MARGIN)
+    assert active == pygame.Rect(-ACTIVE_MARGIN, -ACTIVE_MARGIN, SCREEN_WIDTH + ACTIVE_MARGIN * 2,
+                                 SCREEN_HEIGHT + ACTIVE_MARGIN * 2)
+    far = [e for e in world.enemies if not active.colliderect(e.rect)]
+    near = [e for e in world.enemies if active.colliderect(e.rect)]
+    assert far and near
+    start = [e.rect.x for e in far]
+    ticks = FAR_UPDATE_INTERVAL * 6
+    for _ in range(ticks):
+        world.step(NO_INPUT)
+    for e in near:
+        assert calls[id(e)] == [1] * ticks
+    for e in far:
+        assert calls[id(e)] == [FAR_UPDATE_INTERVAL] * (ticks // FAR_UPDATE_INTERVAL)
+    # หมูไกลยังเดินอยู่ (ก้าวละหลาย tick)
+    assert [e.rect.x for e in far] != start
@@ -0,0 +1,63 @@
+import pygame
+
+from asgard.settings import DISPLAY
+from asgard.graphics import DirtyRectRenderer
+from asgard.game import GameRenderer
+from asgard.world import Inputs, World
+
+def record_display(monkeypatch):
+    calls = []
+    monkeypatch.setattr(pygame.display, 'flip', lambda: calls.append('flip'))
+    monkeypatch.setattr(pygame.display, 'update', lambda rects: calls.append([pygame.Rect(r) for r in rects]))
+    return calls
+
+def test_update_covers_old_and_new_rects(monkeypatch):
+    calls = record_display(monkeypatch)
+    screen = pygame.Surface((100, 100))
+    background = pygame.Surface((100, 100))
+    background.fill((10, 20, 30))
+    dirty = DirtyRectRenderer(enabled=True)
+
+    # เฟรมแรกวาดเต็มจอ
+    dirty.begin(screen, background)
+    dirty.add(screen.fill((255, 0, 0), (10, 10, 5, 5)))
+    dirty.present()
+    assert calls.pop() == 'flip'
+    lists = {id(dirty.rects), id(dirty.prev_rects)}
+
+    # เฟรมถัดไป: ลบ rect เก่าด้วยพื้นหลัง แล้วอัปเดตทั้ง rect เก่าและใหม่
+    dirty.begin(screen, background)
+    assert screen.get_at((12, 12))[:3] == (10, 20, 30)
+    dirty.add(screen.fill((0, 255, 0), (50, 50, 5, 5)))
+    dirty.add(None)  # blit นอกจอ/ไม่ได้วาด
+    dirty.present()
+    assert calls.pop() == [pygame.Rect(10, 10, 5, 5), pygame.Rect(50, 50, 5, 5)]
+    # สลับลิสต์สองใบเดิม ไม่สร้างใหม่
+    assert {id(dirty.rects), id(dirty.prev_rects)} == lists
+
+    dirty.invalidate()
+    dirty.begin(screen, background)
+    dirty.present()
+    assert calls.pop() == 'flip'
+    # นอก begin/present ไม่เก็บ rect (โหมดวาดเต็มจอ)
+    dirty.add(pygame.Rect(0, 0, 5, 5))
+    assert dirty.rects == []
+
+def test_dirty_frames_match_full_frames(monkeypatch):
+    calls = record_display(monkeypatch)
+    screen = DISPLAY.get()
+    world = World(0)
+    world.step(Inputs(start=True))
+    dirty_renderer = GameRenderer(screen)
+    dirty_renderer.dirty.enabled = True
+    full_renderer = GameRenderer(screen)
+    for tick in range(120):
+        world.step(Inputs(right=tick < 60, left=tick >= 90, jump=tick % 40 == 0, attack=tick % 25 == 0))
+        dirty_renderer.render(world)
+        got = pygame.image.tobytes(screen, 'RGB')
+        full_renderer.render(world)
+        assert got == pygame.image.tobytes(screen, 'RGB'), tick
+    # หลังเฟรมแรก dirty renderer อัปเดตแค่บางส่วนของจอ
+    updates = [c for c in calls[::2] if c != 'flip']
+    assert len(updates) > 100
+    assert all(sum(r.w * r.h for r in rects) < screen.get_width() * screen.get_height() // 2 for rects in updates)
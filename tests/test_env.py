@@ -0,0 +1,42 @@
+import os
+import random
+
+import pygame
+
+from asgard.env import AsgardEnv, ENV_ACTIONS, ENV_LAYOUTS
+from asgard.audio import AUDIO
+from asgard.level import LAYOUT_CACHE_DIR
+
+def layout_files():
+    return sorted(os.listdir(LAYOUT_CACHE_DIR)) if os.path.isdir(LAYOUT_CACHE_DIR) else []
+
+def play(env, seed, level, actions):
+    # ด่าน 4 ขึ้นไปกว้างกว่าจอ มีหมูไกลจอที่อัปเดตสลับ tick
+    env.reset(seed)
+    env.world.start_game(level)
+    trace = []
+    for a in actions:
+        obs, reward, terminated, truncated, info = env.step(a)
+        pigs = [tuple(e.rect) for e in env.world.enemies]
+        trace.append((list(obs), reward, info['hp'], info['score'], pigs))
+        if terminated: break
+    return trace
+
+def test_reset_with_same_seed_is_reproducible_on_wide_levels():
+    rng = random.Random(3)
+    actions = [rng.randrange(len(ENV_ACTIONS)) for _ in range(300)]
+    env = AsgardEnv()
+    first = play(env, 7, 10, actions)
+    play(env, 11, 2, actions[:57])  # episode อื่นคั่น ให้ tick/pool ไม่ได้เริ่มจากสถานะเดิม
+    assert play(env, 7, 10, actions) == first
+
+def test_env_does_not_write_layout_files_or_open_audio():
+    before = layout_files()
+    env = AsgardEnv(seed=1)
+    for _ in range(5):
+        env.reset()
+        env.step(0)
+    assert layout_files() == before
+    assert len(ENV_LAYOUTS.memory) <= ENV_LAYOUTS.memory_limit
+    assert not AUDIO.enabled
+    assert pygame.mixer.get_init() is None
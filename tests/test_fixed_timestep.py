@@ -0,0 +1,68 @@
+import pygame
+
+from asgard.settings import DISPLAY
+from asgard.graphics import Camera
+from asgard.entities import Enemy, Player
+from asgard.game import GameRenderer
+from asgard.world import Inputs, World
+
+def test_taps_between_steps_are_kept_once():
+    # เฟรมที่ไม่มี sim step: ปุ่มที่กดครั้งเดียวต้องรอไปถึง step ถัดไป ปุ่มค้างเอาสถานะล่าสุด
+    pending = Inputs()
+    pending = pending.merged(Inputs(right=True, attack=True))
+    pending = pending.merged(Inputs(left=True, jump=True))
+    assert (pending.left, pending.right, pending.jump, pending.attack) == (True, False, True, True)
+
+    # หลายก้าวในเฟรมเดียว: ก้าวแรกได้ปุ่มทั้งหมด ก้าวถัดไปเหลือแค่ปุ่มค้าง
+    steps = []
+    for _ in range(3):
+        steps.append(pending)
+        pending = pending.held()
+    assert [s.attack for s in steps] == [True, False, False]
+    assert all(s.left and s.jump for s in steps)
+    assert pending.merged(Inputs(start=True)).start
+
+def world_state(world):
+    return (world.tick, world.score, world.game_state, tuple(world.player.rect),
+            [tuple(e.rect) for e in world.enemies], [tuple(c.rect) for c in world.coins_list])
+
+def test_rendering_between_steps_does_not_change_the_simulation():
+    # เฟรมวาดกี่ครั้งต่อ step ก็ได้ (จอ 144Hz วาด 2-3 ครั้งต่อ tick) ผลของ world ต้องเหมือนเดิม
+    renderer = GameRenderer(DISPLAY.get())
+    worlds = [World(0), World(0)]
+    for w in worlds:
+        w.step(Inputs(start=True))
+    for tick in range(180):
+        inp = Inputs(right=tick < 90, left=tick >= 120, jump=tick % 30 == 0, attack=tick % 20 == 0)
+        for w in worlds:
+            w.step(inp)
+        for alpha in (0.0, 0.4, 0.8):
+            renderer.render(worlds[0], alpha)
+        assert world_state(worlds[0]) == world_state(worlds[1]), tick
+
+def test_entities_draw_between_last_two_steps():
+    surf = pygame.Surface((800, 600))
+    cam = Camera(800, 600)
+    cam.interpolate(0.25)
+
+    player = Player()
+    player.prev_x, player.prev_y = 100, 400
+    player.rect.topleft = (108, 396)
+    at_quarter = player.render(surf, cam)
+    cam.interpolate(1.0)
+    at_end = player.render(surf, cam)
+    assert (at_end.x - at_quarter.x, at_end.y - at_quarter.y) == (6, -3)
+
+    enemy = Enemy(200, 300, 100, direction=1, speed=2)
+    enemy.prev_x, enemy.prev_y = 200, 300
+    enemy.rect.x = 204
+    cam.interpolate(0.5)
+    mid = enemy.render(surf, cam)
+    cam.interpolate(1.0)
+    assert enemy.render(surf, cam).x - mid.x == 2
+
+    # กล้องก็เลื่อนตาม alpha เดียวกัน
+    cam.set_world(2400, 600)
+    cam.follow(pygame.Rect(1200, 300, 10, 10))
+    cam.interpolate(0.5)
+    assert cam.draw_x == round(cam.x / 2)
@@ -0,0 +1,18 @@
+import pygame
+
+from asgard.graphics import FONT_SPECS, Fonts
+
+# Monocraft เป็นฟอนต์ความกว้างเท่ากัน -> ขนาดข้อความ HUD คำนวณได้แน่นอนทุกเครื่อง
+ADVANCE = {'main': 20, 'small': 13}
+
+def test_bundled_font_metrics():
+    fonts = Fonts()
+    for name, (size, bold) in FONT_SPECS.items():
+        font = fonts.get(name)
+        assert isinstance(font, pygame.font.Font)
+        assert font.get_height() == size
+        assert font.get_bold() == bold
+        for text in ('0', 'Coins: 12', 'Level: 3/10', 'Press ENTER to Start'):
+            assert font.size(text) == (ADVANCE[name] * len(text), size), text
+        # ตัวที่มีหางล่างสูงเกิน get_height() 1px
+        assert font.size('gjpqy')[1] == size + 1
@@ -0,0 +1,38 @@
+import pygame
+
+from asgard.assets import ASSETS, FRAMES, AssetCache, FrameAtlas, load_safe_image
+
+SHEET_BYTES = 6 * 32 * 32 * 4
+
+def sheet():
+    return pygame.Surface((6 * 32, 32), pygame.SRCALPHA)
+
+def test_evicted_sheets_leave_the_atlas():
+    cache = AssetCache(budget=2 * SHEET_BYTES)
+    atlas = FrameAtlas()
+    cache.on_evict.append(atlas.forget)
+    # เล่นวนหลายรอบ ภาพเก่าโดนไล่ออกแล้วโหลดใหม่ จำนวนชุดเฟรมต้องไม่โตตาม
+    for i in range(20):
+        img = cache.get(('sheet', i % 4), sheet)
+        atlas.get_frames(img, (32, 32), 6, (40, 40))
+        atlas.get_frames(img, (32, 32), 6, (40, 40), flipped=True)
+        held = {asset for asset, _ in cache.entries.values()}
+        assert {key[0] for key in atlas.frame_sets} <= held
+    assert cache.evictions > 0
+    assert len(atlas.frame_sets) <= 2 * len(cache.entries)
+
+def test_clearing_assets_drops_their_frames():
+    img = load_safe_image('assets/door/opening.png')
+    FRAMES.get_frames(img, (46, 56), 5, (92, 112))
+    assert any(key[0] is img for key in FRAMES.frame_sets)
+    ASSETS.clear()
+    assert not any(key[0] is img for key in FRAMES.frame_sets)
+
+def test_frames_are_sliced_once_and_shared():
+    atlas = FrameAtlas()
+    img = sheet()
+    frames = atlas.get_frames(img, (32, 32), 6, (40, 40))
+    assert len(frames) == 6 and all(f.get_size() == (40, 40) for f in frames)
+    assert atlas.get_frames(img, [32, 32], 6, [40, 40]) is frames
+    flipped = atlas.get_frames(img, (32, 32), 6, (40, 40), flipped=True)
+    assert len(flipped) == 6 and flipped is not frames
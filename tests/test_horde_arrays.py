@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from asgard import world as world_module
+from asgard.world import Inputs, World
+
+np = pytest.importorskip('numpy')
+
+HORDE = 250  # หมูในด่าน + 250 เกิน SOA_THRESHOLD -> ใช้ EnemyArrays/CoinArrays
+
+def random_inputs(seed, ticks):
+    rng = random.Random(seed)
+    yield Inputs(start=True)
+    for _ in range(ticks):
+        yield Inputs(left=rng.random() < 0.3, right=rng.random() < 0.5, jump=rng.random() < 0.1,
+                     attack=rng.random() < 0.3, enter=rng.random() < 0.2, respawn=rng.random() < 0.05)
+
+def snapshot(world):
+    # ลำดับในลิสต์กับใน array ไม่จำเป็นต้องตรงกัน -> เทียบเป็นชุดที่เรียงแล้ว
+    pigs = [(e.rect.x, e.rect.y, e.is_dying) for e in world.enemies]
+    coins = [(c.rect.x, c.rect.y) for c in world.coins_list]
+    arr = world.enemy_arrays
+    if arr is not None:
+        pigs += [(int(x), int(y), bool(d)) for x, y, d in zip(arr.x, arr.y, arr.dying)]
+    arr = world.coin_arrays
+    if arr is not None:
+        coins += [(int(x), int(y)) for x, y in zip(arr.x, arr.y)]
+    p = world.player
+    return (world.cur_level, world.game_state, world.score, tuple(p.rect), p.hp,
+            sorted(pigs), sorted(coins), len(world.floating_texts))
+
+def run(seed, level, ticks, soa):
+    world = World(seed, horde=HORDE)
+    trace = []
+    for t, inp in enumerate(random_inputs(seed, ticks)):
+        world.step(inp)
+        if t == 0 and level != 1: world.start_game(level)
+        assert (world.enemy_arrays is not None) == soa or world.game_state != "PLAYING"
+        if t % 10 == 0: trace.append(snapshot(world))
+    return trace
+
+# ด่าน 1 กว้างเท่าจอ (หมูอัปเดตทุก tick), ด่าน 6 กว้างกว่าจอ (หมูไกลจออัปเดตทุก FAR_UPDATE_INTERVAL tick)
+@pytest.mark.parametrize('seed, level', [(0, 1), (1, 1), (2, 6)])
+def test_arrays_match_object_path(seed, level, monkeypatch):
+    arrays = run(seed, level, 1000, soa=True)
+    monkeypatch.setattr(world_module, 'SOA_THRESHOLD', 10 ** 9)
+    objects = run(seed, level, 1000, soa=False)
+    for i, (a, b) in enumerate(zip(arrays, objects)):
+        assert a == b, f"diverged at tick {i * 10}"
@@ -0,0 +1,31 @@
+import pygame
+
+from asgard.world import Inputs
+
+class HeldKeys:
+    def __init__(self, *held):
+        self.held = held
+
+    def __getitem__(self, key):
+        return key in self.held
+
+def keydown(key):
+    return pygame.event.Event(pygame.KEYDOWN, key=key)
+
+def test_held_keys_only_drive_movement(monkeypatch):
+    monkeypatch.setattr(pygame.key, 'get_pressed', lambda: HeldKeys(pygame.K_a, pygame.K_w, pygame.K_q, pygame.K_r))
+    inp = Inputs.from_pygame([])
+    assert inp.left and inp.jump and not inp.right
+    # Q/R ค้างไว้ไม่นับ ต้องเป็น KEYDOWN เท่านั้น
+    assert not inp.quit and not inp.respawn
+
+def test_presses_come_from_keydown_events(monkeypatch):
+    monkeypatch.setattr(pygame.key, 'get_pressed', lambda: HeldKeys())
+    inp = Inputs.from_pygame([keydown(pygame.K_q), keydown(pygame.K_j), keydown(pygame.K_RETURN)])
+    assert inp.quit and inp.attack and inp.start
+    assert not inp.respawn and not inp.enter
+
+def test_bits_round_trip():
+    inp = Inputs(left=True, attack=True, quit=True)
+    back = Inputs.from_bits(inp.to_bits())
+    assert [getattr(back, f) for f in Inputs.FIELDS] == [getattr(inp, f) for f in Inputs.FIELDS]
@@ -0,0 +1,22 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from asgard.level import LayoutCache, generate_layout, level_width
+
+def save_many(cache_dir):
+    cache = LayoutCache(cache_dir)
+    layout = generate_layout(5, 3, level_width(5))
+    path = cache.path_for(5, 3, level_width(5), layout.height)
+    for _ in range(50):
+        cache.save(path, layout)
+    return path
+
+def test_concurrent_saves_of_the_same_seed_leave_a_valid_file(tmp_path):
+    cache_dir = str(tmp_path)
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        paths = list(pool.map(save_many, [cache_dir] * 4))
+
+    assert sorted(os.listdir(cache_dir)) == [os.path.basename(paths[0])]
+    loaded = LayoutCache(cache_dir).load(paths[0])
+    assert loaded is not None
+    assert loaded.to_dict() == generate_layout(5, 3, level_width(5)).to_dict()
@@ -0,0 +1,46 @@
+import json
+import pickle
+import subprocess
+import sys
+
+import pygame
+
+from asgard.settings import DISPLAY, SCREEN_WIDTH, MAX_LEVELS
+from asgard.level import (PLATFORM_KINDS, LevelLayout, generate_layout, generate_layouts,
+                          instantiate_layout, level_width)
+
+def test_generate_layout_is_plain_data():
+    for lvl in range(1, MAX_LEVELS + 1):
+        layout = generate_layout(lvl, 3, level_width(lvl))
+        data = layout.to_dict()
+        # ไม่มี Surface/Rect ปน ส่งข้าม process และเขียน json ได้
+        assert json.loads(json.dumps(data)) == json.loads(json.dumps(LevelLayout.from_dict(data).to_dict()))
+        assert pickle.loads(pickle.dumps(layout)).to_dict() == data
+        assert generate_layout(lvl, 3, level_width(lvl)).to_dict() == data
+
+def test_generate_layout_needs_no_display():
+    code = ("import pygame\n"
+            "from asgard.level import generate_layout, level_width\n"
+            "generate_layout(5, 0, level_width(5))\n"
+            "print(pygame.display.get_init(), pygame.mixer.get_init())\n")
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    assert out.splitlines()[-1] == 'False None'
+
+def test_process_pool_matches_serial():
+    jobs = [(lvl, seed) for lvl in (1, 4, MAX_LEVELS) for seed in range(3)]
+    pooled = generate_layouts(jobs, workers=2)
+    for (lvl, seed), layout in zip(jobs, pooled):
+        assert layout.to_dict() == generate_layout(lvl, seed, level_width(lvl)).to_dict()
+
+def test_instantiate_layout_follows_the_data():
+    DISPLAY.get()
+    layout = generate_layout(MAX_LEVELS, 0, level_width(MAX_LEVELS))
+    platforms, boxes, decorations, enemies, door, bg_img = instantiate_layout(layout)
+    assert [(p.rect.topleft, p.rect.size, p.is_wall) for p in platforms] == \
+        [((x, y), (w, h), PLATFORM_KINDS[kind][1]) for kind, x, y, w, h in layout.platforms]
+    assert [b.rect.topleft for b in boxes] == layout.boxes
+    assert [tuple(d.rect) for d in decorations] == layout.decorations
+    assert [(e.rect.x, e.rect.y, e.dist, e.dir, e.speed) for e in enemies] == layout.enemies
+    x, y = layout.door
+    assert door.rect == pygame.Rect(x + 20, y + 20, 50, 80)
+    assert bg_img.get_size() == (SCREEN_WIDTH, layout.height)
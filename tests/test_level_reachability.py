@@ -0,0 +1,67 @@
+import random
+
+import pygame
+import pytest
+
+from asgard.settings import MAX_LEVELS, SCREEN_HEIGHT
+from asgard.level import (PLAYER_H, door_reachable, generate_layout, level_seed, level_width, place_layout,
+                          simulate_jump)
+from asgard.world import Inputs, World
+
+SEEDS = range(12)
+
+@pytest.mark.parametrize('lvl', range(1, MAX_LEVELS + 1))
+def test_every_level_has_a_reachable_door_inside_its_bounds(lvl):
+    width = level_width(lvl)
+    for seed in SEEDS:
+        layout = generate_layout(lvl, seed, width)
+        assert layout.stats['reachable'], (lvl, seed)
+        assert layout.platforms[0][1:4] == (0, 600, width)  # พื้นยาวเต็มด่าน
+        for kind, x, y, w, h in layout.platforms:
+            assert 0 <= x and x + w <= width, (lvl, seed, kind)
+        door_x, door_y = layout.door
+        assert 0 <= door_x and door_x + 92 <= width
+
+def test_unreachable_layout_is_regenerated():
+    # ด่าน 4 seed 0 แบบสุ่มรอบเดียว: ประตูไกลจาก path platform อันสุดท้ายเกินกระโดดถึง
+    first = place_layout(random.Random(level_seed(4, 0)), 4, 0, level_width(4), SCREEN_HEIGHT)
+    assert not door_reachable(first)
+    layout = generate_layout(4, 0, level_width(4))
+    assert layout.stats['reachable'] and layout.stats['attempts'] > 1
+
+def test_reachable_layouts_keep_their_first_placement():
+    for lvl in (1, 5, 10):
+        layout = generate_layout(lvl, 3, level_width(lvl))
+        if layout.stats['attempts'] == 1:
+            first = place_layout(random.Random(level_seed(lvl, 3)), lvl, 3, level_width(lvl), SCREEN_HEIGHT)
+            assert first.platforms == layout.platforms
+
+def test_jump_simulation_lands_where_the_player_does():
+    # เช็คตัวจำลองกับ Player.move จริงบนด่านกว้าง: กระโดด/เดินตกจากจุดสุ่มแล้วต้องลงที่เดียวกัน
+    rng = random.Random(1)
+    checked = 0
+    while checked < 150:
+        world = World(rng.randint(0, 30))
+        world.start_game(rng.randint(4, MAX_LEVELS))
+        layout = world.level.layout
+        solids = [pygame.Rect(x, y, w, h) for _, x, y, w, h in layout.platforms]
+        solids += [pygame.Rect(x, y, 40, 40) for x, y in layout.boxes]
+        src = rng.choice(solids)
+        x = rng.randint(src.left - 30, src.right - 4)
+        if pygame.Rect(x, src.top - PLAYER_H, 34, PLAYER_H).collidelist(solids) != -1: continue
+        direction, jump, delay = rng.choice([-1, 0, 1]), rng.random() < 0.8, rng.choice([0, 8])
+
+        landed = simulate_jump(solids, layout.width, layout.height, x, src.top, direction, jump, delay)
+        player = world.player
+        player.rect.topleft = (x, src.top - PLAYER_H)
+        player.vel_y, player.on_ground = 0, True
+        real = None
+        for t in range(200):
+            moving = t >= delay
+            player.move(world.obstacle_grid, Inputs(left=moving and direction < 0, right=moving and direction > 0,
+                                                   jump=jump and t == 0), layout.width)
+            if t > 0 and player.on_ground and (jump or player.rect.bottom != src.top):
+                real = player.rect.bottom if player.rect.bottom < layout.height else None
+                break
+        assert real == (landed.top if landed is not None else None)
+        checked += 1
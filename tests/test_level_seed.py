@@ -0,0 +1,15 @@
+from asgard.settings import MAX_LEVELS
+from asgard.level import level_seed, generate_layout, level_width
+
+def test_seed_zero_keeps_the_original_layouts():
+    assert [level_seed(lvl) for lvl in range(1, MAX_LEVELS + 1)] == [lvl * 100 for lvl in range(1, MAX_LEVELS + 1)]
+
+def test_level_seeds_do_not_collide_across_sessions():
+    seeds = [level_seed(lvl, seed) for seed in range(1000) for lvl in range(1, MAX_LEVELS + 1)]
+    assert len(set(seeds)) == len(seeds)
+
+def test_other_session_seed_gives_a_different_layout():
+    # เดิม seed 100 ด่าน 1 ได้ผังเดียวกับ seed 0 ด่าน 2
+    a = generate_layout(1, 100, level_width(1)).to_dict()
+    b = generate_layout(2, 0, level_width(1)).to_dict()
+    assert a['platforms'] != b['platforms']
@@ -0,0 +1,41 @@
+import random
+
+import pygame
+
+from asgard.level import OccupancyGrid, check_overlap
+
+# OccupancyGrid ต้องตอบเหมือน check_overlap ที่ไล่ทุก rect ทุกกรณี
+def random_rects(rng, n):
+    return [pygame.Rect(rng.randint(0, 1100), rng.randint(0, 650), rng.randint(10, 300), rng.randint(10, 140))
+            for _ in range(n)]
+
+def test_is_free_matches_check_overlap():
+    rng = random.Random(1)
+    for _ in range(50):
+        rects = random_rects(rng, rng.randint(0, 25))
+        grid = OccupancyGrid()
+        for r in rects: grid.add(r)
+        for candidate in random_rects(rng, 40):
+            margin = rng.choice([0, 10, 40, 60])
+            assert grid.is_free(candidate, margin) == (not check_overlap(candidate, rects, margin))
+
+def test_free_spans_match_check_overlap_at_every_x():
+    rng = random.Random(2)
+    for _ in range(60):
+        rects = random_rects(rng, rng.randint(0, 20))
+        grid = OccupancyGrid()
+        for r in rects: grid.add(r)
+        x_min = rng.randint(0, 400)
+        x_max = x_min + rng.randint(0, 800)
+        y, w, h = rng.randint(0, 650), rng.randint(20, 300), rng.randint(10, 140)
+        margin = rng.choice([0, 10, 40, 60])
+
+        spans = grid.free_spans(x_min, x_max, y, w, h, margin)
+        from_spans = {x for lo, hi in spans for x in range(lo, hi + 1)}
+        brute = {x for x in range(x_min, x_max + 1)
+                 if not check_overlap(pygame.Rect(x, y, w, h), rects, margin)}
+        assert from_spans == brute
+
+        x = grid.sample_free(rng, x_min, x_max, y, w, h, margin)
+        assert (x is None) == (not brute)
+        assert x is None or x in brute
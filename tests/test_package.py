@@ -0,0 +1,39 @@
+import os
+import subprocess
+import sys
+
+def run_python(*args):
+    # process ใหม่ (pygame ยังไม่ถูก import) และไม่ตั้ง ASGARD_HEADLESS เหมือนตอนเล่นจริง
+    env = dict(os.environ)
+    env.pop('ASGARD_HEADLESS', None)
+    return subprocess.run([sys.executable] + list(args), capture_output=True, text=True, env=env, timeout=120)
+
+def test_import_does_not_start_pygame():
+    code = ("import sys, pygame\n"
+            "import asgard, asgard.game, asgard.world, asgard.level, asgard.entities, asgard.graphics\n"
+            "import asgard.audio, asgard.assets, asgard.replay, asgard.env, asgard.batch\n"
+            "print(pygame.get_init(), pygame.display.get_init(), pygame.mixer.get_init(),\n"
+            "      pygame.font.get_init(), 'asgard.__main__' in sys.modules)\n")
+    out = run_python('-c', code)
+    assert out.returncode == 0, out.stderr
+    assert out.stdout.splitlines()[-1] == 'False False None False False'
+
+def test_headless_world_uses_dummy_drivers():
+    # ASGARD_HEADLESS ต้องเลือก dummy driver เอง (เปิดจอได้เพราะ convert_alpha ต้องมี แต่ไม่มีหน้าต่าง ไม่เปิดเสียง)
+    code = ("import pygame\n"
+            "from asgard.world import Inputs, World\n"
+            "world = World(0)\n"
+            "world.step(Inputs(start=True))\n"
+            "for _ in range(120): world.step(Inputs(right=True))\n"
+            "print(world.game_state, pygame.display.get_driver(), pygame.mixer.get_init())\n")
+    env = {k: v for k, v in os.environ.items() if not k.startswith('SDL_')}
+    env['ASGARD_HEADLESS'] = '1'
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=env, timeout=120)
+    assert out.returncode == 0, out.stderr
+    assert out.stdout.splitlines()[-1] == 'PLAYING dummy None'
+
+def test_startup_check_reports_first_frame():
+    # เวลาจริงขึ้นกับเครื่อง/โหลดตอนรันเทสต์ ตรวจแค่ว่าวัดและรายงานได้ (exit 0/1 = อยู่ใน/เกิน budget)
+    out = run_python('-m', 'asgard', '--startup-check')
+    assert out.returncode in (0, 1), out.stderr
+    assert 'first frame' in out.stdout and 'budget' in out.stdout
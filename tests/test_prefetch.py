@@ -0,0 +1,43 @@
+import threading
+
+from asgard.level import LevelPrefetcher, LoadedLevel
+
+def test_take_waits_for_a_level_that_is_still_being_built():
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_build(level, seed):
+        started.set()
+        release.wait(5)
+        return LoadedLevel(level, seed)
+
+    prefetcher = LevelPrefetcher(prerender=False)
+    prefetcher.pending[(2, 0)] = prefetcher.executor.submit(slow_build, 2, 0)
+    assert started.wait(5)
+    threading.Timer(0.05, release.set).start()
+
+    loaded = prefetcher.take(2, 0)
+    assert loaded is not None and loaded.level == 2
+    assert (prefetcher.hits, prefetcher.misses, prefetcher.waits) == (1, 0, 1)
+    prefetcher.shutdown()
+
+def test_take_without_request_or_with_error_is_a_miss():
+    prefetcher = LevelPrefetcher(prerender=False)
+    assert prefetcher.take(3, 0) is None
+    prefetcher.pending[(4, 0)] = prefetcher.executor.submit(lambda: 1 / 0)
+    assert prefetcher.take(4, 0) is None
+    assert prefetcher.misses == 2
+    prefetcher.shutdown()
+
+def test_a_new_request_drops_levels_nobody_took():
+    prefetcher = LevelPrefetcher(prerender=False)
+    prefetcher.request(2, 0)
+    prefetcher.request(2, 0)
+    prefetcher.request(5, 0)  # เช่นกลับเมนูแล้วเริ่มด่านอื่น
+    prefetcher.request(5, 9)
+    assert list(prefetcher.pending) == [(5, 9)]
+    assert prefetcher.dropped == 2
+    assert prefetcher.take(2, 0) is None
+    assert prefetcher.take(5, 9).level == 5
+    assert not prefetcher.pending
+    prefetcher.shutdown()
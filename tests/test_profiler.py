@@ -0,0 +1,18 @@
+from asgard.profiler import FrameProfiler
+
+def test_enabling_mid_frame_skips_the_partial_frame():
+    prof = FrameProfiler()
+    prof.begin_frame()
+    prof.lap('events')
+    prof.toggle_overlay()  # F3 กลางเฟรม
+    prof.lap('step')
+    prof.end_frame()
+    assert len(prof.records) == 0
+
+    prof.begin_frame()
+    prof.lap('events')
+    prof.end_frame()
+    assert len(prof.records) == 1
+    _, total, sections = prof.records[0]
+    assert total < 1000.0
+    assert sections['events'] < 1000.0
@@ -0,0 +1,25 @@
+import pygame
+
+from asgard.settings import DISPLAY
+from asgard.game import GameRenderer
+from asgard.world import Inputs, World
+
+class CountingSurface(pygame.Surface):
+    made = 0
+
+    def __init__(self, *args, **kwargs):
+        CountingSurface.made += 1
+        super().__init__(*args, **kwargs)
+
+def test_overlay_screens_do_not_allocate_surfaces_per_frame(monkeypatch):
+    renderer = GameRenderer(DISPLAY.get())
+    world = World(0)
+    world.step(Inputs(start=True))
+    for state in ("GAMEOVER", "END_DEMO"):
+        world.game_state = state
+        renderer.render(world)  # เฟรมแรกของแต่ละหน้าจอสร้างข้อความเก็บลง cache ได้
+        monkeypatch.setattr(pygame, 'Surface', CountingSurface)
+        for _ in range(5):
+            renderer.render(world)
+        monkeypatch.undo()
+    assert CountingSurface.made == 0
@@ -0,0 +1,69 @@
+import json
+import random
+
+import pytest
+
+from asgard.level import GENERATOR_VERSION
+from asgard.replay import InputRecorder, Replay
+from asgard.world import Inputs, World
+
+TICKS = 3000
+
+def snapshot(world):
+    p = world.player
+    return (world.tick, world.cur_level, world.game_state, world.score, tuple(p.rect), p.hp,
+            [(tuple(e.rect), e.is_dying) for e in world.enemies], [tuple(c.rect) for c in world.coins_list])
+
+def record(seed, path):
+    rng = random.Random(seed)
+    world = World(seed)
+    recorder = InputRecorder(seed)
+    trace = []
+    for t in range(TICKS):
+        if t == 0:
+            inp = Inputs(start=True)
+        else:
+            inp = Inputs(left=rng.random() < 0.3, right=rng.random() < 0.5, jump=rng.random() < 0.1,
+                         attack=rng.random() < 0.3, enter=rng.random() < 0.2, respawn=rng.random() < 0.05)
+        recorder.record(inp)
+        world.step(inp)
+        trace.append(snapshot(world))
+    recorder.save(path)
+    return trace
+
+def play(path):
+    replay = Replay.load(path)
+    world = replay.new_world()
+    trace = []
+    for inp in replay.inputs():
+        world.step(inp)
+        trace.append(snapshot(world))
+    return trace
+
+def test_replay_reproduces_the_recorded_run(tmp_path):
+    path = str(tmp_path / 'run.json')
+    recorded = record(5, path)
+    assert len(Replay.load(path)) == TICKS
+    assert play(path) == recorded
+    assert play(path) == recorded
+
+def test_replay_from_another_level_generator_is_refused(tmp_path):
+    path = str(tmp_path / 'old.json')
+    recorder = InputRecorder(3)
+    recorder.record(Inputs(start=True))
+    recorder.save(path)
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    assert data['generator'] == GENERATOR_VERSION
+
+    data['generator'] = GENERATOR_VERSION - 1
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    with pytest.raises(ValueError, match='generator'):
+        Replay.load(path)
+
+    del data['generator']  # ไฟล์ที่อัดก่อนมี header นี้
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    with pytest.raises(ValueError, match='generator'):
+        Replay.load(path)
@@ -0,0 +1,52 @@
+import random
+from types import SimpleNamespace
+
+import pygame
+
+from asgard.level import SpatialHash, build_obstacle_grid, generate_layout, level_width
+
+def random_rect(rng, span=1000):
+    # ติดลบ/กว้างข้ามหลายช่อง/กว้าง 0 ก็ต้องเจอเหมือนไล่ทุกตัว
+    return pygame.Rect(rng.randint(-200, span), rng.randint(-200, span), rng.randint(0, 300), rng.randint(0, 300))
+
+def colliding(found, rect):
+    return [o for o in found if rect.colliderect(o.rect)]
+
+def test_query_matches_brute_force():
+    rng = random.Random(6)
+    for cell_size in (32, 128):
+        items = [SimpleNamespace(rect=random_rect(rng)) for _ in range(200)]
+        grid = SpatialHash(cell_size)
+        for obj in items: grid.insert(obj)
+        for _ in range(500):
+            rect = random_rect(rng)
+            found = grid.query(rect)
+            # เรียงตามลำดับ insert ไม่มีตัวซ้ำ
+            index = [items.index(o) for o in found]
+            assert index == sorted(set(index))
+            assert colliding(found, rect) == colliding(items, rect)
+
+def test_cell_edges():
+    grid = SpatialHash(100)
+    left = SimpleNamespace(rect=pygame.Rect(0, 0, 100, 100))     # ช่อง (0, 0) พอดี
+    right = SimpleNamespace(rect=pygame.Rect(100, 0, 100, 100))  # ช่อง (1, 0) พอดี
+    grid.insert(left)
+    grid.insert(right)
+    assert grid.query(pygame.Rect(99, 10, 1, 1)) == [left]
+    assert grid.query(pygame.Rect(100, 10, 1, 1)) == [right]
+    assert grid.query(pygame.Rect(99, 10, 2, 1)) == [left, right]
+    grid.clear()
+    assert grid.query(pygame.Rect(0, 0, 200, 100)) == []
+
+def test_level_grid_matches_obstacle_scan():
+    rng = random.Random(1)
+    for lvl in (1, 5, 10):
+        layout = generate_layout(lvl, 0, level_width(lvl))
+        obstacles = [SimpleNamespace(rect=pygame.Rect(x, y, w, h)) for _, x, y, w, h in layout.platforms]
+        obstacles += [SimpleNamespace(rect=pygame.Rect(x, y, 40, 40)) for x, y in layout.boxes]
+        grid = build_obstacle_grid(obstacles)
+        for _ in range(300):
+            # ขนาดประมาณผู้เล่น/หมู + sweep ตอนขยับ
+            rect = pygame.Rect(rng.randint(0, layout.width), rng.randint(0, layout.height),
+                               rng.randint(30, 60), rng.randint(30, 60))
+            assert colliding(grid.query(rect), rect) == colliding(obstacles, rect)
@@ -0,0 +1,68 @@
+import pygame
+
+from asgard.settings import DISPLAY, SCREEN_WIDTH, SCREEN_HEIGHT, MAX_LEVELS
+from asgard.graphics import Camera, StaticLayer
+from asgard.entities import Box
+from asgard.level import generate_layout, instantiate_layout, level_width
+
+def same_pixels(a, b):
+    return a.get_size() == b.get_size() and pygame.image.tobytes(a, 'RGB') == pygame.image.tobytes(b, 'RGB')
+
+def level_objects(lvl):
+    layout = generate_layout(lvl, 0, level_width(lvl))
+    platforms, boxes, decorations, enemies, door, bg_img = instantiate_layout(layout)
+    return layout, platforms, boxes, decorations, bg_img
+
+def draw_each(size, bg_img, decorations, platforms, boxes):
+    # วาดทีละชิ้นแบบเดิม (ก่อนมี static layer) ไว้เทียบ
+    surf = pygame.Surface(size).convert()
+    for x in range(0, size[0], bg_img.get_width()):
+        surf.blit(bg_img, (x, 0))
+    for obj in decorations + platforms + boxes:
+        obj.render(surf)
+    return surf
+
+def test_layer_matches_drawing_each_piece():
+    DISPLAY.get()
+    for lvl in (1, MAX_LEVELS):
+        layout, platforms, boxes, decorations, bg_img = level_objects(lvl)
+        size = (layout.width, layout.height)
+        layer = StaticLayer(size)
+        layer.set_level(bg_img, decorations, platforms, boxes)
+        expected = draw_each(size, bg_img, decorations, platforms, boxes)
+        assert same_pixels(layer.get_surface(), expected), lvl
+
+        # ส่วนที่กล้องเห็น ทั้งต้นด่านและท้ายด่าน
+        cam = Camera(SCREEN_WIDTH, SCREEN_HEIGHT)
+        cam.set_world(*size)
+        screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        for x in (0, layout.width):
+            cam.follow(pygame.Rect(x, 300, 10, 10))
+            cam.snap()
+            layer.render(screen, cam)
+            region = expected.subsurface((cam.draw_x, cam.draw_y, SCREEN_WIDTH, SCREEN_HEIGHT))
+            assert same_pixels(screen, region), (lvl, x)
+            assert same_pixels(layer.view(cam), region), (lvl, x)
+
+def test_layer_rebuilds_only_when_invalidated(monkeypatch):
+    DISPLAY.get()
+    layout, platforms, boxes, decorations, bg_img = level_objects(1)
+    layer = StaticLayer((layout.width, layout.height))
+    layer.set_level(bg_img, decorations, platforms, boxes)
+    rebuilds = []
+    rebuild = layer.rebuild
+    monkeypatch.setattr(layer, 'rebuild', lambda: rebuilds.append(1) or rebuild())
+    cam = Camera(SCREEN_WIDTH, SCREEN_HEIGHT)
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    for _ in range(5):
+        layer.render(screen, cam)
+    assert len(rebuilds) == 1
+
+    # เพิ่มกล่องแล้ว invalidate -> วาดใหม่ครั้งเดียว ภาพมีกล่องใหม่
+    boxes.append(Box(300, 300))
+    layer.invalidate()
+    for _ in range(5):
+        layer.render(screen, cam)
+    assert len(rebuilds) == 2
+    expected = draw_each((layout.width, layout.height), bg_img, decorations, platforms, boxes)
+    assert same_pixels(layer.get_surface(), expected)
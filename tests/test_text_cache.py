@@ -0,0 +1,44 @@
+import pygame
+
+from asgard.graphics import FONTS, Camera, Fonts, HudText, TextCache, TEXTS
+from asgard.entities import FloatingText
+
+def test_text_cache_reuses_surface_and_evicts_oldest():
+    font = Fonts().get('small')
+    cache = TextCache(max_entries=2)
+    a = cache.render(font, 'a', (255, 255, 255))
+    assert cache.render(font, 'a', (255, 255, 255)) is a
+    cache.render(font, 'b', (255, 255, 255))
+    cache.render(font, 'a', (255, 255, 255))
+    cache.render(font, 'c', (255, 255, 255))
+    assert cache.hits == 2 and cache.misses == 3
+    assert list(k[1] for k in cache.entries) == ['a', 'c']
+
+def test_hud_text_renders_only_when_value_changes():
+    font = Fonts().get('main')
+    hud = HudText(font, (255, 215, 0), "Coins: {}")
+    surf = pygame.Surface((400, 100))
+    misses = TEXTS.misses
+    rect = hud.render(surf, (20, 20), 98765)
+    image = hud.image
+    for _ in range(10):
+        assert hud.render(surf, (20, 20), 98765) == rect
+    assert hud.image is image
+    assert TEXTS.misses == misses + 1
+    assert rect == pygame.Rect((20, 20), font.size("Coins: 98765"))
+    hud.render(surf, (20, 20), 98766)
+    assert hud.image is not image
+
+def test_floating_text_fades_without_changing_the_shared_surface():
+    cam = Camera(400, 100)
+    surf = pygame.Surface((400, 100))
+    texts = [FloatingText(100, 50, "+1 Coin", (255, 215, 0)) for _ in range(3)]
+    texts[0].render(surf, cam)
+    misses = TEXTS.misses
+    shared = TEXTS.render(FONTS.get('small'), "+1 Coin", (255, 215, 0))
+    for t in texts:
+        t.life = 0.25
+        assert t.render(surf, cam)
+    # ทุกตัวใช้ Surface เดียวจาก cache และคืน alpha เดิมหลัง blit
+    assert TEXTS.misses == misses
+    assert shared.get_alpha() == 255
@@ -0,0 +1,34 @@
+from asgard.settings import SIM_DT
+from asgard.entities import Coin, FloatingText, Player
+from asgard.level import SpatialHash
+from asgard.world import NO_INPUT
+
+# ตัวจับเวลาแบบวินาทีต้องหมดใน tick เดียวกับตัวนับเฟรมเดิม (ที่ 60 tick/วินาที)
+def ticks_until(done, step, limit=1000):
+    for n in range(limit):
+        if done(): return n
+        step()
+    return limit
+
+def test_knockback_lasts_ten_ticks():
+    player = Player()
+    grid = SpatialHash()
+    player.take_damage(player.rect.move(10, 0))
+    assert ticks_until(lambda: player.knockback_timer <= 0, lambda: player.move(grid, NO_INPUT)) == 10
+
+def test_invincibility_lasts_ninety_ticks():
+    player = Player()
+    player.take_damage(player.rect.move(10, 0))
+    assert ticks_until(lambda: player.invincible_timer <= 0, lambda: player.update(SIM_DT)) == 90
+
+def test_coin_lives_three_hundred_ticks():
+    coin = Coin(0, 0)
+    grid = SpatialHash()
+    assert ticks_until(lambda: coin.life_span <= 0, lambda: coin.update(grid)) == 300
+
+def test_floating_text_lives_forty_ticks():
+    text = FloatingText(0, 0, "+1")
+    n = 1
+    while not text.update():
+        n += 1
+    assert n == 40
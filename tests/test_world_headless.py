@@ -0,0 +1,42 @@
+from asgard.world import Inputs, NO_INPUT, World
+
+# World.step อย่างเดียว (ไม่มี render เลย) ต้องเดินเกมได้ครบ: หมูตาย->เหรียญ, ประตูเปิด->ด่านถัดไป, ผู้เล่นตาย
+MAX_TICKS = 600
+
+def started_world(seed=0):
+    world = World(seed)
+    world.step(Inputs(start=True))
+    assert world.game_state == "PLAYING"
+    return world
+
+def step_until(world, done, inputs=NO_INPUT):
+    for _ in range(MAX_TICKS):
+        if done(): return True
+        world.step(inputs)
+    return done()
+
+def test_killed_pig_finishes_dying_and_drops_a_coin():
+    world = started_world()
+    player = world.player
+    pig = world.enemies[0]
+    pig.rect.topleft = (player.rect.right + 5, player.rect.y)
+    world.step(Inputs(attack=True))
+    assert pig.is_dying
+    assert step_until(world, lambda: pig not in world.enemies)
+    assert world.coins_list
+
+def test_door_opens_and_player_reaches_next_level():
+    world = started_world()
+    door = world.door_obj
+    world.player.rect.center = door.rect.center
+    world.step(Inputs(enter=True))
+    assert door.state == 'opening'
+    assert step_until(world, lambda: world.cur_level == 2)
+    assert world.game_state == "PLAYING"
+
+def test_player_dies_and_game_is_over():
+    world = started_world()
+    player = world.player
+    player.hp = 1
+    player.take_damage(player.rect.move(10, 0))
+    assert step_until(world, lambda: world.game_state == "GAMEOVER")